@@ -0,0 +1,87 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides the command line bulk import of glossaries, terms and collections into Egeria.
+   The connection comes from EGERIA_PLATFORM_URL, EGERIA_VIEW_SERVER, EGERIA_USER and EGERIA_USER_PASSWORD.
+
+   Example: python import_metadata.py terms vocabulary.csv --glossary <glossary guid>
+
+
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from typing import List, Optional
+
+# Installed as a console script this runs as src.import_metadata, but the modules it uses import
+# each other as top-level packages (services, utils), so their directory must be on sys.path
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from services.metadata_import import BATCH_SIZE, CONCURRENCY, KINDS, ImportProgress, errors_path_for, import_metadata
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="my_egeria_import",
+        description="Stream a CSV or JSONL file of glossaries, terms or collections into Egeria. "
+        "An interrupted import resumes where it stopped when run again.",
+    )
+    parser.add_argument("kind", choices=KINDS, help="what each record creates")
+    parser.add_argument("path", help="CSV (with a header line) or JSONL file")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="file format, when the extension doesn't say")
+    parser.add_argument("--glossary", help="GUID of the glossary for terms without a glossary_guid field")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="records per batch and checkpoint")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY, help="creates in flight at once")
+    parser.add_argument("--checkpoint", help="checkpoint file (default: <path>.checkpoint.json)")
+    parser.add_argument("--errors", help="file for rejected records (default: <path>.errors.jsonl)")
+    parser.add_argument("--restart", action="store_true", help="ignore an earlier checkpoint and start over")
+    return parser
+
+
+def _print_progress(progress: ImportProgress) -> None:
+    print(
+        f"\r{progress.fraction:6.1%}  {progress.rows} rows: {progress.created} created, "
+        f"{progress.invalid} invalid, {progress.failed} failed",
+        end="\n" if progress.done else "",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parser().parse_args(argv)
+    try:
+        progress = asyncio.run(
+            import_metadata(
+                args.path,
+                args.kind,
+                fmt=args.format,
+                glossary_guid=args.glossary,
+                batch_size=args.batch_size,
+                concurrency=args.concurrency,
+                checkpoint_path=args.checkpoint,
+                errors_path=args.errors,
+                restart=args.restart,
+                on_progress=_print_progress,
+            )
+        )
+    except (OSError, ValueError) as e:
+        print(f"Import failed: {e}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        print("\nImport interrupted; run the same command again to resume.", file=sys.stderr)
+        return 130
+    if progress.invalid or progress.failed:
+        print(f"Rejected records are in {args.errors or errors_path_for(args.path)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,12 +9,6 @@
 
 import os
 
-from textual.containers import Container
-
-from .services.glossary_service import GlossaryService
-from utils.config import get_global_config
-from governance_officer_service import GovernanceOfficerService
-
 # Set safe defaults BEFORE importing anything that might import pyegeria
 os.environ.setdefault("EGERIA_USER", "erinoverview")
 os.environ.setdefault("EGERIA_USER_PASSWORD", "secret")
@@ -22,26 +16,17 @@ os.environ.setdefault("EGERIA_VIEW_SERVER", "qs-view-server")
 os.environ.setdefault("EGERIA_PLATFORM_URL", "https://localhost:9443")
 
 from textual.app import App, ComposeResult
+from textual.containers import Container
 from textual.widgets import Footer, Tree
-from screens.login_screen import LoginScreen
-from screens.main_menu import MainMenuScreen
-from screens.glossary.glossary_browser import GlossaryBrowserScreen
-from screens.a_collections.collection_browser import CollectionBrowserScreen
-from screens.a_collections.collection_members_screen import CollectionMemberScreen
-from screens.a_collections.collection_details import CollectionDetailsScreen
-from screens.a_collections.add_collection import AddCollectionScreen
-from screens.a_collections.delete_collection import DeleteCollectionScreen
-from screens.glossary.glossary_list_screen import GlossaryListScreen
-from screens.glossary.term_details import TermDetailsScreen
-from screens.glossary.term_list_screen import TermListScreen
-from screens.GovernanceOfficer.governance_officer_browser import GovernanceOfficerBrowserScreen
-from screens.GovernanceOfficer.add_governance_definition import AddGovernanceDefinitionScreen
-from screens.GovernanceOfficer.delete_governance_definition import DeleteGovernanceDefinitionScreen
-from screens.GovernanceOfficer.marketplace_tree import MarketPlaceTree
-from screens.ProductManager.product_manager_browser import ProductManagerBrowser
-from utils.egeria_client import close_all_managers
-from screens.splash_screen import SplashScreen  # your existing splash screen
-from services.term_service import get_terms_for_glossary
+from utils.config import get_global_config
+from utils.egeria_client import close_all_managers, egeria_tech_class
+from utils.disk_cache import close_disk_cache
+from utils.executor import Priority, run_blocking, shutdown_executor
+from utils.lazy import lazy_screen, load_attr
+from utils.metrics import write_export
+from utils.swr import warm_snapshots
+# Screens and services are imported on first use (see SCREENS), so the splash
+# screen isn't held up by modules the user may never open.
 # from pyegeria import EgeriaTech
 
 
@@ -50,24 +35,33 @@ class MyEgeria(App):
     CSS_PATH = ["./styles/common.css"]
 
     # Only register screens that do NOT need constructor arguments here
+    # Each module is imported when its screen is first pushed (utils.lazy)
     SCREENS = {
-        "splash": SplashScreen,
-        "login": LoginScreen,
-        "main_menu": MainMenuScreen,
-        "glossary_browser": GlossaryBrowserScreen,
-        "glossary_list_screen": GlossaryListScreen,
-        "term_details": TermDetailsScreen,
-        "term_list_screen": TermListScreen,
-        "collection_details": CollectionDetailsScreen,
-        "add_collection": AddCollectionScreen,
-        "collection_members": CollectionMemberScreen,
-        "collection_browser": CollectionBrowserScreen,
-        "delete_collection": DeleteCollectionScreen,
-        "governance_officer_browser": GovernanceOfficerBrowserScreen,
-        "add_governance_definition": AddGovernanceDefinitionScreen,
-        "delete_governance_definition": DeleteGovernanceDefinitionScreen,
-        "marketplace_tree": MarketPlaceTree,
-        "product_manager_browser": ProductManagerBrowser,
+        "splash": lazy_screen("screens.splash_screen:SplashScreen"),
+        "login": lazy_screen("screens.login_screen:LoginScreen"),
+        "main_menu": lazy_screen("screens.main_menu:MainMenuScreen"),
+        "glossary_browser": lazy_screen("screens.glossary.glossary_browser:GlossaryBrowserScreen"),
+        "glossary_list_screen": lazy_screen("screens.glossary.glossary_list_screen:GlossaryListScreen"),
+        "term_details": lazy_screen("screens.glossary.term_details:TermDetailsScreen"),
+        "term_list_screen": lazy_screen("screens.glossary.term_list_screen:TermListScreen"),
+        "collection_details": lazy_screen("screens.a_collections.collection_details:CollectionDetailsScreen"),
+        "add_collection": lazy_screen("screens.a_collections.add_collection:AddCollectionScreen"),
+        "collection_members": lazy_screen("screens.a_collections.collection_members_screen:CollectionMemberScreen"),
+        "collection_browser": lazy_screen("screens.a_collections.collection_browser:CollectionBrowserScreen"),
+        "delete_collection": lazy_screen("screens.a_collections.delete_collection:DeleteCollectionScreen"),
+        "governance_officer_browser": lazy_screen(
+            "screens.GovernanceOfficer.governance_officer_browser:GovernanceOfficerBrowserScreen"
+        ),
+        "add_governance_definition": lazy_screen(
+            "screens.GovernanceOfficer.add_governance_definition:AddGovernanceDefinitionScreen"
+        ),
+        "delete_governance_definition": lazy_screen(
+            "screens.GovernanceOfficer.delete_governance_definition:DeleteGovernanceDefinitionScreen"
+        ),
+        "marketplace_tree": lazy_screen("screens.GovernanceOfficer.marketplace_tree:MarketPlaceTree"),
+        "product_manager_browser": lazy_screen("screens.ProductManager.product_manager_browser:ProductManagerBrowser"),
+        "diagnostics": lazy_screen("screens.diagnostics_screen:DiagnosticsScreen"),
+        "import": lazy_screen("screens.import_screen:ImportScreen"),
         # Details screens require arguments; push them with instances at runtime
         # "term_details": lambda: TermDetailsScreen("<guid>"),
         # "collection_details": lambda: CollectionDetailsScreen("<guid>"),
@@ -83,12 +77,12 @@ class MyEgeria(App):
 
     # handle a message requesting login to egeria to verify user credentials
     async def on_login_screen_egeria_login_requested(self,payload) -> bool:
-        from pyegeria import EgeriaTech
         username = payload["username"]
         password = payload["password"]
         platform_url = payload["platform_url"]
         view_server = payload["view_server"]
         try:
+            EgeriaTech = egeria_tech_class()
             client = EgeriaTech(
                 user_id=username,
                 user_pwd=password,
@@ -109,101 +103,77 @@ class MyEgeria(App):
     # Handle a "login successful" message from LoginScreen
     # Provide a generic hook to go to main menu after login
     async def on_login_screen_login_success(self, _message: object) -> None:
+        # Load rows saved by earlier sessions (EGERIA_DISK_CACHE) while the user picks a screen
+        self.run_worker(
+            run_blocking(warm_snapshots, get_global_config(), priority=Priority.BACKGROUND),
+            group="warm-disk-cache",
+        )
         await self.push_screen("main_menu")
 
     # Convenience helpers for pushing details screens
     async def _show_term_details(self, term_guid: str):
-        await self.push_screen(TermDetailsScreen(term_guid))
+        await self.push_screen(load_attr("screens.glossary.term_details:TermDetailsScreen")(term_guid))
 
     async def _show_term_list(self, glossary_name: str):
+        TermListScreen = load_attr("screens.glossary.term_list_screen:TermListScreen")
         await self.push_screen(TermListScreen(glossary_name = glossary_name))
 
     async def _show_collection_details(self, collection_guid: str):
+        CollectionDetailsScreen = load_attr("screens.a_collections.collection_details:CollectionDetailsScreen")
         await self.push_screen(CollectionDetailsScreen(collection_guid))
 
     async def _show_add_collection(self):
-        await self.push_screen(AddCollectionScreen())
+        await self.push_screen(load_attr("screens.a_collections.add_collection:AddCollectionScreen")())
 
     async def _show_governance_officer_browser(self):
+        GovernanceOfficerBrowserScreen = load_attr(
+            "screens.GovernanceOfficer.governance_officer_browser:GovernanceOfficerBrowserScreen"
+        )
         await self.push_screen(GovernanceOfficerBrowserScreen())
 
     async def on_governance_officer_browser_screen_show_marketplace_tree(self, tree_id):
         #concatenate # to front of tree_id for self.query_one funtion
+        MarketPlaceTree = load_attr("screens.GovernanceOfficer.marketplace_tree:MarketPlaceTree")
         await self.push_screen(MarketPlaceTree(tree_id))
 
-    async def on_governance_officer_browser_build_marketplace_tree(self, collection_guid) -> str:
-        """ Build a tree of the marketplace folders and members for a governance collection
-            in;put is the guid of the collection selected
+    async def on_governance_officer_browser_screen_build_marketplace_tree(self, message) -> str:
+        """ Open the marketplace tree for a governance collection
+            input is the message carrying the guid of the collection selected
             return status """
-        self.collection_guid = collection_guid
+        self.collection_guid = message.selected_guid
+        GovernanceOfficerService = load_attr("services.governance_officer_service:GovernanceOfficerService")
         self.service = GovernanceOfficerService(config=get_global_config())
-        if self.collection_guid:
-            """Find the Root(s) for that selected type and display a tree of them to select from,
-                for further supported governance actions"""
-            root = await self.service.get_collections_by_name(self.collection_guid)
-            root_guid = root.get("GUID", None)
-            root_name = root.get("display_name", None)
-            root_qname = root.get("qualified_name", None)
-            root_desc = root.get("description", None)
-            root_type = root.get("category", None)
-            root_classifications = root.get("classifications", None)
-            root_members = root.get("members", None)
-            if ("marketplace" in root_name.lower()) or ("marketplace" in root_qname.lower()):
-                marketplace_guid = root_guid
-                self.log(f"Found marketplace guid of {marketplace_guid}, {root_name}")
-                #set up Textual Tree structure for display
-                market_tree: Tree =Tree(root_name, data=root_guid, id="marketplace_tree")
-                # now query for all the collection members, probably 2 levels for initial display
-                marketplace_folders = await self.service.get_collections_by_name(marketplace_guid)
-                if marketplace_folders:
-                    for folder in marketplace_folders:
-                        folder_guid = folder.get("GUID", None)
-                        folder_name = folder.get("display_name", None)
-                        folder_qname = folder.get("qualified_name", None)
-                        folder_desc = folder.get("description", None)
-                        folder_type = folder.get("category", None)
-                        folder_classifications = folder.get("classifications", None)
-                        folder_members = folder.get("members", None)
-                        market_tree.root.expand()
-                        if "Folder" in folder_qname:
-                            self.log(f"Found folder guid of {folder_guid}, {folder_name}")
-                            entries = market_tree.root.add(folder_name, data= folder_guid, expasnd = True)
-                            if folder_members:
-                                for member in folder_members:
-                                    member_guid = member.get("GUID", None)
-                                    member_name = member.get("title", None)
-
-                                    #process level 3
-                                    entries.add(member_name, member_guid, expand = True)
-                                    continue
-                            else:
-                                entries.add(f"No members found for {folder_name}")
-                                continue
-                        else:
-                            market_tree.root.add(folder_name, data = folder_guid, expand = True)
-                else:
-                    # marketplace is empty
-                    self.log(f"Marketplace guid {marketplace_guid} is empty")
-                    self.spacer_container = self.query_one("#go_spacer", Container)
-                    market_tree.root.add(f"Marketplace {marketplace_guid} is empty")
-                    return "Marketplace is empty"
-            else:
-                return "No marketplace found"
-        else:
+        if not self.collection_guid:
             # display error and stay on base screen until a different action is selected
             # or a selection is made
             self.log("No definition selected")
-            # await self._refresh_and_focus()
             return "No selection made"
-        #
-        # self.post_message(self.show_marketplace_tree("marketplace_tree"))
-        return "Success"
+        # Only the root is checked here; folders and their members load as the user expands them
+        try:
+            root = await run_blocking(
+                self.service.get_collection, self.collection_guid, platform=self.service.config.platform_url
+            )
+        except Exception as e:
+            self.log(f"Could not load collection {self.collection_guid}: {e}")
+            self.notify(f"Could not load collection: {e}", severity="error")
+            return "Error"
+        root_guid = root.get("GUID", None) or self.collection_guid
+        root_name = root.get("display_name", None) or ""
+        root_qname = root.get("qualified_name", None) or ""
+        if ("marketplace" in root_name.lower()) or ("marketplace" in root_qname.lower()):
+            self.log(f"Found marketplace guid of {root_guid}, {root_name}")
+            MarketPlaceTree = load_attr("screens.GovernanceOfficer.marketplace_tree:MarketPlaceTree")
+            await self.push_screen(MarketPlaceTree(root_guid, root_name, service=self.service))
+            return "Success"
+        self.notify(f"{root_name or root_guid} is not a marketplace", severity="warning")
+        return "No marketplace found"
 
     async def on_glossery_browser_screen_build_glossary_tree(self, glossary_name: str) -> str:
         """ Build a tree of the glossary folders and members for a glossary
             input is the name of the glossary selected
             return status """
         self.glossary_name = glossary_name
+        GlossaryService = load_attr("services.glossary_service:GlossaryService")
         self.service = GlossaryService(config=get_global_config())
         if self.glossary_name:
             """Find the Root(s) for that selected type and display a tree of them to select from,
@@ -269,8 +239,17 @@ class MyEgeria(App):
 
 
     async def on_shutdown(self) -> None:
+        # EGERIA_METRICS_EXPORT=<file>: save this session's call metrics (.prom for Prometheus text, else JSON)
+        export_path = os.getenv("EGERIA_METRICS_EXPORT")
+        if export_path:
+            try:
+                write_export(export_path)
+            except Exception as e:
+                self.log(f"Could not export metrics to {export_path}: {e}")
         try:
             close_all_managers()
+            close_disk_cache()
+            shutdown_executor()
         except Exception:
             pass
 
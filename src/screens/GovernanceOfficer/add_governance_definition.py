@@ -18,6 +18,7 @@ from textual.widgets import Static, Input, Button, Pretty, OptionList, Footer, H
 # from .governance_officer_browser import GovernanceOfficerBrowserScreen
 from ..base_screen import BaseScreen
 from services.governance_officer_service import GovernanceOfficerService
+from utils.executor import run_blocking
 from typing import Dict, Any
 from utils.config import EgeriaConfig
 
@@ -289,7 +290,9 @@ class AddGovernanceDefinitionScreen(BaseScreen):
             # Fire-and-forget background create; do NOT block this screen.
             async def _create_and_notify():
                 try:
-                    created = await asyncio.to_thread(GovernanceOfficerService.create_governance_definition, payload)
+                    created = await run_blocking(
+                        GovernanceOfficerService().create_governance_definition, payload, platform=self.cfg.platform_url
+                    )
                 except Exception:
                     created = None
                 # Notify the parent screen (even on failure; parent may decide how to react)
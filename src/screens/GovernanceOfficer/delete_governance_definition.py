@@ -11,6 +11,7 @@ from textual.messages import Message
 from typing import Dict, Any
 from screens.base_screen import BaseScreen
 from services.governance_officer_service import GovernanceOfficerService
+from utils.executor import run_blocking
 from textual.containers import Container, Vertical, Horizontal
 from textual.widgets import Static, Button
 import asyncio
@@ -125,7 +126,9 @@ class DeleteGovernanceDefinitionScreen(BaseScreen,):
                 # try:
                 #     deleted = self.service.delete_governance_definition, payload
                 try:
-                    deleted = await asyncio.to_thread(self.service.delete_governance_definition(payload), self.gdGUID)
+                    deleted = await run_blocking(
+                        self.service.delete_governance_definition, payload, platform=self.cfg.platform_url
+                    )
                 except Exception:
                     deleted = None
                 # Notify the parent screen (even on failure; parent may decide how to react)
@@ -8,16 +8,19 @@ This module provides the main Screen for the Governance Officer related function
 
 """
 from textual.message import Message
-from textual.widgets import DataTable
 from textual.widgets import Button, Input, Static, Tree
 from textual.containers import Container, Vertical, Horizontal, ScrollableContainer
 from ..base_screen import BaseScreen
+from widgets.virtual_table import VirtualTable
 from services.governance_officer_service import GovernanceOfficerService
+from services.projections import GOVERNANCE_DEFINITION_COLUMNS
 from .add_governance_definition import AddGovernanceDefinitionScreen
 from .delete_governance_definition import DeleteGovernanceDefinitionScreen
 import asyncio
+from contextlib import aclosing
 from textual import on
 from utils.config import EgeriaConfig, get_global_config
+from utils.swr import snapshot_key
 
 class GovernanceOfficerBrowserScreen(BaseScreen):
     CSS_PATH = ["../../styles/common.css", "../../styles/governance_officer_browser.css"]
@@ -28,6 +31,10 @@ class GovernanceOfficerBrowserScreen(BaseScreen):
         ("escape", "back", "Back"),
     ]
 
+    SEARCH_INPUT_ID = "gd-search-input"
+    # Fields requested from the server for the table
+    COLUMNS = GOVERNANCE_DEFINITION_COLUMNS
+
     class build_marketplace_tree(Message):
         def __init__(self, selected_guid):
             super().__init__()
@@ -41,7 +48,7 @@ class GovernanceOfficerBrowserScreen(BaseScreen):
             ScrollableContainer(
                 Vertical(
                     Static("Governance Officer - Governance Definitions", id="go_title"),
-                    DataTable(id="governance-officer-table"),
+                    VirtualTable(id="governance-officer-table"),
                     id="go_top_content",
                 ),
                 id="go_top_row",
@@ -97,7 +104,7 @@ class GovernanceOfficerBrowserScreen(BaseScreen):
         title.styles.margin = (0, 0, 1, 0)
 
         # Table fills remaining space within top_row
-        self.table = self.query_one("#governance-officer-table", DataTable)
+        self.table = self.query_one("#governance-officer-table", VirtualTable)
         self.table.styles.height = "100%"
         self.table.styles.min_height = 8
         self.table.cursor_type = "row"
@@ -160,7 +167,7 @@ class GovernanceOfficerBrowserScreen(BaseScreen):
         # self.set_focus(self.table)
 
     # # Defensive row highlight/selection handlers
-    # async def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted):
+    # async def on_virtual_table_row_highlighted(self, event: VirtualTable.RowHighlighted):
     #     """
     #     Textual may emit RowHighlighted with a None/invalid row_key during updates.
     #     Guard get_row with a try/except to avoid crashes.
@@ -172,7 +179,7 @@ class GovernanceOfficerBrowserScreen(BaseScreen):
     #     if row_data:
     #         self.last_selected_guid = row_data[0] or ""
 
-    async def on_data_table_row_selected(self, event: DataTable.RowSelected):
+    async def on_virtual_table_row_selected(self, event: VirtualTable.RowSelected):
         try:
             row_data = self.table.get_row(event.row_key)
         except Exception:
@@ -209,6 +216,15 @@ class GovernanceOfficerBrowserScreen(BaseScreen):
         self._del_open = True
         await self.app.push_screen(DeleteGovernanceDefinitionScreen(self.last_selected_guid))
 
+    @on(Button.Pressed, "#gd-search-button")
+    async def handle_search_button(self, event: Button.Pressed) -> None:
+        await self.run_search(self.query_one("#gd-search-input", Input).value.strip())
+
+    async def run_search(self, query: str) -> None:
+        """Narrow the loaded definitions locally; only a wider search goes back to the server."""
+        if not self.filter_loaded_rows(self.table, query):
+            await self.load_governance_officer_definitions(search=query)
+
     @on(Button.Pressed, "#back-button")
     async def handle_back_button(self, event: Button.Pressed) -> None:
         """Go back to the previous screen."""
@@ -237,8 +253,8 @@ class GovernanceOfficerBrowserScreen(BaseScreen):
                 pass
 
     # Helper defined BEFORE handlers that call it to avoid "unresolved reference" warnings
-    async def _refresh_and_focus(self):
-        await self.load_governance_officer_definitions()
+    async def _refresh_and_focus(self, refresh: bool = False):
+        await self.load_governance_officer_definitions(refresh=refresh)
         try:
             if self.table.row_count > 0:
                 try:
@@ -268,27 +284,19 @@ class GovernanceOfficerBrowserScreen(BaseScreen):
         """
         Hotkey handler for 'r' to reload collections.
         """
-        await self._refresh_and_focus()
-
-    async def load_governance_officer_definitions(self, search: str = ""):
-        self.table.clear()
-        try:
-            collections = await asyncio.to_thread(self.service.find_governance_definitions, search or "*")
-            self.log(f"Found {len(collections)} collections")
-            self.log(f"Collections: {collections}")
-            if collections:
-                for c in collections:
-                    guid = c.get("GUID", "")
-                    display_name = c.get("Display Name", "")
-                    qname = c.get("Qualified Name", "")
-                    category = c.get("category", "")
-                    desc = c.get("Description", "")
-                    type_name = c.get("Type Name", "")
-                    self.table.add_row(guid, display_name, category, type_name, qname, desc)
-            else:
-                self.table.add_row("", "No results found", "", "")
-        except Exception as e:
-            self.table.add_row("", f"Error: {e}", "", "")
+        await self._refresh_and_focus(refresh=True)
+
+    async def load_governance_officer_definitions(self, search: str = "", refresh: bool = False):
+        # Paint the last known definitions at once and revalidate in the background
+        key = snapshot_key("governance_definitions", self.cfg, search or "*")
+        loaded = await self.run_load(
+            self.table.id,
+            self.load_rows_swr(
+                self.table, key, lambda: self._fetch_definition_rows(search, refresh), search=search
+            ),
+        )
+        if not loaded:
+            return
         self.last_selected_guid = ""
         # try:
         #     if self.table.row_count > 0:
@@ -299,3 +307,16 @@ class GovernanceOfficerBrowserScreen(BaseScreen):
         #     self.set_focus(self.table)
         # except Exception:
         #     pass
+
+    async def _fetch_definition_rows(self, search: str = "", refresh: bool = False):
+        # Pages stream in from the server; the next one is prefetched while this one renders
+        pages = self.service.iter_governance_definitions(
+            search or "*", use_cache=not refresh, columns=self.COLUMNS
+        )
+        async with aclosing(pages):
+            async for definitions in pages:
+                self.log(f"Found {len(definitions)} collections")
+                yield [
+                    (d.guid, d.display_name, d.category, d.type_name, d.qualified_name, d.description)
+                    for d in definitions
+                ]
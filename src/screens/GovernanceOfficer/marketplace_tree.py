@@ -6,10 +6,34 @@ This module provides the main Screen for the Governance Officer related function
 
 
 """
+from typing import Any, Dict, List, Optional
+
+from ..a_collections.collection_members_screen import CollectionMemberScreen
 from ..base_screen import BaseScreen
 from textual.widgets import Button, Tree, Static, Input
 from textual import on
-from textual.containers import Container, Horizontal
+from textual.containers import Container, Horizontal, Vertical
+from services.governance_officer_service import GovernanceOfficerService
+from widgets.lazy_tree import LazyNode, LazyTree, LazyTreeSource, subtree_cache
+
+# Loaded marketplace subtrees, shared by every MarketPlaceTree screen and kept for EGERIA_TREE_TTL_SECONDS
+_SUBTREES = subtree_cache()
+
+
+def member_node(member: Dict[str, Any]) -> LazyNode:
+    """Map a collection member to a tree node; nested collections (folders) can be expanded."""
+    guid = member.get("GUID", "") or member.get("guid", "")
+    label = (
+        member.get("display_name", "")
+        or member.get("displayName", "")
+        or member.get("title", "")
+        or guid
+    )
+    type_name = member.get("type_name", "") or member.get("typeName", "") or ""
+    qname = member.get("qualified_name", "") or member.get("qualifiedName", "") or ""
+    expandable = "Collection" in type_name or "Folder" in qname or bool(member.get("members"))
+    return LazyNode(guid, label, expandable=expandable and bool(guid))
+
 
 class MarketPlaceTree(BaseScreen):
     """Screen showing a Data Product MarketPlace in a Tree structure"""
@@ -22,53 +46,86 @@ class MarketPlaceTree(BaseScreen):
         ("escape", "back", "Back"),
     ]
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        root_guid: str = "",
+        root_name: str = "Marketplace",
+        service: Optional[GovernanceOfficerService] = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
+        self.root_guid = root_guid
+        self.root_name = root_name or root_guid
+        self.service = service or GovernanceOfficerService(config=self.cfg)
+        self.market_tree_node_selected = None
+        # Children are fetched only when a node is expanded
+        self.source = LazyTreeSource(
+            self._fetch_members, cache=_SUBTREES, namespace=self.cfg, platform=self.cfg.platform_url
+        )
+
+    def _fetch_members(self, collection_guid: str) -> List[LazyNode]:
+        return [member_node(m) for m in self.service.get_collection_members(collection_guid)]
 
     def compose(self):
-        self.m_tree = self.query_one("marketplace_tree", Tree)
         yield from super().compose()
-        # Simple vertical layout: top (list), search (fixed 5 rows), spacer, bottom (buttons)
-        Static("Governance Officer - Data Product MarketPlace", id="go_title"),
-        yield Container(self.m_tree, id="marketplace_tree_container")
-        # Search (fixed 5 rows)
-        Container(
-            Horizontal(
-                Input(placeholder="Search Tree...", id="pt-search-input", disabled=True),
-                Button("Search", id="pt-search-button", disabled=True),
-                id="mt_search_row",
+        yield Vertical(
+            Static("Governance Officer - Data Product MarketPlace", id="go_title"),
+            Container(
+                LazyTree(self.root_name, self.source, self.root_guid, id="marketplace_tree"),
+                id="marketplace_tree_container",
             ),
-            id="mt_search_row_container",
-        ),
-        # Flexible spacer to push buttons to bottom
-        Container(id="mt_spacer"),
-        # Bottom: action buttons
-        Container(
-            Horizontal(
-                Button("Select Definition", id="pt-select-button"),
-                Button("Back", id="back-button"),
-                id="mt_action_row",
+            # Search (fixed 5 rows)
+            Container(
+                Horizontal(
+                    Input(placeholder="Search Tree...", id="mt-search-input", disabled=True),
+                    Button("Search", id="mt-search-button", disabled=True),
+                    id="mt_search_row",
+                ),
+                id="mt_search_row_container",
             ),
-            id="mt_action_row_container",
-        ),
-        id = "mt_root",
+            # Flexible spacer to push buttons to bottom
+            Container(id="mt_spacer"),
+            # Bottom: action buttons
+            Container(
+                Horizontal(
+                    Button("Select Definition", id="mt-select-button"),
+                    Button("Back", id="back-button"),
+                    id="mt_action_row",
+                ),
+                id="mt_action_row_container",
+            ),
+            id="mt_root",
+        )
+
+    async def on_mount(self):
+        await super().on_mount()
+        self.market_tree = self.query_one("#marketplace_tree", LazyTree)
+        if not self.root_guid:
+            self.market_tree.root.add_leaf("No marketplace selected")
+            return
+        # Only the first level is fetched; deeper levels load on expand
+        self.market_tree.root.expand()
+        self.set_focus(self.market_tree)
 
-    def action_refresh(self, event):
-        self.market_tree.refresh(layout=True)
+    async def action_refresh(self):
+        if self.root_guid:
+            await self.market_tree.reload()
 
     def action_back(self) -> None:
         self.app.pop_screen()
 
-    @on (Button.Pressed, "#mt-select-button")
+    @on(Button.Pressed, "#back-button")
+    def process_back_button(self, event: Button.Pressed) -> None:
+        self.app.pop_screen()
+
+    @on(Button.Pressed, "#mt-select-button")
     def process_select_button(self, event: Button.Pressed) -> None:
         # check which tree element selected and then take that element and expand ina new tree
         self.log(f"Processing Selection: {self.market_tree_node_selected} of {self.market_tree}")
-        # self.market_tree.expand(self.market_tree_node_selected)
-        self.app.push_screen("collection_members_screen", self.market_tree_node_selected)
-
-    def on_tree_node_selected(self, market_tree, market_tree_node_selected):
-        self.market_tree = market_tree
-        self.market_tree_node_selected = market_tree_node_selected
-        self.log(f"Selected node: {market_tree_node_selected} of {market_tree}")
-        # self.market_tree.expand(market_tree_node_selected)
+        if self.market_tree_node_selected is not None:
+            # Node data is the selected collection's GUID
+            self.app.push_screen(CollectionMemberScreen(collection_guid=self.market_tree_node_selected))
 
+    def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
+        self.market_tree_node_selected = event.node.data
+        self.log(f"Selected node: {event.node.label} ({event.node.data})")
@@ -16,6 +16,7 @@ from textual.widgets import Static, Input, Button
 # from .collection_browser import CollectionBrowserScreen
 from screens.base_screen import BaseScreen
 from services.collection_service import CollectionService
+from utils.executor import run_blocking
 from typing import Dict, Any
 
 def parse_kv_pairs(text: str) -> Dict[str, Any]:
@@ -170,7 +171,7 @@ class AddCollectionScreen(BaseScreen):
             # Fire-and-forget background create; do NOT block this screen.
             async def _create_and_notify():
                 try:
-                    created = await asyncio.to_thread(self.service.add_collection, payload)
+                    created = await run_blocking(self.service.add_collection, payload, platform=self.cfg.platform_url)
                 except Exception:
                     created = None
                 # Notify the parent screen (even on failure; parent may decide how to react)
@@ -8,15 +8,19 @@ This module provides services for the Collections related functions of my_egeria
 
 """
 
-from textual.widgets import DataTable
 from textual.widgets import Button, Input, Static
 from textual.containers import Container, Vertical, Horizontal
 # from textual.geometry import Coordinate  # remove unused/unsupported import
 from ..base_screen import BaseScreen
+from widgets.virtual_table import VirtualTable
 from services.collection_service import CollectionService
+from services.projections import COLLECTION_COLUMNS
+from services.records import CollectionRecord
 from .add_collection import AddCollectionScreen
 from .delete_collection import DeleteCollectionScreen
+from utils.swr import snapshot_key
 import asyncio
+from contextlib import aclosing
 from textual import on
 
 class CollectionBrowserScreen(BaseScreen):
@@ -28,6 +32,8 @@ class CollectionBrowserScreen(BaseScreen):
         ("escape", "back", "Back"),
     ]
 
+    # Fields requested from the server for the table
+    COLUMNS = COLLECTION_COLUMNS
 
     def compose(self):
         yield from super().compose()
@@ -37,7 +43,7 @@ class CollectionBrowserScreen(BaseScreen):
             Container(
                 Vertical(
                     Static("Collections", id="c_title"),
-                    DataTable(id="collection-table"),
+                    VirtualTable(id="collection-table"),
                     id="c_top_content",
                 ),
                 id="c_top_row",
@@ -91,7 +97,7 @@ class CollectionBrowserScreen(BaseScreen):
         title.styles.margin = (0, 0, 1, 0)
 
         # Table fills remaining space within top_row
-        self.table = self.query_one("#collection-table", DataTable)
+        self.table = self.query_one("#collection-table", VirtualTable)
         self.table.styles.height = "100%"
         self.table.styles.min_height = 8
         self.table.cursor_type = "row"
@@ -141,7 +147,7 @@ class CollectionBrowserScreen(BaseScreen):
             pass
 
     # Defensive row highlight/selection handlers
-    async def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted):
+    async def on_virtual_table_row_highlighted(self, event: VirtualTable.RowHighlighted):
         """
         Textual may emit RowHighlighted with a None/invalid row_key during updates.
         Guard get_row with a try/except to avoid crashes.
@@ -153,7 +159,7 @@ class CollectionBrowserScreen(BaseScreen):
         if row_data:
             self.last_selected_guid = row_data[0] or ""
 
-    async def on_data_table_row_selected(self, event: DataTable.RowSelected):
+    async def on_virtual_table_row_selected(self, event: VirtualTable.RowSelected):
         try:
             row_data = self.table.get_row(event.row_key)
         except Exception:
@@ -177,6 +183,15 @@ class CollectionBrowserScreen(BaseScreen):
         self._del_open = True
         await self.app.push_screen(DeleteCollectionScreen(self.last_selected_guid))
 
+    @on(Button.Pressed, "#search-button")
+    async def handle_search_button(self, event: Button.Pressed) -> None:
+        await self.run_search(self.query_one("#search-input", Input).value.strip())
+
+    async def run_search(self, query: str) -> None:
+        """Narrow the loaded collections locally; only a wider search goes back to the server."""
+        if not self.filter_loaded_rows(self.table, query):
+            await self.load_collections(search=query, focus=False)
+
     @on(Button.Pressed, "#back-button")
     async def handle_back_button(self, event: Button.Pressed) -> None:
         """Go back to the previous screen."""
@@ -205,8 +220,8 @@ class CollectionBrowserScreen(BaseScreen):
                 pass
 
     # Helper defined BEFORE handlers that call it to avoid "unresolved reference" warnings
-    async def _refresh_and_focus(self):
-        await self.load_collections()
+    async def _refresh_and_focus(self, refresh: bool = False):
+        await self.load_collections(refresh=refresh)
         try:
             if self.table.row_count > 0:
                 try:
@@ -236,43 +251,27 @@ class CollectionBrowserScreen(BaseScreen):
         """
         Hotkey handler for 'r' to reload collections.
         """
-        await self._refresh_and_focus()
+        await self._refresh_and_focus(refresh=True)
 
-    async def load_collections(self, search: str = ""):
-        self.table.clear()
-        try:
-            collections = await asyncio.to_thread(self.service.list_collections, search or "*")
-            if collections:
-                for c in collections:
-                    guid = (
-                        c.get("GUID", "")
-                        or c.get("guid", "")
-                        or c.get("Id", "")
-                        or c.get("ID", "")
-                    )
-                    display = (
-                        c.get("display_name", "")
-                        or c.get("displayName", "")
-                        or c.get("Display Name", "")
-                        or c.get("name", "")
-                        or c.get("Name", "")
-                    )
-                    qname = (
-                        c.get("qualified_name", "")
-                        or c.get("qualifiedName", "")
-                        or c.get("Qualified Name", "")
-                    )
-                    desc = (
-                        c.get("description", "")
-                        or c.get("summary", "")
-                        or c.get("Description", "")
-                    )
-                    self.table.add_row(guid, display, qname, desc)
-            else:
-                self.table.add_row("", "No results found", "", "")
-        except Exception as e:
-            self.table.add_row("", f"Error: {e}", "", "")
+    async def load_collections(self, search: str = "", refresh: bool = False, focus: bool = True):
+        """
+        Show the last known collections for this search at once, then revalidate in the background.
+        refresh=True bypasses the service response cache; focus=False leaves focus where it is
+        (e.g. in the search box while typing).
+        """
+        key = snapshot_key("collections", self.cfg, search or "*")
+        loaded = await self.run_load(
+            self.table.id,
+            self.load_rows_swr(
+                self.table, key, lambda: self._fetch_collection_rows(search, refresh), search=search
+            ),
+        )
+        if not loaded:
+            # A newer search or refresh replaced this one; it handles cursor and focus
+            return
         self.last_selected_guid = ""
+        if not focus:
+            return
         try:
             if self.table.row_count > 0:
                 try:
@@ -282,3 +281,13 @@ class CollectionBrowserScreen(BaseScreen):
             self.set_focus(self.table)
         except Exception:
             pass
+
+    async def _fetch_collection_rows(self, search: str = "", refresh: bool = False):
+        # Pages stream in from the server; the next one is prefetched while this one renders
+        async with aclosing(self.service.iter_collections(search or "*", use_cache=not refresh, columns=self.COLUMNS)) as pages:
+            async for page in pages:
+                yield [self._collection_row(c) for c in page]
+
+    @staticmethod
+    def _collection_row(c: CollectionRecord):
+        return (c.guid, c.display_name, c.qualified_name, c.description)
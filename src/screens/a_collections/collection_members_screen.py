@@ -23,8 +23,11 @@ from ..base_screen import BaseScreen
 class CollectionMemberScreen(BaseScreen):
     """Screen to display glossary terms from Egeria."""
 
-    def __init__(self, **kwargs):
+    CSS_PATH = ["../../styles/common.css"]
+
+    def __init__(self, collection_guid: str = "", **kwargs):
         super().__init__(**kwargs)
+        self.collection_guid = collection_guid
         self.table = DataTable()
 
     def compose(self) -> ComposeResult:
@@ -40,6 +43,9 @@ class CollectionMemberScreen(BaseScreen):
     def load_members(self) -> None:
         """Fetch and display collection members."""
         self.table.clear()
+        if not self.collection_guid:
+            self.table.add_row("No collection selected", "")
+            return
         try:
             self.asset_mgr = CollectionService(
                 # view_server=os.getenv("EGERIA_SERVER", "myserver"),
@@ -48,7 +54,7 @@ class CollectionMemberScreen(BaseScreen):
                 # user_pwd=os.getenv("EGERIA_USER_PASSWORD", ""),
             )
             # token = self.asset_mgr.get_token()
-            collection_members = self.asset_mgr.get_collection_members() or []
+            collection_members = self.asset_mgr.get_collection_members(self.collection_guid) or []
             # self.asset_mgr.close_session()
 
             if not collection_members:
@@ -15,6 +15,7 @@ from textual.containers import Container, Vertical, Horizontal
 from textual.widgets import Static, Button
 from ..base_screen import BaseScreen
 from services.collection_service import CollectionService
+from utils.executor import run_blocking
 from typing import Dict, Any
 
 def parse_kv_pairs(text: str) -> Dict[str, Any]:
@@ -136,7 +137,9 @@ class DeleteCollectionScreen(BaseScreen):
                 # try:
                 #     deleted = self.service.delete_collection, payload
                 try:
-                    deleted = await asyncio.to_thread(self.service.delete_collection, self.guid2delete)
+                    deleted = await run_blocking(
+                        self.service.delete_collection, self.guid2delete, platform=self.cfg.platform_url
+                    )
                 except Exception:
                     deleted = None
                 # Notify the parent screen (even on failure; parent may decide how to react)
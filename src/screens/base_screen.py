@@ -8,13 +8,23 @@ This module provides services for the Screen related functions of my_egeria modu
 
 """
 
+import asyncio
+import os
+from contextlib import aclosing
+from functools import partial
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
 from textual.screen import Screen
-from textual.widgets import Header, Footer, Static
+from textual.timer import Timer
+from textual.widgets import DataTable, Header, Footer, Input, Static
 from textual.app import ComposeResult
 from textual import on
 from textual.containers import Container
 from utils.config import get_global_config
-from utils.egeria_client import EgeriaTechClientManager
+from utils.egeria_client import PooledClientManager
+from utils.local_search import LoadedRows
+from utils.swr import keyed_rows, load_snapshot, plan_row_patch, remember_rows
+from widgets.virtual_table import VirtualTable
 from con_services.egeria_connection import EgeriaConnectionService
 
 class BaseScreen(Screen):
@@ -27,12 +37,23 @@ class BaseScreen(Screen):
         ("q", "quit_app", "Quit"),
     ]
 
+    # Search-as-you-type: typing in SEARCH_INPUT_ID runs run_search() once input pauses
+    SEARCH_INPUT_ID = "search-input"
+    SEARCH_AS_YOU_TYPE = os.getenv("EGERIA_SEARCH_AS_YOU_TYPE", "1").lower() not in ("0", "false", "no")
+    SEARCH_DEBOUNCE_SECONDS = float(os.getenv("EGERIA_SEARCH_DEBOUNCE_MS", "300")) / 1000
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Use centralized config (set at login)
         self.cfg = get_global_config()
-        self.manager = EgeriaTechClientManager(self.cfg)
+        self.manager = PooledClientManager(self.cfg)
         self._is_connected = False
+        # Current load per channel (usually a table id) and how many loads each channel has started
+        self._loads: Dict[str, asyncio.Task] = {}
+        self._load_generations: Dict[str, int] = {}
+        # Complete result set last loaded per table, for answering searches locally
+        self._loaded: Dict[str, LoadedRows] = {}
+        self._search_timer: Optional[Timer] = None
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -76,6 +97,206 @@ class BaseScreen(Screen):
         def _exit_app(_):
             self.app.exit()
 
+    # ------------- superseded loads -------------
+
+    async def run_load(self, channel: str, work: Awaitable[Any]) -> bool:
+        """
+        Run `work` as the current load for `channel` (usually the id of the table it fills).
+        Starting a load cancels the one before it, along with its background revalidation,
+        so a superseded load stops fetching pages and never writes to the table.
+        Returns False if this load was itself superseded before finishing.
+        """
+        generation = self._load_generations.get(channel, 0) + 1
+        self._load_generations[channel] = generation
+        # Until this load completes the table no longer holds a known result set
+        self._loaded.pop(channel, None)
+        previous = self._loads.get(channel)
+        if previous is not None and not previous.done():
+            previous.cancel()
+        self.workers.cancel_group(self, f"swr-{channel}")
+        task = asyncio.ensure_future(work)
+        self._loads[channel] = task
+        try:
+            await task
+        except asyncio.CancelledError:
+            if task.cancelled() and not self.is_current_load(channel, generation):
+                return False
+            raise
+        finally:
+            if self._loads.get(channel) is task:
+                del self._loads[channel]
+        return self.is_current_load(channel, generation)
+
+    def load_generation(self, channel: str) -> int:
+        return self._load_generations.get(channel, 0)
+
+    def is_current_load(self, channel: str, generation: int) -> bool:
+        """True while no newer load has been started on `channel`."""
+        return self._load_generations.get(channel, 0) == generation
+
+    # ------------- search-as-you-type -------------
+
+    @on(Input.Changed)
+    def _debounce_search(self, event: Input.Changed) -> None:
+        if not self.SEARCH_AS_YOU_TYPE or event.input.id != self.SEARCH_INPUT_ID:
+            return
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        self._search_timer = self.set_timer(
+            self.SEARCH_DEBOUNCE_SECONDS, partial(self.run_search, event.value.strip())
+        )
+
+    @on(Input.Submitted)
+    async def _submit_search(self, event: Input.Submitted) -> None:
+        if event.input.id != self.SEARCH_INPUT_ID:
+            return
+        if self._search_timer is not None:
+            self._search_timer.stop()
+        await self.run_search(event.value.strip())
+
+    async def run_search(self, query: str) -> None:
+        """Show results for `query`; screens with a search box override this."""
+
+    def remember_loaded_rows(
+        self, table: DataTable | VirtualTable, search: Optional[str], rows: Sequence[Tuple[Any, ...]]
+    ) -> None:
+        """Record the complete result set `table` now shows for the server search `search`."""
+        self._loaded[table.id] = LoadedRows(search, rows)
+
+    def filter_loaded_rows(
+        self, table: DataTable | VirtualTable, query: str, empty_message: str = "No matches"
+    ) -> bool:
+        """
+        Answer `query` from the rows already loaded into `table`, without a server
+        request. Returns False when the loaded set can't answer it (nothing loaded,
+        a load in progress, or a query wider than the loaded search).
+        """
+        loaded = self._loaded.get(table.id)
+        if loaded is None or not loaded.covers(query):
+            return False
+        rows = loaded.filter(query)
+        self.sync_table_rows(table, rows or [self._message_row(table, empty_message)])
+        return True
+
+    # ------------- stale-while-revalidate table loading -------------
+
+    async def load_rows_swr(
+        self,
+        table: DataTable | VirtualTable,
+        key: Hashable,
+        fetch_rows: Callable[
+            [], Union[Awaitable[Sequence[Tuple[Any, ...]]], AsyncIterable[Sequence[Tuple[Any, ...]]]]
+        ],
+        *,
+        empty_message: str = "No results found",
+        search: Optional[str] = None,
+    ) -> None:
+        """
+        Paint the last known rows for `key` at once, then revalidate in a background
+        worker and apply only the differences. On a first visit (no snapshot) the
+        fetch is awaited so callers still see a populated table when this returns.
+
+        `fetch_rows` returns either all rows or an async iterable of pages; on a
+        first visit pages are shown as they arrive. Pass the server `search` to let
+        run_search() filter the fetched rows locally once they are all in.
+        """
+        generation = self.load_generation(table.id)
+        stale = await load_snapshot(key)
+        if stale is None:
+            await self._revalidate_rows(table, key, fetch_rows, empty_message, False, generation, search)
+            return
+        self.sync_table_rows(table, stale)
+        self.run_worker(
+            self._revalidate_rows(table, key, fetch_rows, empty_message, True, generation, search),
+            group=f"swr-{table.id}",
+            exclusive=True,
+        )
+
+    async def _revalidate_rows(
+        self, table, key, fetch_rows, empty_message: str, has_stale: bool, generation: int, search: Optional[str]
+    ) -> None:
+        def current() -> bool:
+            # A newer load owns the table now; whatever this one fetched is dropped
+            return self.is_current_load(table.id, generation)
+
+        rows: List[Tuple[Any, ...]] = []
+        streamed = False
+        try:
+            source = fetch_rows()
+            if hasattr(source, "__aiter__"):
+                seen: Dict[str, int] = {}
+                # Closed on cancellation too, so a pending page prefetch is cancelled with it
+                async with aclosing(source) as pages:
+                    async for page in pages:
+                        if not current():
+                            return
+                        if not has_stale:
+                            # Nothing on screen yet: append each page as soon as it lands
+                            if not streamed:
+                                table.clear()
+                                streamed = True
+                            self._append_table_rows(table, keyed_rows(page, start=len(rows), seen=seen))
+                        rows.extend(page)
+            else:
+                rows = list(await source)
+        except Exception as e:
+            if not current():
+                return
+            if has_stale:
+                # Keep showing the last known rows; just say the refresh failed
+                self.notify(f"Refresh failed: {e}", severity="warning")
+            elif rows:
+                self.notify(f"Loading stopped early: {e}", severity="warning")
+            else:
+                self.sync_table_rows(table, [self._message_row(table, f"Error: {e}")])
+            return
+        if not current():
+            return
+        remember_rows(key, rows)
+        if search is not None:
+            self.remember_loaded_rows(table, search, rows)
+        if streamed and rows:
+            return  # every page is already on screen
+        self.sync_table_rows(table, rows or [self._message_row(table, empty_message)])
+
+    @staticmethod
+    def _message_row(table: DataTable | VirtualTable, message: str) -> Tuple[str, ...]:
+        width = max(2, len(table.columns))
+        return ("", message) + ("",) * (width - 2)
+
+    def sync_table_rows(self, table: DataTable | VirtualTable, rows: Sequence[Tuple[Any, ...]]) -> None:
+        """Bring `table` in line with `rows`, keyed by the GUID in the first column, touching only what changed."""
+        new = keyed_rows(rows)
+        if isinstance(table, VirtualTable):
+            current: List[Tuple[str, Tuple[Any, ...]]] = table.keyed_rows()
+            new = [(row_key, table.normalize_row(row)) for row_key, row in new]
+        else:
+            current = [(str(r.key.value), tuple(table.get_row(r.key))) for r in table.ordered_rows]
+        patch = plan_row_patch(current, new)
+        if patch.rebuild:
+            table.clear()
+            self._append_table_rows(table, new)
+            return
+        columns = list(range(len(table.columns))) if isinstance(table, VirtualTable) else list(table.columns.keys())
+        if isinstance(table, VirtualTable):
+            table.remove_rows(patch.removed)
+        else:
+            for row_key in patch.removed:
+                table.remove_row(row_key)
+        for row_key, idx, value in patch.updated:
+            table.update_cell(row_key, columns[idx], value)
+        for row_key, row in patch.added:
+            table.add_row(*row, key=row_key)
+
+    @staticmethod
+    def _append_table_rows(table: DataTable | VirtualTable, rows: Sequence[Tuple[str, Tuple[Any, ...]]]) -> None:
+        """Append (row key, cells) pairs, as keyed_rows() gives them, below the rows `table` holds."""
+        if isinstance(table, VirtualTable):
+            table.add_rows([row for _, row in rows], keys=[row_key for row_key, _ in rows])
+            return
+        for row_key, row in rows:
+            table.add_row(*row, key=row_key)
+
     def action_refresh_data(self) -> None:
         """Refresh data for the screen."""
         self.refresh()
@@ -0,0 +1,171 @@
+# python
+
+"""PDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+This module provides the Diagnostics Screen (Egeria call metrics) of my_egeria module.
+
+
+"""
+
+import os
+from datetime import datetime
+
+from textual import on
+from textual.containers import Container, Horizontal, Vertical
+from textual.widgets import Button, Static
+
+from screens.base_screen import BaseScreen
+from utils.executor import run_blocking
+from utils.metrics import CALL_METRICS, metrics_snapshot, write_export
+from widgets.virtual_table import VirtualTable
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f}"
+
+
+class DiagnosticsScreen(BaseScreen):
+    """Per-method latency, payload, retry and cache metrics of Egeria calls, slowest total first."""
+
+    CSS_PATH = ["../styles/common.css"]
+    BINDINGS = [
+        ("r", "refresh", "Refresh"),
+        ("j", "export_json", "Export JSON"),
+        ("p", "export_prometheus", "Export Prometheus"),
+        ("q", "back", "Back"),
+        ("escape", "back", "Back"),
+    ]
+
+    # Seconds between automatic refreshes of the table (EGERIA_DIAGNOSTICS_REFRESH_SECONDS)
+    REFRESH_SECONDS = float(os.getenv("EGERIA_DIAGNOSTICS_REFRESH_SECONDS", "2"))
+
+    def compose(self):
+        yield from super().compose()
+        yield Vertical(
+            Container(
+                Vertical(
+                    Static("Egeria call diagnostics (times in ms)", id="diag_title"),
+                    VirtualTable(id="diag-table"),
+                    Static("", id="diag_summary"),
+                    id="diag_top_content",
+                ),
+                id="diag_top_row",
+            ),
+            Container(id="diag_spacer"),
+            Container(
+                Horizontal(
+                    Button("Refresh", id="diag-refresh"),
+                    Button("Export JSON", id="diag-export-json"),
+                    Button("Export Prometheus", id="diag-export-prom"),
+                    Button("Reset", id="diag-reset"),
+                    Button("Back", id="diag-back"),
+                    id="diag_action_row",
+                ),
+                id="diag_action_row_container",
+            ),
+            id="diag_v_root",
+        )
+
+    async def on_mount(self):
+        await super().on_mount()
+        vroot = self.query_one("#diag_v_root", Vertical)
+        vroot.styles.width = "100%"
+        vroot.styles.height = "100%"
+
+        top = self.query_one("#diag_top_row", Container)
+        top.styles.width = "100%"
+        top.styles.height = "70%"
+        top.styles.padding = (1, 2)
+
+        title = self.query_one("#diag_title", Static)
+        title.styles.text_style = "bold"
+
+        self.query_one("#diag_spacer", Container).styles.height = "1fr"
+        abox = self.query_one("#diag_action_row_container", Container)
+        abox.styles.height = "auto"
+        abox.styles.padding = (1, 2)
+        arow = self.query_one("#diag_action_row", Horizontal)
+        arow.styles.align_horizontal = "center"
+        arow.styles.gap = 1
+
+        self.table = self.query_one("#diag-table", VirtualTable)
+        self.table.styles.height = "1fr"
+        self.table.add_columns(
+            "Method", "Calls", "Errors", "Retries", "Total s", "p50", "p95", "p99", "Max", "Rows p95", "Cache hit %"
+        )
+        self.refresh_metrics()
+        self.set_interval(self.REFRESH_SECONDS, self.refresh_metrics)
+        self.set_focus(self.table)
+
+    def refresh_metrics(self) -> None:
+        snapshot = metrics_snapshot()
+        methods = snapshot.pop("methods")
+        self.table.clear()
+        # The calls that cost the most time overall are the ones to look at first
+        for method, m in sorted(methods.items(), key=lambda kv: -kv[1]["latency"]["sum"]):
+            latency = m["latency"]
+            lookups = m["cache_hits"] + m["cache_misses"]
+            self.table.add_row(
+                method,
+                m["calls"],
+                m["errors"],
+                m["retries"],
+                f"{latency['sum']:.2f}",
+                _ms(latency["p50"]),
+                _ms(latency["p95"]),
+                _ms(latency["p99"]),
+                _ms(latency["max"]),
+                int(m["payload"]["p95"]),
+                f"{m['cache_hit_ratio'] * 100:.0f}" if lookups else "-",
+                key=method,
+            )
+        if not methods:
+            self.table.add_row("No Egeria calls recorded yet", *([""] * 10))
+        self.query_one("#diag_summary", Static).update(self._summary(snapshot))
+
+    @staticmethod
+    def _summary(stats: dict) -> str:
+        cache = stats.get("response_cache") or {}
+        flights = stats.get("single_flight") or {}
+        retries = stats.get("retries") or {}
+        executor = stats.get("executor") or {}
+        return (
+            f"Response cache: {cache.get('entries', 0)} entries, "
+            f"{cache.get('hit_ratio', 0.0) * 100:.0f}% hits | "
+            f"Coalesced reads: {flights.get('coalesced', 0)} | "
+            f"Auth refreshes: {retries.get('auth_refreshes', 0)}, "
+            f"transient retries: {retries.get('transient_retries', 0)} | "
+            f"Executor: {', '.join(f'{k}={v}' for k, v in executor.items() if isinstance(v, int))}"
+        )
+
+    async def _export(self, suffix: str) -> None:
+        directory = os.getenv("EGERIA_METRICS_EXPORT_DIR", os.getcwd())
+        path = os.path.join(directory, f"my_egeria_metrics_{datetime.now():%Y%m%d_%H%M%S}.{suffix}")
+        try:
+            await run_blocking(write_export, path)
+        except OSError as e:
+            self.notify(f"Export failed: {e}", severity="error")
+            return
+        self.notify(f"Metrics written to {path}")
+
+    @on(Button.Pressed, "#diag-refresh")
+    def action_refresh(self) -> None:
+        self.refresh_metrics()
+
+    @on(Button.Pressed, "#diag-export-json")
+    async def action_export_json(self) -> None:
+        await self._export("json")
+
+    @on(Button.Pressed, "#diag-export-prom")
+    async def action_export_prometheus(self) -> None:
+        await self._export("prom")
+
+    @on(Button.Pressed, "#diag-reset")
+    def handle_reset(self) -> None:
+        CALL_METRICS.reset()
+        self.refresh_metrics()
+
+    @on(Button.Pressed, "#diag-back")
+    async def action_back(self) -> None:
+        await self.app.pop_screen()
@@ -8,16 +8,25 @@ This module provides services for the Glossary related functions of my_egeria mo
 
 """
 
-from textual.widgets import Static, DataTable, Input, Button
+from textual.widgets import Static, Input, Button
 from textual.containers import Horizontal, Vertical, Container
 from screens.base_screen import BaseScreen
+from widgets.virtual_table import VirtualTable
 from services.glossary_service import GlossaryService
+from services.projections import GLOSSARY_COLUMNS, TERM_COLUMNS
+from services.records import GlossaryRecord, TermRecord
+from utils.executor import run_blocking
 from .term_details import TermDetailsScreen
+from utils.swr import snapshot_key
 import asyncio
+from contextlib import aclosing
 
 
 class GlossaryBrowserScreen(BaseScreen):
     CSS_PATH = ["../../styles/common.css", "../../styles/glossary_browser.css"]
+    # Fields requested from the server for the glossary and term tables
+    GLOSSARY_COLUMNS = GLOSSARY_COLUMNS
+    TERM_COLUMNS = TERM_COLUMNS
 
     def __init__(self, *args, **kwargs):
         super().__init__(**kwargs)
@@ -39,7 +48,7 @@ class GlossaryBrowserScreen(BaseScreen):
             Container(
                 Vertical(
                     Static("Glossaries", id="title"),
-                    DataTable(id="main-table"),
+                    VirtualTable(id="main-table"),
                     id="top_content",
                 ),
                 id="top_row",
@@ -100,7 +109,7 @@ class GlossaryBrowserScreen(BaseScreen):
         title.styles.margin = (0, 0, 1, 0)
 
         # Table fills remaining space within top_row
-        self.table = self.query_one("#main-table", DataTable)
+        self.table = self.query_one("#main-table", VirtualTable)
         self.table.styles.height = "100%"
         self.table.styles.min_height = 8
         self.table.cursor_type = "row"
@@ -213,7 +222,7 @@ class GlossaryBrowserScreen(BaseScreen):
 
     # ------------- Selection wiring -------------
 
-    def on_data_table_row_selected(self, event: DataTable.RowSelected):
+    def on_virtual_table_row_selected(self, event: VirtualTable.RowSelected):
         # Capture selection for both modes
         if self.mode == "glossaries":
             try:
@@ -240,102 +249,114 @@ class GlossaryBrowserScreen(BaseScreen):
 
     # ------------- Loaders -------------
 
-    async def _load_glossaries(self, search: str = ""):
-        self.table.clear()
-        try:
-            # Run the sync call in a worker thread to avoid blocking the UI loop
-            glossaries = await asyncio.to_thread(self.service.list_glossaries, search or "*")
-            if glossaries:
-                for g in glossaries:
-                    self.table.add_row(
-                        g.get("GUID", "") or g.get("guid", ""),
-                        g.get("display_name", "") or g.get("displayName", ""),
-                        g.get("qualified_name", "") or g.get("qualifiedName", ""),
-                        g.get("description", "") or g.get("summary", ""),
-                    )
-            else:
-                self.table.add_row("", "No glossaries found", "", "")
-        except Exception as e:
-            self.table.add_row("", f"Error: {e}", "", "")
+    async def _load_glossaries(self, search: str = "", refresh: bool = False):
+        # Paint the last known glossaries at once and revalidate in the background
+        key = snapshot_key("glossaries", self.cfg, search or "*")
+        await self.run_load(
+            self.table.id,
+            self.load_rows_swr(
+                self.table,
+                key,
+                lambda: self._fetch_glossary_rows(search, refresh),
+                empty_message="No glossaries found",
+                search=search,
+            ),
+        )
+
+    async def _fetch_glossary_rows(self, search: str = "", refresh: bool = False):
+        # Pages are fetched in worker threads, the next one while this one renders
+        async with aclosing(self.service.iter_glossaries(
+            search or "*", use_cache=not refresh, columns=self.GLOSSARY_COLUMNS
+        )) as pages:
+            async for page in pages:
+                yield [(g.guid, g.display_name, g.qualified_name, g.description) for g in page]
 
     async def _load_terms_for_glossary(self, glossary_guid: str, search: str = ""):
+        # Replaces (and cancels) whatever load is still filling the table
+        await self.run_load(self.table.id, self._stream_terms_for_glossary(glossary_guid, search))
+
+    async def _stream_terms_for_glossary(self, glossary_guid: str, search: str = ""):
         self.table.clear()
         try:
-            terms = await self.service.get_glossary_terms_async(glossary_guid, search=search)
-            if terms:
-                for t in terms:
-                    self.table.add_row(
-                        t.get("guid", "") or t.get("GUID", ""),
-                        t.get("displayName", "") or t.get("display_name", ""),
-                        t.get("summary", "") or t.get("description", ""),
-                        t.get("status", "") or "",
-                    )
-            else:
+            # Each page is shown as it arrives while the next is prefetched
+            count = 0
+            pages = self.service.iter_terms(search or "*", glossary_guid=glossary_guid, columns=self.TERM_COLUMNS)
+            async with aclosing(pages):
+                async for page in pages:
+                    count += await self.table.stream_rows(self._term_row(t) for t in page)
+            if not count:
                 self.table.add_row("", "No terms found", "", "")
+            else:
+                # All terms are in: narrower searches can be answered from the table
+                self.remember_loaded_rows(self.table, search, [row for _, row in self.table.keyed_rows()])
         except Exception as e:
             self.table.add_row("", f"Error: {e}", "", "")
 
+    @staticmethod
+    def _term_row(t: TermRecord):
+        return (t.guid, t.display_name, t.summary_or_description, t.status)
+
     async def _load_all_terms(self, search: str = ""):
-        """Aggregate and list terms from all glossaries."""
+        """Aggregate and list terms from all glossaries, streaming each glossary's terms as it arrives."""
+        await self.run_load(self.table.id, self._stream_all_terms(search))
+
+    async def _stream_all_terms(self, search: str = ""):
         self.table.clear()
         try:
             # Fetch glossaries in a worker thread
-            glossaries = await asyncio.to_thread(self.service.list_glossaries, "*")
-            aggregate = []
-            for g in (glossaries or []):
-                g_guid = g.get("GUID", "") or g.get("guid", "")
-                if not g_guid:
-                    continue
-                search_string = "*"
-                try:
-                    # Fetch terms for each glossary in a worker thread
-                    terms = await asyncio.to_thread(self.service.get_terms,  search_string, glossary_guid=g_guid )
-                    # Tag term with source glossary display name for context (optional)
-                    g_name = g.get("display_name", "") or g.get("displayName", "") or ""
-                    for t in (terms or []):
-                        t = dict(t)  # shallow copy
-                        if "glossary" not in t:
-                            t["glossary"] = g_name
-                        aggregate.append(t)
-                except Exception:
-                    # Skip problematic glossary and continue
-                    continue
-
-            if aggregate:
-                # Switch to terms table layout
-                self.mode = "terms"
-                self.title_widget.update("Terms in: All Glossaries")
-                self.table.clear(columns=True)
-                self.table.add_columns("GUID", "Term Name", "Summary/Description", "Status")
-                # Populate
-                for t in aggregate:
-                    self.table.add_row(
-                        t.get("guid", "") or t.get("GUID", ""),
-                        t.get("displayName", "") or t.get("display_name", ""),
-                        t.get("summary", "") or t.get("description", ""),
-                        t.get("status", "") or "",
-                    )
-                # Enable term actions
-                self._set_buttons_state(
-                    list_terms=False, back=True,
-                    add_glossary=False, delete_glossary=False, update_glossary=False,
-                    add_term=True, delete_term=True, term_details=True
-                )
-            else:
-                self.table.add_row("", "No terms found", "", "")
+            glossaries = await run_blocking(
+                self.service.list_glossaries, "*", platform=self.cfg.platform_url, columns=self.GLOSSARY_COLUMNS
+            )
         except Exception as e:
             self.table.add_row("", f"Error: {e}", "", "")
+            return
+        names = {g.guid: g.display_name or g.guid for g in GlossaryRecord.from_list(glossaries) if g.guid}
+
+        # Switch to terms table layout before the first results arrive
+        self.mode = "terms"
+        self.title_widget.update("Terms in: All Glossaries")
+        self.table.clear(columns=True)
+        self.table.add_columns("GUID", "Term Name", "Summary/Description", "Status")
+        self._set_buttons_state(
+            list_terms=False, back=True,
+            add_glossary=False, delete_glossary=False, update_glossary=False,
+            add_term=True, delete_term=True, term_details=True
+        )
+
+        failed = []
+        count = 0
+        results = self.service.get_terms_for_glossaries(names, search=search or "*", columns=self.TERM_COLUMNS)
+        async with aclosing(results):
+            async for result in results:
+                if not result.ok:
+                    failed.append(names.get(result.glossary_guid, result.glossary_guid))
+                    continue
+                count += await self.table.stream_rows(self._term_row(t) for t in result.terms)
+        if not count:
+            self.table.add_row("", "No terms found", "", "")
+        elif not failed:
+            self.remember_loaded_rows(self.table, search, [row for _, row in self.table.keyed_rows()])
+        if failed:
+            shown = ", ".join(failed[:5]) + (" ..." if len(failed) > 5 else "")
+            self.notify(f"Could not load terms for {len(failed)} glossaries: {shown}", severity="warning")
+
+    async def run_search(self, query: str):
+        """Narrow the loaded glossaries or terms locally; only a wider search goes back to the server."""
+        if self.filter_loaded_rows(self.table, query):
+            return
+        if self.mode == "glossaries":
+            await self._load_glossaries(search=query)
+        elif self.selected_glossary_guid:
+            await self._load_terms_for_glossary(self.selected_glossary_guid, search=query)
+        else:
+            await self._load_all_terms(search=query)
 
         # ------------- Button handlers -------------
 
     async def on_button_pressed(self, event: Button.Pressed):
         btn_id = event.button.id
         if btn_id == "search-button":
-            query = self.query_one("#search-input", Input).value.strip()
-            if self.mode == "glossaries":
-                await self._load_glossaries(search=query)
-            else:
-                await self._load_terms_for_glossary(self.selected_glossary_guid, search=query)
+            await self.run_search(self.query_one("#search-input", Input).value.strip())
 
         elif btn_id == "list-terms-button":
             # If a glossary is selected, show its terms; otherwise show all terms
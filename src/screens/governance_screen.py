@@ -15,7 +15,7 @@ from textual.containers import Container
 
 from .base_screen import BaseScreen
 from utils.config import get_global_config
-from utils.egeria_client import EgeriaTechClientManager
+from utils.egeria_client import PooledClientManager
 
 
 class GovernanceScreen(BaseScreen):
@@ -25,7 +25,7 @@ class GovernanceScreen(BaseScreen):
         super().__init__(**kwargs)
         self.table = DataTable()
         self.cfg = get_global_config()
-        self.manager = EgeriaTechClientManager(self.cfg)
+        self.manager = PooledClientManager(self.cfg)
 
     def compose(self) -> ComposeResult:
         yield from super().compose()
@@ -129,36 +129,37 @@ class GovernanceScreen(BaseScreen):
         """Fetch and display governance engine and service information."""
         self.table.clear()
         try:
-            client = self.manager.get_client()
-            engines = self._list_governance_engines(client)
-            if not engines:
-                self.table.add_row("No governance engines found", "", "")
-                return
-
-            for engine in engines:
-                engine_name = (
-                    engine.get("engineName")
-                    or engine.get("name")
-                    or engine.get("displayName")
-                    or "Unknown"
-                )
-                status = engine.get("engineStatus") or engine.get("status") or "Unknown"
-                try:
-                    services = self._get_engine_services(client, engine_name)
-                    services_str = (
-                        ", ".join(
-                            s.get("serviceName")
-                            or s.get("name")
-                            or s.get("displayName")
-                            or "?"
-                            for s in services
-                        )
-                        if services
-                        else "None"
+            with self.manager.lease() as leased:
+                client = leased.get_client()
+                engines = self._list_governance_engines(client)
+                if not engines:
+                    self.table.add_row("No governance engines found", "", "")
+                    return
+
+                for engine in engines:
+                    engine_name = (
+                        engine.get("engineName")
+                        or engine.get("name")
+                        or engine.get("displayName")
+                        or "Unknown"
                     )
-                    self.table.add_row(engine_name, status, services_str)
-                except Exception as inner_err:
-                    self.table.add_row(engine_name, f"Error: {inner_err}", "")
+                    status = engine.get("engineStatus") or engine.get("status") or "Unknown"
+                    try:
+                        services = self._get_engine_services(client, engine_name)
+                        services_str = (
+                            ", ".join(
+                                s.get("serviceName")
+                                or s.get("name")
+                                or s.get("displayName")
+                                or "?"
+                                for s in services
+                            )
+                            if services
+                            else "None"
+                        )
+                        self.table.add_row(engine_name, status, services_str)
+                    except Exception as inner_err:
+                        self.table.add_row(engine_name, f"Error: {inner_err}", "")
         except Exception as e:
             self.table.add_row("Error", str(e), "")
 
@@ -0,0 +1,146 @@
+# python
+
+"""PDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+This module provides the Import Screen (bulk CSV/JSONL import) of my_egeria module.
+
+
+"""
+
+from textual import on
+from textual.containers import Container, Horizontal, Vertical
+from textual.widgets import Button, Checkbox, Input, ProgressBar, Select, Static
+
+from screens.base_screen import BaseScreen
+from services.metadata_import import KINDS, ImportProgress, errors_path_for, import_metadata
+
+
+class ImportScreen(BaseScreen):
+    """Streams a CSV or JSONL file into Egeria as glossaries, terms or collections, with progress."""
+
+    CSS_PATH = ["../styles/common.css"]
+    BINDINGS = [
+        ("q", "back", "Back"),
+        ("escape", "back", "Back"),
+    ]
+
+    def compose(self):
+        yield from super().compose()
+        yield Vertical(
+            Container(
+                Vertical(
+                    Static("Import metadata from CSV or JSONL", id="imp_title"),
+                    Input(placeholder="File to import (.csv or .jsonl)", id="imp-path"),
+                    Select([(k.capitalize(), k) for k in KINDS], value="terms", allow_blank=False, id="imp-kind"),
+                    Input(placeholder="Glossary GUID (terms without a glossary_guid column)", id="imp-glossary"),
+                    Checkbox("Start over (ignore the last checkpoint)", id="imp-restart"),
+                    ProgressBar(total=100, show_eta=True, id="imp-progress"),
+                    Static("", id="imp-status"),
+                    id="imp_form",
+                ),
+                id="imp_top_row",
+            ),
+            Container(id="imp_spacer"),
+            Container(
+                Horizontal(
+                    Button("Start", variant="primary", id="imp-start"),
+                    Button("Stop", id="imp-stop", disabled=True),
+                    Button("Back", id="imp-back"),
+                    id="imp_action_row",
+                ),
+                id="imp_action_row_container",
+            ),
+            id="imp_v_root",
+        )
+
+    async def on_mount(self):
+        await super().on_mount()
+        vroot = self.query_one("#imp_v_root", Vertical)
+        vroot.styles.width = "100%"
+        vroot.styles.height = "100%"
+
+        top = self.query_one("#imp_top_row", Container)
+        top.styles.width = "100%"
+        top.styles.height = "auto"
+        top.styles.padding = (1, 2)
+
+        form = self.query_one("#imp_form", Vertical)
+        form.styles.height = "auto"
+        form.styles.gap = 1
+
+        title = self.query_one("#imp_title", Static)
+        title.styles.text_style = "bold"
+
+        self.query_one("#imp_spacer", Container).styles.height = "1fr"
+        abox = self.query_one("#imp_action_row_container", Container)
+        abox.styles.height = "auto"
+        abox.styles.padding = (1, 2)
+        arow = self.query_one("#imp_action_row", Horizontal)
+        arow.styles.align_horizontal = "center"
+        arow.styles.gap = 1
+
+        self.progress_bar = self.query_one("#imp-progress", ProgressBar)
+        self.status = self.query_one("#imp-status", Static)
+        self.set_focus(self.query_one("#imp-path", Input))
+
+    def _set_running(self, running: bool) -> None:
+        if not self.is_attached:  # stopped by leaving the screen
+            return
+        self.query_one("#imp-start", Button).disabled = running
+        self.query_one("#imp-stop", Button).disabled = not running
+
+    def _show(self, progress: ImportProgress) -> None:
+        self.progress_bar.update(progress=progress.fraction * 100)
+        self.status.update(
+            f"{progress.rows} rows: {progress.created} created, "
+            f"{progress.invalid} invalid, {progress.failed} failed"
+        )
+
+    @on(Button.Pressed, "#imp-start")
+    def handle_start(self) -> None:
+        path = self.query_one("#imp-path", Input).value.strip()
+        if not path:
+            self.notify("Enter the file to import", severity="warning")
+            return
+        self._set_running(True)
+        self.run_worker(
+            self._import(
+                path,
+                self.query_one("#imp-kind", Select).value,
+                self.query_one("#imp-glossary", Input).value.strip() or None,
+                self.query_one("#imp-restart", Checkbox).value,
+            ),
+            group="import",
+            exclusive=True,
+        )
+
+    async def _import(self, path: str, kind: str, glossary_guid, restart: bool) -> None:
+        self.progress_bar.update(progress=0)
+        self.status.update("Importing...")
+        try:
+            progress = await import_metadata(
+                path, kind, glossary_guid=glossary_guid, restart=restart, on_progress=self._show, config=self.cfg
+            )
+        except (OSError, ValueError) as e:
+            self.notify(f"Import failed: {e}", severity="error")
+            self.status.update(f"Import failed: {e}")
+            return
+        finally:
+            self._set_running(False)
+        if progress.invalid or progress.failed:
+            self.notify(f"Import finished; rejected records are in {errors_path_for(path)}", severity="warning")
+        else:
+            self.notify(f"Imported {progress.created} {kind}")
+
+    @on(Button.Pressed, "#imp-stop")
+    def handle_stop(self) -> None:
+        # The checkpoint of the last complete batch stays; starting again resumes from it
+        self.workers.cancel_group(self, "import")
+        self._set_running(False)
+        self.status.update("Stopped; Start resumes from the last completed batch")
+
+    @on(Button.Pressed, "#imp-back")
+    async def action_back(self) -> None:
+        self.workers.cancel_group(self, "import")
+        await self.app.pop_screen()
@@ -37,6 +37,8 @@ class MainMenuScreen(BaseScreen):
                         Button("Product Managers", id="product_managers", disabled=True),
                         Button("Project Managers", id="projects", disabled=True),
                         Button("Subject Areas", id="subject_areas", disabled=True),
+                        Button("Import", id="import"),
+                        Button("Diagnostics", id="diagnostics"),
                         Button("Quit", id="quit"),
                         id="menu_buttons",
                     ),
@@ -93,7 +95,7 @@ class MainMenuScreen(BaseScreen):
         buttons.styles.width = "100%"
 
         # Make buttons a consistent width for aesthetics
-        for bid in ("#glossaries", "#collections", "#projects", "#subject_areas", "#quit"):
+        for bid in ("#glossaries", "#collections", "#projects", "#subject_areas", "#import", "#diagnostics", "#quit"):
             btn = self.query_one(bid, Button)
             btn.styles.width = 24  # fixed character width
 
@@ -110,6 +112,10 @@ class MainMenuScreen(BaseScreen):
             pass
         elif event.button.id == "subject_areas":
             pass
+        elif event.button.id == "import":
+            await self.app.push_screen("import")
+        elif event.button.id == "diagnostics":
+            await self.app.push_screen("diagnostics")
         elif event.button.id == "quit":
             self.app.exit()
 
@@ -12,37 +12,555 @@ This module provides services for the functions of my_egeria module.
 
 
 """
+import asyncio
+import contextvars
+import threading
+import time
+from functools import lru_cache
+from importlib import metadata
 from textual import log
-from typing import Any, List, Dict, Optional, Tuple
-from utils.egeria_client import EgeriaTechClientManager
+from typing import Any, AsyncIterator, Callable, List, Dict, FrozenSet, Optional, Tuple
+from utils.egeria_client import (
+    AsyncEgeriaTechClientManager,
+    EgeriaTechClientManager,
+    PooledClientManager,
+    get_async_manager,
+)
 from utils.config import EgeriaConfig, get_global_config
+from utils.cache import MISSING, TTLCache, freeze
+from utils.executor import Priority, executor_stats, run_blocking
+from utils.metrics import CALL_METRICS, metrics_enabled, register_stats
+from utils.retry import get_retry_metrics
+from .projections import Projection
+from utils.search_index import (
+    SearchIndex,
+    clear_search_indexes,
+    get_search_index,
+    indexable_query,
+    record_id,
+    search_index_stats,
+)
 from os import getenv
 
+
+# Which candidate method worked, per (config, client signature, candidate names).
+# The client signature (class + pyegeria version) is part of the key, so a new
+# client class, a pyegeria upgrade or a different config never reuses a stale answer.
+_METHOD_CACHE: Dict[Tuple, str] = {}
+_CLIENT_SIGNATURES: Dict[EgeriaConfig, Tuple[str, str]] = {}
+_METHOD_STATS: Dict[str, int] = {"hits": 0, "misses": 0, "skipped_calls": 0, "invalidations": 0}
+_METHOD_LOCK = threading.Lock()
+# (config, client signature, method) whose client rejected output_format_set; those calls go unprojected
+_NO_PROJECTION: set = set()
+
+
+@lru_cache(maxsize=1)
+def _pyegeria_version() -> str:
+    try:
+        return metadata.version("pyegeria")
+    except Exception:
+        return "unknown"
+
+
+# Read-only responses shared by every service instance, keyed by (config, method, args, kwargs)
+_RESPONSE_CACHE = TTLCache(
+    maxsize=int(getenv("EGERIA_CACHE_MAX_ENTRIES", "256")),
+    ttl=float(getenv("EGERIA_CACHE_TTL_SECONDS", "60")),
+)
+# Whether the last _invoke/_ainvoke in this thread or task was answered from _RESPONSE_CACHE
+_SERVED_FROM_CACHE: contextvars.ContextVar[bool] = contextvars.ContextVar("served_from_cache", default=False)
+
+
+def response_cache_stats() -> Dict[str, Any]:
+    return _RESPONSE_CACHE.stats()
+
+
+class _Flight:
+    """One in-flight read that identical concurrent calls wait on instead of repeating."""
+
+    __slots__ = ("done", "result", "error", "stale", "task", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        # Set when a write invalidates the read mid-flight: its result must not be cached
+        self.stale = False
+        self.task: Optional[asyncio.Future] = None
+        # Async callers still awaiting `task`; when the last one is cancelled, so is the call
+        self.waiters = 0
+
+
+# In-flight reads keyed like the response cache (sync) or by (event loop, cache key) (async)
+_INFLIGHT: Dict[Tuple, _Flight] = {}
+_AINFLIGHT: Dict[Tuple, _Flight] = {}
+_INFLIGHT_LOCK = threading.Lock()
+_FLIGHT_STATS: Dict[str, int] = {"leaders": 0, "coalesced": 0}
+
+
+def single_flight_stats() -> Dict[str, int]:
+    """How many reads went to the server (leaders) vs. joined an identical in-flight call."""
+    with _INFLIGHT_LOCK:
+        return dict(_FLIGHT_STATS, in_flight=len(_INFLIGHT) + len(_AINFLIGHT))
+
+
+def _copy_result(res: Any) -> Any:
+    # Every caller gets its own list so one caller's edits never leak into another's rows
+    return list(res) if isinstance(res, list) else res
+
+
+def clear_response_cache() -> None:
+    _RESPONSE_CACHE.clear()
+    # The search indexes are built from responses too
+    clear_search_indexes()
+
+
+def _debug_methods() -> bool:
+    return getenv("EGERIA_DEBUG_METHODS", "").lower() in ("1", "true", "yes")
+
+
+def method_cache_stats() -> Dict[str, int]:
+    """Counters for the candidate-method resolution cache (see BaseService._call_list_like)."""
+    with _METHOD_LOCK:
+        return dict(_METHOD_STATS, entries=len(_METHOD_CACHE))
+
+
+def invalidate_method_cache(config: Optional[EgeriaConfig] = None) -> None:
+    """Forget resolved methods for one config, or for all configs when none is given."""
+    with _METHOD_LOCK:
+        for key in [k for k in _METHOD_CACHE if config is None or k[0] == config]:
+            del _METHOD_CACHE[key]
+        _NO_PROJECTION.difference_update([k for k in _NO_PROJECTION if config is None or k[0] == config])
+        if config is None:
+            _CLIENT_SIGNATURES.clear()
+        else:
+            _CLIENT_SIGNATURES.pop(config, None)
+
+
+def _payload_size(res: Any) -> int:
+    """Elements in a response: list length, or the longest list inside a wrapper dict."""
+    if isinstance(res, (list, tuple)):
+        return len(res)
+    if isinstance(res, dict):
+        return max((len(v) for v in res.values() if isinstance(v, list)), default=1)
+    return 0 if res is None else 1
+
+
+# Shown alongside the per-method call metrics (diagnostics screen, exports)
+register_stats("response_cache", response_cache_stats)
+register_stats("single_flight", single_flight_stats)
+register_stats("method_cache", method_cache_stats)
+register_stats("retries", get_retry_metrics)
+register_stats("executor", executor_stats)
+register_stats("search_index", search_index_stats)
+
+
 class BaseService:
     """Shared logic for services: client management, safe invocation, normalization."""
 
+    # Read-only client methods whose responses _invoke may serve from the response cache.
+    # Write methods must call _invalidate_cached() for the reads they affect.
+    CACHEABLE_METHODS = frozenset({
+        "find_collections",
+        "get_collection",
+        "get_member_list",
+        "find_glossaries",
+        "find_glossary_terms",
+    })
+
+    # Default page size for the iter_* APIs (EGERIA_PAGE_SIZE)
+    PAGE_SIZE = int(getenv("EGERIA_PAGE_SIZE", "200"))
+
+    # Record latency, payload, attempts and cache use per client method (EGERIA_METRICS)
+    INSTRUMENT = metrics_enabled()
+
     def __init__(
         self,
         config: Optional[EgeriaConfig] = None,
         manager: Optional[EgeriaTechClientManager] = None,
+        async_manager: Optional[AsyncEgeriaTechClientManager] = None,
     ):
         self.config = config or get_global_config()
-        self.manager = manager or EgeriaTechClientManager(self.config)
+        # Share clients process-wide; an explicitly passed manager is used as-is
+        self._custom_manager = manager is not None
+        self.manager = manager or PooledClientManager(self.config)
+        self._async_manager = async_manager
+
+    def _get_async_manager(self) -> Optional[AsyncEgeriaTechClientManager]:
+        """
+        The async manager for the running loop. None when only a custom sync manager
+        was supplied: _ainvoke then goes through that manager in a worker thread.
+        """
+        if self._async_manager is not None:
+            return self._async_manager
+        if self._custom_manager:
+            return None
+        return get_async_manager(self.config)
 
     # Invoke a method by name on the client with auto-refresh retry
     def _invoke(
-        self, method_name: str, args: Tuple = (), kwargs: Optional[dict] = None
+        self, method_name: str, args: Tuple = (), kwargs: Optional[dict] = None, use_cache: bool = True
     ):
+        """
+        Call `method_name` on the pooled client. Reads listed in CACHEABLE_METHODS are
+        served from the shared TTL/LRU response cache; use_cache=False forces a round
+        trip and stores the fresh response. Identical reads already in flight on
+        another thread are joined rather than repeated (single-flight).
+        """
         kwargs = kwargs or {}
+        cache_key = self._cache_key(method_name, args, kwargs)
+        _SERVED_FROM_CACHE.set(False)
+        if cache_key is not None and use_cache:
+            cached = _RESPONSE_CACHE.lookup(cache_key)
+            if self.INSTRUMENT:
+                CALL_METRICS.cache(method_name, hit=cached is not MISSING)
+            if cached is not MISSING:
+                _SERVED_FROM_CACHE.set(True)
+                return _copy_result(cached)
+        if cache_key is None:
+            return self._invoke_uncached(method_name, args, kwargs)
+
+        with _INFLIGHT_LOCK:
+            flight = _INFLIGHT.get(cache_key)
+            leader = flight is None
+            if leader:
+                flight = _INFLIGHT[cache_key] = _Flight()
+                _FLIGHT_STATS["leaders"] += 1
+            else:
+                _FLIGHT_STATS["coalesced"] += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return _copy_result(flight.result)
+
+        try:
+            flight.result = self._invoke_uncached(method_name, args, kwargs)
+            if not flight.stale:
+                _RESPONSE_CACHE.set(cache_key, _copy_result(flight.result))
+            return _copy_result(flight.result)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with _INFLIGHT_LOCK:
+                if _INFLIGHT.get(cache_key) is flight:
+                    del _INFLIGHT[cache_key]
+            flight.done.set()
+
+    def _invoke_uncached(self, method_name: str, args: Tuple, kwargs: dict):
+        instrument = self.INSTRUMENT
 
         def _call(client, *a, **k):
+            self._record_signature(client)
             fn = getattr(client, method_name, None)
             if not fn:
                 raise AttributeError(f"Client has no method '{method_name}'")
             log(f"Invoking {method_name} with args={a} kwargs={k}")
+            if instrument:
+                CALL_METRICS.attempt(method_name)
             return fn(*a, **k)
 
-        return self.manager.invoke_with_auto_refresh(_call, args=args, kwargs=kwargs)
+        if not instrument:
+            return self.manager.invoke_with_auto_refresh(_call, args=args, kwargs=kwargs)
+        started = time.perf_counter()
+        try:
+            res = self.manager.invoke_with_auto_refresh(_call, args=args, kwargs=kwargs)
+        except BaseException:
+            CALL_METRICS.observe(method_name, time.perf_counter() - started, ok=False)
+            raise
+        CALL_METRICS.observe(method_name, time.perf_counter() - started, _payload_size(res))
+        return res
+
+    async def _ainvoke(
+        self,
+        method_name: str,
+        args: Tuple = (),
+        kwargs: Optional[dict] = None,
+        use_cache: bool = True,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Async counterpart of _invoke: awaits the client's `_async_<method_name>` on the
+        event loop, with token refresh, retries and a per-call timeout. The response
+        cache is shared with _invoke. Only when the client has no async variant does the
+        call fall back to the sync path in a worker thread. Identical reads already in
+        flight on this loop share one call; a caller being cancelled doesn't cancel it
+        for the others, but once every caller has been cancelled the call is too.
+        """
+        kwargs = kwargs or {}
+        cache_key = self._cache_key(method_name, args, kwargs)
+        _SERVED_FROM_CACHE.set(False)
+        if cache_key is not None and use_cache:
+            cached = _RESPONSE_CACHE.lookup(cache_key)
+            if self.INSTRUMENT:
+                CALL_METRICS.cache(method_name, hit=cached is not MISSING)
+            if cached is not MISSING:
+                _SERVED_FROM_CACHE.set(True)
+                return _copy_result(cached)
+        if cache_key is None:
+            return await self._ainvoke_uncached(method_name, args, kwargs, use_cache, timeout)
+
+        flight_key = (asyncio.get_running_loop(), cache_key)
+        with _INFLIGHT_LOCK:
+            flight = _AINFLIGHT.get(flight_key)
+            if flight is None:
+                flight = _AINFLIGHT[flight_key] = _Flight()
+                _FLIGHT_STATS["leaders"] += 1
+                flight.task = asyncio.ensure_future(
+                    self._ainvoke_flight(flight, flight_key, method_name, args, kwargs, use_cache, timeout)
+                )
+                # Retrieve the outcome even if every waiter was cancelled, so it is never reported as lost
+                flight.task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            else:
+                _FLIGHT_STATS["coalesced"] += 1
+        flight.waiters += 1
+        try:
+            return _copy_result(await asyncio.shield(flight.task))
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                # Nobody wants the result any more (e.g. a superseded screen load);
+                # detach it first so a new caller starts a fresh flight instead of joining this one
+                with _INFLIGHT_LOCK:
+                    if _AINFLIGHT.get(flight_key) is flight:
+                        del _AINFLIGHT[flight_key]
+                flight.task.cancel()
+
+    async def _ainvoke_flight(self, flight: _Flight, flight_key: Tuple, method_name, args, kwargs, use_cache, timeout):
+        try:
+            res = await self._ainvoke_uncached(method_name, args, kwargs, use_cache, timeout)
+            if not flight.stale:
+                _RESPONSE_CACHE.set(flight_key[1], _copy_result(res))
+            return res
+        finally:
+            with _INFLIGHT_LOCK:
+                if _AINFLIGHT.get(flight_key) is flight:
+                    del _AINFLIGHT[flight_key]
+
+    async def _ainvoke_uncached(self, method_name: str, args: Tuple, kwargs: dict, use_cache: bool, timeout):
+        amanager = self._get_async_manager()
+        fn = None
+        if amanager is not None:
+            client = await amanager.get_client()
+            self._record_signature(client)
+            fn = getattr(client, f"_async_{method_name}", None)
+        if fn is None:
+            return await run_blocking(
+                self._invoke, method_name, args, kwargs, use_cache, platform=self.config.platform_url
+            )
+
+        instrument = self.INSTRUMENT
+
+        async def _call(client, *a, **k):
+            log(f"Awaiting _async_{method_name} with args={a} kwargs={k}")
+            if instrument:
+                CALL_METRICS.attempt(method_name)
+            return await getattr(client, f"_async_{method_name}")(*a, **k)
+
+        if not instrument:
+            return await amanager.invoke_with_auto_refresh(_call, args=args, kwargs=kwargs, timeout=timeout)
+        started = time.perf_counter()
+        try:
+            res = await amanager.invoke_with_auto_refresh(_call, args=args, kwargs=kwargs, timeout=timeout)
+        except asyncio.CancelledError:
+            # Abandoned, not failed: a cancelled call says nothing about the server
+            raise
+        except BaseException:
+            CALL_METRICS.observe(method_name, time.perf_counter() - started, ok=False)
+            raise
+        CALL_METRICS.observe(method_name, time.perf_counter() - started, _payload_size(res))
+        return res
+
+    def _record_signature(self, client: Any) -> None:
+        signature = (f"{type(client).__module__}.{type(client).__qualname__}", _pyegeria_version())
+        if _CLIENT_SIGNATURES.get(self.config) != signature:
+            _CLIENT_SIGNATURES[self.config] = signature
+
+    def _cache_key(self, method_name: str, args: Tuple, kwargs: dict) -> Optional[Tuple]:
+        if method_name not in self.CACHEABLE_METHODS:
+            return None
+        try:
+            return (self.config, method_name, freeze(args), freeze(kwargs))
+        except TypeError:
+            return None
+
+    def _invalidate_cached(self, *method_names: str) -> int:
+        """Drop cached responses of the given read methods for this service's config."""
+        names = set(method_names)
+        matches = lambda k: k[0] == self.config and k[1] in names
+        with _INFLIGHT_LOCK:
+            # Reads started before the write may return pre-write data: let them finish
+            # for their current waiters, but don't cache them or let new callers join
+            for key in [k for k in _INFLIGHT if matches(k)]:
+                _INFLIGHT.pop(key).stale = True
+            for key in [k for k in _AINFLIGHT if matches(k[1])]:
+                _AINFLIGHT.pop(key).stale = True
+        return _RESPONSE_CACHE.invalidate(matches)
+
+    # ------------------ column projection ------------------
+
+    def _projection_key(self, method_name: str) -> Tuple:
+        return (self.config, _CLIENT_SIGNATURES.get(self.config), method_name)
+
+    def _projected_kwargs(self, method_name: str, kwargs: dict, columns: Optional[Projection]) -> dict:
+        if columns is None or self._projection_key(method_name) in _NO_PROJECTION:
+            return kwargs
+        return {**kwargs, "output_format_set": columns.output_format_set()}
+
+    def _projection_rejected(self, method_name: str, error: TypeError) -> bool:
+        """True (and remembered) when `error` is the client refusing the output_format_set keyword."""
+        if "output_format_set" not in str(error):
+            return False
+        with _METHOD_LOCK:
+            _NO_PROJECTION.add(self._projection_key(method_name))
+        log(f"{method_name} does not accept output_format_set; trimming columns locally")
+        return True
+
+    def _invoke_projected(
+        self,
+        method_name: str,
+        args: Tuple = (),
+        kwargs: Optional[dict] = None,
+        columns: Optional[Projection] = None,
+        use_cache: bool = True,
+    ):
+        """
+        _invoke asking the server for only the `columns` fields. A client whose method
+        doesn't take output_format_set is called again without it, and isn't asked
+        again; callers trim the rows with columns.retain() either way.
+        """
+        kwargs = kwargs or {}
+        projected = self._projected_kwargs(method_name, kwargs, columns)
+        try:
+            return self._invoke(method_name, args=args, kwargs=projected, use_cache=use_cache)
+        except TypeError as e:
+            if projected is kwargs or not self._projection_rejected(method_name, e):
+                raise
+        return self._invoke(method_name, args=args, kwargs=kwargs, use_cache=use_cache)
+
+    async def _ainvoke_projected(
+        self,
+        method_name: str,
+        args: Tuple = (),
+        kwargs: Optional[dict] = None,
+        columns: Optional[Projection] = None,
+        use_cache: bool = True,
+    ):
+        """Async counterpart of _invoke_projected."""
+        kwargs = kwargs or {}
+        projected = self._projected_kwargs(method_name, kwargs, columns)
+        try:
+            return await self._ainvoke(method_name, args=args, kwargs=projected, use_cache=use_cache)
+        except TypeError as e:
+            if projected is kwargs or not self._projection_rejected(method_name, e):
+                raise
+        return await self._ainvoke(method_name, args=args, kwargs=kwargs, use_cache=use_cache)
+
+    # ------------------ local search index ------------------
+
+    def _search_index(self, kind: str) -> SearchIndex:
+        """The index of `kind` records ('collections', 'glossaries', 'terms') for this service's config."""
+        return get_search_index(kind, self.config)
+
+    def search_indexed(
+        self,
+        kind: str,
+        search: str,
+        start_from: int = 0,
+        page_size: Optional[int] = None,
+        columns: Optional[Projection] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Answer a plain-text search of `kind` records from the local index, without a
+        server call, once a full listing has been indexed. Matching is the index's own:
+        every word of `search` prefixes a word of a name, alias, summary or description,
+        ranked best first; it is not the server's substring match, so the list_* methods
+        never answer from here. None means the index can't answer (incomplete or expired,
+        wildcard or regex search, or filled with fewer fields than `columns` asks for).
+        """
+        if not indexable_query(search):
+            return None
+        index = self._search_index(kind)
+        if not index.complete or not index.covers(self._projected_fields(columns)):
+            return None
+        hits = index.search(search)
+        if page_size is not None:
+            hits = hits[max(0, start_from): max(0, start_from) + max(1, page_size)]
+        return columns.retain(hits) if columns else hits
+
+    def _index_records(
+        self,
+        kind: str,
+        records: List[Dict[str, Any]],
+        search: str,
+        start_from: int = 0,
+        page_size: Optional[int] = None,
+        columns: Optional[Projection] = None,
+    ) -> None:
+        """Feed fetched records to the index; `columns` is the projection they were fetched with."""
+        # A response served from the cache was indexed when it was fetched
+        fresh = not _SERVED_FROM_CACHE.get()
+        self._search_index(kind).ingest(
+            records, search, start_from, page_size, fresh=fresh, fields=self._projected_fields(columns)
+        )
+
+    @staticmethod
+    def _projected_fields(columns: Optional[Projection]) -> Optional[FrozenSet[str]]:
+        return frozenset(columns.fields) if columns else None
+
+    def _index_created(self, kind: str, res: Any, record: Dict[str, Any]) -> None:
+        """Add a record just created on the server (create_* returns its GUID) to the index."""
+        guid = res if isinstance(res, str) else (record_id(res) if isinstance(res, dict) else "")
+        if guid:
+            self._search_index(kind).add(dict(record, GUID=guid))
+
+    @staticmethod
+    def _paging_kwargs(start_from: int, page_size: Optional[int]) -> Dict[str, int]:
+        """Paging arguments for pyegeria find_* calls; none at all when paging isn't requested."""
+        if page_size is None:
+            return {}
+        return {"start_from": max(0, start_from), "page_size": max(1, page_size)}
+
+    async def _iter_pages(
+        self,
+        fetch_page: Callable[[int, int], List[Any]],
+        page_size: Optional[int] = None,
+        convert: Optional[Callable[[List[Any]], List[Any]]] = None,
+    ) -> AsyncIterator[List[Any]]:
+        """
+        Yield successive pages from `fetch_page(start_from, page_size)`, run on the
+        shared executor. The next page is requested as soon as the current one arrives, so it
+        loads while the caller renders. Iteration stops at the first short page; a page
+        longer than requested means the server ignored paging and returned everything.
+        `convert` maps each raw page (e.g. to records) in the worker thread.
+        """
+        page_size = max(1, page_size or self.PAGE_SIZE)
+        platform = self.config.platform_url
+
+        def _page(start: int) -> Tuple[int, List[Any]]:
+            raw = list(fetch_page(start, page_size) or [])
+            # Paging is decided on the raw length: conversion may drop malformed entries
+            return len(raw), (convert(raw) if convert else raw)
+
+        def _fetch(start: int, priority: Priority) -> asyncio.Future:
+            return asyncio.ensure_future(run_blocking(_page, start, platform=platform, priority=priority))
+
+        start = 0
+        # The page the user is waiting for is interactive; read-ahead pages yield to other screens' loads
+        pending: Optional[asyncio.Future] = _fetch(start, Priority.INTERACTIVE)
+        try:
+            while pending is not None:
+                fetched, page = await pending
+                pending = None
+                if fetched == page_size:
+                    start += page_size
+                    pending = _fetch(start, Priority.BACKGROUND)
+                if page:
+                    yield page
+        finally:
+            if pending is not None:
+                pending.cancel()
 
     def _normalize_list(self, res: Any, keys: Tuple[str, ...]) -> List[Dict[str, Any]]:
         if res is None:
@@ -57,15 +575,52 @@ class BaseService:
             return list(res)
         return [res]
 
+    # ------------------ candidate method resolution ------------------
+
+    def _resolution_key(self, names: Tuple[str, ...]) -> Optional[Tuple]:
+        signature = _CLIENT_SIGNATURES.get(self.config)
+        if signature is None:
+            return None
+        return (self.config, signature, names)
+
+    def _ordered_candidates(self, candidates) -> Tuple[list, Tuple[str, ...], Optional[str]]:
+        """Move the previously successful candidate (if any) to the front."""
+        candidates = list(candidates)
+        names = tuple(name for name, _, _ in candidates)
+        key = self._resolution_key(names)
+        with _METHOD_LOCK:
+            resolved = _METHOD_CACHE.get(key) if key else None
+            for idx, (name, _, _) in enumerate(candidates):
+                if name == resolved:
+                    _METHOD_STATS["hits"] += 1
+                    _METHOD_STATS["skipped_calls"] += idx
+                    return [candidates[idx]] + candidates[:idx] + candidates[idx + 1:], names, resolved
+            _METHOD_STATS["misses"] += 1
+        return candidates, names, None
+
+    def _remember_candidate(self, names: Tuple[str, ...], name: str, resolved: Optional[str]) -> None:
+        # Key is computed after the call so it carries the signature of the client that answered
+        key = self._resolution_key(names)
+        if key is None:
+            return
+        with _METHOD_LOCK:
+            if resolved is not None and resolved != name:
+                _METHOD_STATS["invalidations"] += 1
+            _METHOD_CACHE[key] = name
+        if _debug_methods():
+            print(f"[debug] resolved {name} for {list(names)}; stats={method_cache_stats()}")
+
     def _call_list_like(
         self, candidates, keys: Tuple[str, ...]
     ) -> List[Dict[str, Any]]:
         last_err = None
-        if getenv("EGERIA_DEBUG_METHODS", "").lower() in ("1", "true", "yes"):
-            print(f"[debug] trying methods: {[name for name,_,_ in candidates]}")
+        candidates, names, resolved = self._ordered_candidates(candidates)
+        if _debug_methods():
+            print(f"[debug] trying methods: {[name for name,_,_ in candidates]} (cached: {resolved})")
         for name, args, kwargs in candidates:
             try:
                 res = self._invoke(name, args=tuple(args), kwargs=kwargs)
+                self._remember_candidate(names, name, resolved)
                 if getenv("EGERIA_DEBUG_RESULTS", "").lower() in ("1", "true", "yes"):
                     shape = type(res).__name__
                     size = (len(res) if isinstance(res, (list, tuple)) else
@@ -87,9 +642,12 @@ class BaseService:
 
     def _call_first(self, candidates):
         last_err = None
+        candidates, names, resolved = self._ordered_candidates(candidates)
         for name, args, kwargs in candidates:
             try:
-                return self._invoke(name, args=tuple(args), kwargs=kwargs)
+                res = self._invoke(name, args=tuple(args), kwargs=kwargs)
+                self._remember_candidate(names, name, resolved)
+                return res
             except Exception as e:
                 last_err = e
                 continue
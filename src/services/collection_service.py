@@ -8,25 +8,66 @@ This module provides services for the Collections related functions of my_egeria
 
 """
 import os
-import asyncio
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from .base_service import BaseService
+from .projections import COLLECTION_COLUMNS, Projection
+from .records import CollectionRecord
 from utils.config import EgeriaConfig
 
 class CollectionService(BaseService):
     """Wrapper around pyegeria collection functions with token-managed client."""
 
-    def __init__(self, config: Optional[EgeriaConfig] = None, manager=None):
-        super().__init__(config=config, manager=manager)
+    # Cached reads that any collection write makes stale
+    _COLLECTION_READS = ("find_collections", "get_collection", "get_member_list")
+
+    def __init__(self, config: Optional[EgeriaConfig] = None, manager=None, async_manager=None):
+        super().__init__(config=config, manager=manager, async_manager=async_manager)
 
     # ------------------ synchronous API ------------------
 
-    def list_collections(self, search: str = "*") -> List[Dict[str, Any]]:
+    def list_collections(
+        self,
+        search: str = "*",
+        use_cache: bool = True,
+        start_from: int = 0,
+        page_size: Optional[int] = None,
+        columns: Optional[Projection] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Use pyegeria.find_collections with a DICT response.
+        use_cache=False bypasses the response cache (explicit refresh).
+        page_size requests one page starting at start_from; None returns every match.
+        columns limits each collection to the projected fields; None keeps every property.
+        Results also feed the local search index (see search_indexed).
         """
-        res = self._invoke("find_collections", args=(search,), kwargs={"output_format": "DICT"})
-        return self._ensure_list_like(res, keys=("collections", "elements", "results", "items"))
+        res = self._invoke_projected(
+            "find_collections",
+            args=(search,),
+            kwargs={"output_format": "DICT", **self._paging_kwargs(start_from, page_size)},
+            columns=columns,
+            use_cache=use_cache,
+        )
+        collections = self._ensure_list_like(res, keys=("collections", "elements", "results", "items"))
+        if columns:
+            collections = columns.retain(collections)
+        self._index_records("collections", collections, search, start_from, page_size, columns)
+        return collections
+
+    def iter_collections(
+        self,
+        search: str = "*",
+        page_size: Optional[int] = None,
+        use_cache: bool = True,
+        columns: Optional[Projection] = COLLECTION_COLUMNS,
+    ) -> AsyncIterator[List[CollectionRecord]]:
+        """Async iterator over pages of collections (as records), prefetching the next page."""
+        return self._iter_pages(
+            lambda start, size: self.list_collections(
+                search, use_cache=use_cache, start_from=start, page_size=size, columns=columns
+            ),
+            page_size,
+            convert=CollectionRecord.from_list,
+        )
 
     def get_collection_details(self, collection_guid: str) -> Dict[str, Any]:
         if not collection_guid:
@@ -60,29 +101,17 @@ class CollectionService(BaseService):
         Create a collection via:
           create_collection(display_name, description, category, initial_classifications)
         """
-        if not isinstance(payload, dict) or not payload:
-            raise ValueError("payload must be a non-empty dict")
-
-        display_name = payload.get("display_name") or payload.get("name")
-        description = payload.get("description") or payload.get("summary")
-        category = payload.get("category") or payload.get("collection_type")
-        initial_classifications = payload.get("initial_classifications")  # list[str] or None
-
-        missing = []
-        if not display_name:
-            missing.append("display_name")
-        if not description:
-            missing.append("description")
-        if not category:
-            missing.append("category")
-        if missing:
-            raise ValueError(f"Missing required fields: {', '.join(missing)}")
+        display_name, description, category, initial_classifications = self._collection_args(payload)
 
         res = self._invoke(
             "create_collection",
             args=(display_name, description, category, initial_classifications),
             kwargs={},
         )
+        self._invalidate_cached(*self._COLLECTION_READS)
+        self._index_created(
+            "collections", res, {"display_name": display_name, "description": description, "category": category}
+        )
         if isinstance(res, list) and res:
             return res[0]
         if isinstance(res, dict):
@@ -113,9 +142,11 @@ class CollectionService(BaseService):
 
         res = self._invoke(
             "delete_collection",
-            args=(guid),
+            args=(guid,),
             kwargs={},
         )
+        self._invalidate_cached(*self._COLLECTION_READS)
+        self._search_index("collections").remove(guid)
         if isinstance(res, list) and res:
             return res[0]
         if isinstance(res, dict):
@@ -123,43 +154,20 @@ class CollectionService(BaseService):
         return {"result": res}
 
 
-    # ------------------ async API (robust, non-blocking) ------------------
+    # ------------------ async API (native, non-blocking) ------------------
+    # These await pyegeria's _async_* methods on the event loop via BaseService._ainvoke;
+    # a worker thread is used only when the client lacks the async variant.
 
     async def list_collections_async(self, search: str = "*") -> List[Dict[str, Any]]:
-        """
-        Prefer native async; if it is not awaitable or stalls, fall back to sync in a worker thread.
-        """
-        try:
-            res = self._invoke("_async_find_collections", args=(search,), kwargs={"output_format": "DICT"})
-        except Exception:
-            return await asyncio.to_thread(self.list_collections, search)
-
-        try:
-            if asyncio.iscoroutine(res):
-                res = await asyncio.wait_for(res, timeout=8)
-            elif not isinstance(res, (list, dict)):
-                return await asyncio.to_thread(self.list_collections, search)
-        except Exception:
-            return await asyncio.to_thread(self.list_collections, search)
-
-        return self._ensure_list_like(res, keys=("collections", "elements", "results", "items"))
+        res = await self._ainvoke("find_collections", args=(search,), kwargs={"output_format": "DICT"})
+        collections = self._ensure_list_like(res, keys=("collections", "elements", "results", "items"))
+        self._index_records("collections", collections, search)
+        return collections
 
     async def get_collection_details_async(self, collection_guid: str) -> Dict[str, Any]:
         if not collection_guid:
             raise ValueError("collection_guid is required")
-        try:
-            res = self._invoke("_async_get_collection", args=(collection_guid,), kwargs={"output_format": "DICT"})
-        except Exception:
-            return await asyncio.to_thread(self.get_collection_details, collection_guid)
-
-        try:
-            if asyncio.iscoroutine(res):
-                res = await asyncio.wait_for(res, timeout=8)
-            elif not isinstance(res, (list, dict)):
-                return await asyncio.to_thread(self.get_collection_details, collection_guid)
-        except Exception:
-            return await asyncio.to_thread(self.get_collection_details, collection_guid)
-
+        res = await self._ainvoke("get_collection", args=(collection_guid,), kwargs={"output_format": "DICT"})
         if isinstance(res, list) and res:
             return res[0]
         if isinstance(res, dict):
@@ -173,61 +181,29 @@ class CollectionService(BaseService):
     ) -> List[Dict[str, Any]]:
         if not collection_guid:
             raise ValueError("collection_guid is required")
-        try:
-            res = self._invoke(
-                "_async_get_member_list",
-                args=(),
-                kwargs={"collection_guid": collection_guid, "collection_name": None, "collection_qname": None},
-            )
-        except Exception:
-            return await asyncio.to_thread(self.get_collection_members, collection_guid, search)
-
-        try:
-            if asyncio.iscoroutine(res):
-                res = await asyncio.wait_for(res, timeout=8)
-            elif not isinstance(res, (list, dict)):
-                return await asyncio.to_thread(self.get_collection_members, collection_guid, search)
-        except Exception:
-            return await asyncio.to_thread(self.get_collection_members, collection_guid, search)
-
+        res = await self._ainvoke(
+            "get_member_list",
+            args=(),
+            kwargs={"collection_guid": collection_guid, "collection_name": None, "collection_qname": None},
+        )
         return self._ensure_list_like(res, keys=("members", "elements", "results", "items"))
 
-    async def add_collection_async(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        if not isinstance(payload, dict) or not payload:
-            raise ValueError("payload must be a non-empty dict")
-
-        display_name = payload.get("display_name") or payload.get("name")
-        description = payload.get("description") or payload.get("summary")
-        category = payload.get("category") or payload.get("collection_type")
-        initial_classifications = payload.get("initial_classifications")
-
-        missing = []
-        if not display_name:
-            missing.append("display_name")
-        if not description:
-            missing.append("description")
-        if not category:
-            missing.append("category")
-        if missing:
-            raise ValueError(f"Missing required fields: {', '.join(missing)}")
+    async def add_collection_async(self, payload: Dict[str, Any], *, index: bool = True) -> Dict[str, Any]:
+        """Create a collection; index=False leaves it out of the local search index (bulk imports)."""
+        display_name, description, category, initial_classifications = self._collection_args(payload)
 
-        try:
-            res = self._invoke(
-                "_async_create_collection",
-                args=(display_name, description, category, initial_classifications),
-                kwargs={},
+        res = await self._ainvoke(
+            "create_collection",
+            args=(display_name, description, category, initial_classifications),
+            kwargs={},
+        )
+        self._invalidate_cached(*self._COLLECTION_READS)
+        if index:
+            self._index_created(
+                "collections", res, {"display_name": display_name, "description": description, "category": category}
             )
-        except Exception:
-            return await asyncio.to_thread(self.add_collection, payload)
-
-        try:
-            if asyncio.iscoroutine(res):
-                res = await asyncio.wait_for(res, timeout=8)
-            elif not isinstance(res, (list, dict)):
-                return await asyncio.to_thread(self.add_collection, payload)
-        except Exception:
-            return await asyncio.to_thread(self.add_collection, payload)
-
+        else:
+            self._search_index("collections").mark_stale()
         if isinstance(res, list) and res:
             return res[0]
         if isinstance(res, dict):
@@ -235,32 +211,18 @@ class CollectionService(BaseService):
         return {"result": res}
 
     async def delete_collection_async(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if isinstance(payload, str):
+            payload = {"guid": payload}
         if not isinstance(payload, dict) or not payload:
             raise ValueError("payload must be a non-empty dict")
 
         guid = payload.get("guid") or payload.get("collection_guid")
-
-        missing = []
         if not guid:
-            missing.append("guid")
-
-        try:
-            res = self._invoke(
-                "_async_delete_collection",
-                args=(guid),
-                kwargs={},
-            )
-        except Exception:
-            return await asyncio.to_thread(self.delete_collection, guid)
-
-        try:
-            if asyncio.iscoroutine(res):
-                res = await asyncio.wait_for(res, timeout=8)
-            elif not isinstance(res, (list, dict)):
-                return await asyncio.to_thread(self.delete_collection, payload)
-        except Exception:
-            return await asyncio.to_thread(self.delete_collection, payload)
+            raise ValueError("Missing required fields: guid")
 
+        res = await self._ainvoke("delete_collection", args=(guid,), kwargs={})
+        self._invalidate_cached(*self._COLLECTION_READS)
+        self._search_index("collections").remove(guid)
         if isinstance(res, list) and res:
             return res[0]
         if isinstance(res, dict):
@@ -269,6 +231,28 @@ class CollectionService(BaseService):
 
     # ------------------ small helpers ------------------
 
+    @staticmethod
+    def _collection_args(payload: Dict[str, Any]) -> tuple:
+        """create_collection arguments (display_name, description, category, initial_classifications)."""
+        if not isinstance(payload, dict) or not payload:
+            raise ValueError("payload must be a non-empty dict")
+
+        display_name = payload.get("display_name") or payload.get("name")
+        description = payload.get("description") or payload.get("summary")
+        category = payload.get("category") or payload.get("collection_type")
+        initial_classifications = payload.get("initial_classifications")  # list[str] or None
+
+        missing = []
+        if not display_name:
+            missing.append("display_name")
+        if not description:
+            missing.append("description")
+        if not category:
+            missing.append("category")
+        if missing:
+            raise ValueError(f"Missing required fields: {', '.join(missing)}")
+        return display_name, description, category, initial_classifications
+
     def _ensure_list_like(self, res: Any, keys: tuple[str, ...]) -> List[Dict[str, Any]]:
         """
         Normalize various possible list-like shapes to a list[dict].
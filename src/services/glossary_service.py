@@ -13,20 +13,54 @@ import sys
 import importlib
 import logging
 import asyncio
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence
 from .base_service import BaseService
+from .projections import GLOSSARY_COLUMNS, TERM_COLUMNS, Projection
+from .records import GlossaryRecord, TermRecord
 from utils.config import EgeriaConfig
+from utils.executor import run_blocking
+from utils.search_index import record_id
 
 # Placeholder for monkeypatch in tests; real client is provided externally
 class GlossaryAuthorView:  # type: ignore
     pass
 
 
+@dataclass
+class GlossaryTermsResult:
+    """Outcome of fetching one glossary's terms in a fan-out (see get_terms_for_glossaries)."""
+    glossary_guid: str
+    terms: List[TermRecord] = field(default_factory=list)
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class TermCreateResult:
+    """Outcome of creating one term of a bulk create (see add_terms); `index` is its payload's position."""
+    index: int
+    guid: str = ""
+    response: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class GlossaryService(BaseService):
     """Wrapper around pyegeria's glossary/term functions with token-managed client."""
 
-    def __init__(self, config: Optional[EgeriaConfig] = None, manager=None):
-        super().__init__(config=config, manager=manager)
+    # Cached reads made stale by glossary writes and by term writes respectively
+    _GLOSSARY_READS = ("find_glossaries", "find_glossary_terms")
+    _TERM_READS = ("find_glossary_terms",)
+
+    def __init__(self, config: Optional[EgeriaConfig] = None, manager=None, async_manager=None):
+        super().__init__(config=config, manager=manager, async_manager=async_manager)
 
         # Logger for traceability
         self._log = logging.getLogger(__name__)
@@ -87,64 +121,91 @@ class GlossaryService(BaseService):
 
     # --------- sync API ---------
 
-    def list_glossaries(self, search: str = "*") -> List[Dict[str, Any]]:
+    def list_glossaries(
+        self,
+        search: str = "*",
+        use_cache: bool = True,
+        start_from: int = 0,
+        page_size: Optional[int] = None,
+        columns: Optional[Projection] = None,
+    ) -> List[Dict[str, Any]]:
         """
         find_glossaries(search_string='*', ..., output_format='DICT')
         Prefer the monkeypatched GlossaryAuthorView client if present to avoid network latency.
+        use_cache=False bypasses the response cache (explicit refresh).
+        page_size requests one page starting at start_from; None returns every match.
+        columns limits each glossary to the projected fields; None keeps every property.
+        Results also feed the local search index (see search_indexed).
         """
+        retain = columns.retain if columns else (lambda rows: rows)
         client = self._ensure_gclient()
         if client:
+            # The direct client returns everything in one go: that is the first page
+            if page_size is not None and start_from > 0:
+                return []
             if hasattr(client, "get_glossaries"):
                 try:
-                    return self._ensure_list_like(
+                    return retain(self._ensure_list_like(
                         client.get_glossaries(),
                         keys=("glossaries", "elements", "results", "items"),
-                    )
+                    ))
                 except Exception:
                     pass
             if hasattr(client, "find_glossaries"):
                 try:
                     # If the client supports output_format, request DICT; otherwise call with just search
-                    return self._ensure_list_like(
+                    return retain(self._ensure_list_like(
                         client.find_glossaries(search, output_format="DICT"),
                         keys=("glossaries", "elements", "results", "items")
-                    )
+                    ))
                 except TypeError:
-                    return self._ensure_list_like(
+                    return retain(self._ensure_list_like(
                         client.find_glossaries(search),
                         keys=("glossaries", "elements", "results", "items")
-                    )
+                    ))
 
         # Fallback to token-managed client
-        res = self._invoke("find_glossaries", args=(search,), kwargs={"output_format": "DICT"})
-        return self._ensure_list_like(res, keys=("glossaries", "elements", "results", "items"))
+        res = self._invoke_projected(
+            "find_glossaries",
+            args=(search,),
+            kwargs={"output_format": "DICT", **self._paging_kwargs(start_from, page_size)},
+            columns=columns,
+            use_cache=use_cache,
+        )
+        glossaries = retain(self._ensure_list_like(res, keys=("glossaries", "elements", "results", "items")))
+        self._index_records("glossaries", glossaries, search, start_from, page_size, columns)
+        return glossaries
+
+    def iter_glossaries(
+        self,
+        search: str = "*",
+        page_size: Optional[int] = None,
+        use_cache: bool = True,
+        columns: Optional[Projection] = GLOSSARY_COLUMNS,
+    ) -> AsyncIterator[List[GlossaryRecord]]:
+        """Async iterator over pages of glossaries (as records), prefetching the next page."""
+        return self._iter_pages(
+            lambda start, size: self.list_glossaries(
+                search, use_cache=use_cache, start_from=start, page_size=size, columns=columns
+            ),
+            page_size,
+            convert=GlossaryRecord.from_list,
+        )
 
 
     def add_glossary(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
         create_glossary(display_name, description, language='English', usage=None)
         """
-        if not isinstance(payload, dict) or not payload:
-            raise ValueError("payload must be a non-empty dict")
-
-        display_name = payload.get("display_name") or payload.get("name")
-        description = payload.get("description")
-        language = payload.get("language", "English")
-        usage = payload.get("usage")
-
-        missing = []
-        if not display_name:
-            missing.append("display_name")
-        if not description:
-            missing.append("description")
-        if missing:
-            raise ValueError(f"Missing required fields: {', '.join(missing)}")
+        display_name, description, language, usage = self._glossary_args(payload)
 
         res = self._invoke(
             "create_glossary",
             args=(display_name, description, language, usage),
             kwargs={},
         )
+        self._invalidate_cached(*self._GLOSSARY_READS)
+        self._index_created("glossaries", res, {"display_name": display_name, "description": description})
         if isinstance(res, list) and res:
             return res[0]
         if isinstance(res, dict):
@@ -159,23 +220,70 @@ class GlossaryService(BaseService):
             raise ValueError("glossary_guid is required")
 
         res = self._invoke("delete_glossary", args=(glossary_guid,), kwargs={"cascade": cascade})
+        self._invalidate_cached(*self._GLOSSARY_READS)
+        self._unindex_glossary(glossary_guid, cascade)
         if isinstance(res, dict):
             return bool(res.get("success", True))
         return True if res is None else bool(res)
 
-    def get_terms(self, search: str = "", glossary_guid: str = None) -> List[Dict[str, Any]]:
+    def get_terms(
+        self,
+        search: str = "",
+        glossary_guid: str = None,
+        use_cache: bool = True,
+        start_from: int = 0,
+        page_size: Optional[int] = None,
+        columns: Optional[Projection] = None,
+    ) -> List[Dict[str, Any]]:
         """
         List terms across all glossaries using:
           find_glossary_terms(search_string, glossary_guid=None, output_format="DICT")
+        page_size requests one page starting at start_from; None returns every match.
+        columns limits each term to the projected fields; None keeps every property.
+        Results across all glossaries also feed the local search index (see search_indexed).
         """
-        res = self._invoke(
+        res = self._invoke_projected(
             "find_glossary_terms",
             args=((search or "*"),),
-            kwargs={"glossary_guid": glossary_guid, "output_format": "DICT"},
+            kwargs={
+                "glossary_guid": glossary_guid,
+                "output_format": "DICT",
+                **self._paging_kwargs(start_from, page_size),
+            },
+            columns=columns,
+            use_cache=use_cache,
         )
-        return self._ensure_list_like(
+        terms = self._ensure_list_like(
             res, keys=("terms", "elements", "results", "items")
         )
+        if columns:
+            terms = columns.retain(terms)
+        if glossary_guid is None:
+            # Only unscoped results: a wildcard listing of one glossary isn't every term
+            self._index_records("terms", terms, search or "*", start_from, page_size, columns)
+        return terms
+
+    def iter_terms(
+        self,
+        search: str = "",
+        glossary_guid: str = None,
+        page_size: Optional[int] = None,
+        use_cache: bool = True,
+        columns: Optional[Projection] = TERM_COLUMNS,
+    ) -> AsyncIterator[List[TermRecord]]:
+        """Async iterator over pages of terms (optionally of one glossary) as records, prefetching the next page."""
+        return self._iter_pages(
+            lambda start, size: self.get_terms(
+                search,
+                glossary_guid=glossary_guid,
+                use_cache=use_cache,
+                start_from=start,
+                page_size=size,
+                columns=columns,
+            ),
+            page_size,
+            convert=TermRecord.from_list,
+        )
 
     def add_term(self, glossary_guid: str, payload: Dict[str, Any]) -> Dict[str, Any]:
 
@@ -189,58 +297,11 @@ class GlossaryService(BaseService):
         """
         if not glossary_guid:
             raise ValueError("glossary_guid is required")
-        if not isinstance(payload, dict) or not payload:
-            raise ValueError("payload must be a non-empty dict")
-
-        # If the caller already passed a 'body' with elementProperties, use it untouched.
-        if "elementProperties" in payload or payload.get("class") == "ReferenceableRequestBody":
-            body = payload
-        else:
-            display_name = payload.get("display_name") or payload.get("name")
-            if not display_name:
-                raise ValueError("display_name is required to create a term")
-
-            # Optional fields
-            summary = payload.get("summary")
-            description = payload.get("description")
-            abbreviation = payload.get("abbreviation")
-            examples = payload.get("examples")
-            usage = payload.get("usage")
-            publish_version_identifier = (
-                payload.get("publishVersionIdentifier")
-                or payload.get("version_identifier")
-            )
-            aliases = payload.get("aliases") or []
-            additional_props = payload.get("additionalProperties") or payload.get("additional_properties") or {}
-
-            # Build API body
-            body = {
-                "class": "ReferenceableRequestBody",
-                "elementProperties": {
-                    "class": "GlossaryTermProperties",
-                    "qualifiedName": f"GlossaryTerm: {display_name} : {{$isoTimestamp}}",
-                    "displayName": display_name,
-                    "aliases": aliases,
-                },
-                "initialStatus": payload.get("initialStatus", "DRAFT"),
-            }
-            ep = body["elementProperties"]
-            if summary is not None:
-                ep["summary"] = summary
-            if description is not None:
-                ep["description"] = description
-            if abbreviation is not None:
-                ep["abbreviation"] = abbreviation
-            if examples is not None:
-                ep["examples"] = examples
-            if usage is not None:
-                ep["usage"] = usage
-            if publish_version_identifier is not None:
-                ep["publishVersionIdentifier"] = publish_version_identifier
-            if additional_props:
-                ep["additionalProperties"] = additional_props
+        body = self._build_term_body(payload)
 
         res = self._invoke("create_controlled_glossary_term", args=(glossary_guid, body), kwargs={})
+        self._invalidate_cached(*self._TERM_READS)
+        self._index_created("terms", res, self._term_record(body))
         if isinstance(res, list) and res:
             return res[0]
         if isinstance(res, dict):
@@ -255,11 +316,15 @@ class GlossaryService(BaseService):
             args=(term_guid,),
             kwargs={"for_lineage": for_lineage, "for_duplicate_processing": for_duplicate_processing},
         )
+        self._invalidate_cached(*self._TERM_READS)
+        self._search_index("terms").remove(term_guid)
         if isinstance(res, dict):
             return bool(res.get("success", True))
         return True if res is None else bool(res)
 
-    # --------- async wrappers for UI ---------
+    # --------- async API for UI ---------
+    # Awaited natively via BaseService._ainvoke; a worker thread is used only when the
+    # client has no _async_* variant of the method.
 
     async def list_glossaries_async(self, search: str = "*"):
         """
@@ -270,63 +335,38 @@ class GlossaryService(BaseService):
         if client and hasattr(client, "_async_find_glossaries"):
             try:
                 res = client._async_find_glossaries(search, output_format="DICT")
-                res = await (res if asyncio.iscoroutine(res) else asyncio.to_thread(lambda: res))
+                res = await res if asyncio.iscoroutine(res) else res
                 return self._ensure_list_like(res, keys=("glossaries", "elements", "results", "items"))
             except Exception:
                 # If the client exists but async path fails, try the client's sync path in a worker thread
                 try:
-                    res = await asyncio.to_thread(client.find_glossaries, search)
+                    res = await run_blocking(client.find_glossaries, search, platform=self.config.platform_url)
                     return self._ensure_list_like(res, keys=("glossaries", "elements", "results", "items"))
                 except Exception:
                     pass  # fall through to manager fallback
 
-        # Manager-based async path with non-blocking fallback
-        try:
-            res = self._invoke("_async_find_glossaries", args=(search,), kwargs={"output_format": "DICT"})
-            if asyncio.iscoroutine(res):
-                res = await asyncio.wait_for(res, timeout=8)
-            elif not isinstance(res, (list, dict)):
-                return await asyncio.to_thread(self.list_glossaries, search)
-        except Exception:
-            return await asyncio.to_thread(self.list_glossaries, search)
-
-        return self._ensure_list_like(res, keys=("glossaries", "elements", "results", "items"))
-
-
-    async def add_glossary_async(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        if not isinstance(payload, dict) or not payload:
-            raise ValueError("payload must be a non-empty dict")
-
-        display_name = payload.get("display_name") or payload.get("name")
-        description = payload.get("description")
-        language = payload.get("language", "English")
-        usage = payload.get("usage")
+        # Token-managed client, awaited natively on the event loop
+        res = await self._ainvoke("find_glossaries", args=(search,), kwargs={"output_format": "DICT"})
+        glossaries = self._ensure_list_like(res, keys=("glossaries", "elements", "results", "items"))
+        self._index_records("glossaries", glossaries, search)
+        return glossaries
 
-        missing = []
-        if not display_name:
-            missing.append("display_name")
-        if not description:
-            missing.append("description")
-        if missing:
-            raise ValueError(f"Missing required fields: {', '.join(missing)}")
 
-        try:
-            res = self._invoke(
-                "_async_create_glossary",
-                args=(display_name, description, language, usage),
-                kwargs={},
-            )
-        except Exception:
-            return await asyncio.to_thread(self.add_glossary, payload)
+    async def add_glossary_async(self, payload: Dict[str, Any], *, index: bool = True) -> Dict[str, Any]:
+        """Create a glossary; index=False leaves it out of the local search index (bulk imports)."""
+        display_name, description, language, usage = self._glossary_args(payload)
 
-        try:
-            if asyncio.iscoroutine(res):
-                res = await asyncio.wait_for(res, timeout=8)
-            elif not isinstance(res, (list, dict)):
-                return await asyncio.to_thread(self.add_glossary, payload)
-        except Exception:
-            return await asyncio.to_thread(self.add_glossary, payload)
+        res = await self._ainvoke(
+            "create_glossary",
+            args=(display_name, description, language, usage),
+            kwargs={},
+        )
 
+        self._invalidate_cached(*self._GLOSSARY_READS)
+        if index:
+            self._index_created("glossaries", res, {"display_name": display_name, "description": description})
+        else:
+            self._search_index("glossaries").mark_stale()
         if isinstance(res, list) and res:
             return res[0]
         if isinstance(res, dict):
@@ -337,55 +377,205 @@ class GlossaryService(BaseService):
         if not glossary_guid:
             raise ValueError("glossary_guid is required")
 
-        try:
-            res = self._invoke("_async_delete_glossary", args=(glossary_guid,), kwargs={"cascade": cascade})
-        except Exception:
-            return await asyncio.to_thread(self.delete_glossary, glossary_guid, cascade)
-
-        try:
-            if asyncio.iscoroutine(res):
-                res = await asyncio.wait_for(res, timeout=8)
-            elif not isinstance(res, (dict, type(None), bool)):
-                return await asyncio.to_thread(self.delete_glossary, glossary_guid, cascade)
-        except Exception:
-            return await asyncio.to_thread(self.delete_glossary, glossary_guid, cascade)
+        res = await self._ainvoke("delete_glossary", args=(glossary_guid,), kwargs={"cascade": cascade})
 
+        self._invalidate_cached(*self._GLOSSARY_READS)
+        self._unindex_glossary(glossary_guid, cascade)
         if isinstance(res, dict):
             return bool(res.get("success", True))
         return True if res is None else bool(res)
 
-    async def get_glossary_terms_async(self, glossary_guid: str, search: str = ""):
+    async def get_glossary_terms_async(
+        self, glossary_guid: str, search: str = "", columns: Optional[Projection] = None
+    ):
         if not glossary_guid:
             raise ValueError("glossary_guid is required")
 
-        try:
-            res = self._invoke(
-                "_async_find_glossary_terms",
-                args=(search or "*",),
-                kwargs={"glossary_guid": glossary_guid, "output_format": "DICT"},
-            )
-        except Exception:
-            return await asyncio.to_thread(self.get_terms, glossary_guid, search)
-
-        try:
-            if asyncio.iscoroutine(res):
-                res = await asyncio.wait_for(res, timeout=8)
-            elif not isinstance(res, (list, dict)):
-                return await asyncio.to_thread(self.get_terms, glossary_guid, search)
-        except Exception:
-            return await asyncio.to_thread(self.get_terms, glossary_guid, search)
+        # Same arguments as get_terms, so both paths share cached responses
+        res = await self._ainvoke_projected(
+            "find_glossary_terms",
+            args=(search or "*",),
+            kwargs={"glossary_guid": glossary_guid, "output_format": "DICT"},
+            columns=columns,
+        )
 
-        return self._ensure_list_like(
+        terms = self._ensure_list_like(
             res, keys=("terms", "elements", "results", "items")
         )
+        return columns.retain(terms) if columns else terms
 
     async def add_term_async(self, glossary_guid: str, payload: Dict[str, Any]):
         if not glossary_guid:
             raise ValueError("glossary_guid is required")
+        body = self._build_term_body(payload)
+
+        res = await self._ainvoke("create_controlled_glossary_term", args=(glossary_guid, body), kwargs={})
+
+        self._invalidate_cached(*self._TERM_READS)
+        self._index_created("terms", res, self._term_record(body))
+        if isinstance(res, list) and res:
+            return res[0]
+        if isinstance(res, dict):
+            return res
+        return {"result": res}
+
+    async def delete_term_async(self, term_guid: str, *, for_lineage: bool = False, for_duplicate_processing: bool = False):
+        if not term_guid:
+            raise ValueError("term_guid is required")
+
+        res = await self._ainvoke(
+            "delete_term",
+            args=(term_guid,),
+            kwargs={"for_lineage": for_lineage, "for_duplicate_processing": for_duplicate_processing},
+        )
+
+        self._invalidate_cached(*self._TERM_READS)
+        self._search_index("terms").remove(term_guid)
+        if isinstance(res, dict):
+            return bool(res.get("success", True))
+        return True if res is None else bool(res)
+
+    # --------- fan-out across glossaries ---------
+
+    async def get_terms_for_glossaries(
+        self,
+        glossary_guids: Iterable[str],
+        search: str = "*",
+        max_concurrency: int = 8,
+        columns: Optional[Projection] = TERM_COLUMNS,
+    ) -> AsyncIterator[GlossaryTermsResult]:
+        """
+        Fetch the terms of many glossaries in parallel, with at most `max_concurrency`
+        requests in flight, yielding one GlossaryTermsResult per glossary in completion
+        order. A failing glossary yields a result carrying its error instead of
+        aborting the others.
+        """
+        guids = [g for g in dict.fromkeys(glossary_guids) if g]
+        if not guids:
+            return
+        gate = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _fetch(guid: str) -> GlossaryTermsResult:
+            async with gate:
+                try:
+                    terms = await self.get_glossary_terms_async(guid, search=search or "*", columns=columns)
+                    return GlossaryTermsResult(guid, TermRecord.from_list(terms))
+                except Exception as e:
+                    return GlossaryTermsResult(guid, error=e)
+
+        tasks = [asyncio.create_task(_fetch(g)) for g in guids]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early (or was cancelled): don't leave fetches running
+            for t in tasks:
+                t.cancel()
+
+    # --------- bulk create ---------
+
+    async def add_terms(
+        self,
+        glossary_guid: str,
+        payloads: Sequence[Dict[str, Any]],
+        concurrency: int = 16,
+        chunk_size: int = 200,
+        resume: Optional[Sequence[TermCreateResult]] = None,
+        index: bool = True,
+    ) -> List[TermCreateResult]:
+        """
+        Create many terms in a glossary, with at most `concurrency` requests in flight.
+        Payloads take the same shapes as add_term; all are validated and turned into
+        request bodies before anything is sent, and an invalid one gets a result carrying
+        its ValueError instead of stopping the rest. Terms are sent `chunk_size` at a time,
+        and cached term reads are invalidated once per chunk rather than once per term.
+
+        Returns one TermCreateResult per payload, in payload order. To retry after partial
+        failures, call again with the same payloads and resume=<the previous results>:
+        terms created already are not sent again. index=False leaves the new terms out
+        of the local search index, so an import of millions doesn't grow it without bound;
+        the index then stops answering searches until the next full listing.
+        """
+        if not glossary_guid:
+            raise ValueError("glossary_guid is required")
+        results: List[Optional[TermCreateResult]] = [None] * len(payloads)
+        for previous in resume or ():
+            if previous.ok and 0 <= previous.index < len(results):
+                results[previous.index] = previous
+
+        pending: List[tuple] = []
+        for i, payload in enumerate(payloads):
+            if results[i] is not None:
+                continue
+            try:
+                pending.append((i, self._build_term_body(payload)))
+            except ValueError as e:
+                results[i] = TermCreateResult(i, error=e)
+
+        gate = asyncio.Semaphore(max(1, concurrency))
+
+        async def _create(position: int, body: Dict[str, Any]) -> TermCreateResult:
+            async with gate:
+                try:
+                    res = await self._ainvoke(
+                        "create_controlled_glossary_term", args=(glossary_guid, body), kwargs={}
+                    )
+                except Exception as e:
+                    return TermCreateResult(position, error=e)
+            if index:
+                self._index_created("terms", res, self._term_record(body))
+            if isinstance(res, list) and res:
+                res = res[0]
+            guid = res if isinstance(res, str) else (record_id(res) if isinstance(res, dict) else "")
+            return TermCreateResult(position, guid=guid, response=res)
+
+        step = max(1, chunk_size)
+        for start in range(0, len(pending), step):
+            tasks = [asyncio.create_task(_create(i, body)) for i, body in pending[start:start + step]]
+            try:
+                for result in await asyncio.gather(*tasks):
+                    results[result.index] = result
+            finally:
+                # Cancelled mid-chunk: don't leave creates running
+                for t in tasks:
+                    t.cancel()
+                self._invalidate_cached(*self._TERM_READS)
+                if not index:
+                    self._search_index("terms").mark_stale()
+        return results  # type: ignore[return-value]
+
+    # ------------------ helpers ------------------
+
+    @staticmethod
+    def _glossary_args(payload: Dict[str, Any]) -> tuple:
+        """create_glossary arguments (display_name, description, language, usage) for `payload`."""
         if not isinstance(payload, dict) or not payload:
             raise ValueError("payload must be a non-empty dict")
 
-        # Build body same as sync method
+        display_name = payload.get("display_name") or payload.get("name")
+        description = payload.get("description")
+        language = payload.get("language", "English")
+        usage = payload.get("usage")
+
+        missing = []
+        if not display_name:
+            missing.append("display_name")
+        if not description:
+            missing.append("description")
+        if missing:
+            raise ValueError(f"Missing required fields: {', '.join(missing)}")
+        return display_name, description, language, usage
+
+    @staticmethod
+    def _build_term_body(payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        The create_controlled_glossary_term body for `payload`: either a full body (with
+        elementProperties) passed through untouched, or a simple payload with display_name,
+        summary, description, etc., which is converted.
+        """
+        if not isinstance(payload, dict) or not payload:
+            raise ValueError("payload must be a non-empty dict")
+        # If the caller already passed a 'body' with elementProperties, use it untouched.
         if "elementProperties" in payload or payload.get("class") == "ReferenceableRequestBody":
             body = payload
         else:
@@ -393,6 +583,7 @@ class GlossaryService(BaseService):
             if not display_name:
                 raise ValueError("display_name is required to create a term")
 
+            # Optional fields
             summary = payload.get("summary")
             description = payload.get("description")
             abbreviation = payload.get("abbreviation")
@@ -405,6 +596,7 @@ class GlossaryService(BaseService):
             aliases = payload.get("aliases") or []
             additional_props = payload.get("additionalProperties") or payload.get("additional_properties") or {}
 
+            # Build API body
             body = {
                 "class": "ReferenceableRequestBody",
                 "elementProperties": {
@@ -430,48 +622,19 @@ class GlossaryService(BaseService):
                 ep["publishVersionIdentifier"] = publish_version_identifier
             if additional_props:
                 ep["additionalProperties"] = additional_props
-
-        try:
-            res = self._invoke(
-                "_async_create_controlled_glossary_term", args=(glossary_guid, body), kwargs={}
-            )
-        except Exception:
-            return await asyncio.to_thread(self.add_term, glossary_guid, payload)
-
-        if asyncio.iscoroutine(res):
-            res = await res
-        elif not isinstance(res, (list, dict)):
-            return await asyncio.to_thread(self.add_term, glossary_guid, payload)
-
-        if isinstance(res, list) and res:
-            return res[0]
-        if isinstance(res, dict):
-            return res
-        return {"result": res}
-
-    async def delete_term_async(self, term_guid: str, *, for_lineage: bool = False, for_duplicate_processing: bool = False):
-        if not term_guid:
-            raise ValueError("term_guid is required")
-
-        try:
-            res = self._invoke(
-                "_async_delete_term",
-                args=(term_guid,),
-                kwargs={"for_lineage": for_lineage, "for_duplicate_processing": for_duplicate_processing},
-            )
-        except Exception:
-            return await asyncio.to_thread(self.delete_term, term_guid, for_lineage=for_lineage, for_duplicate_processing=for_duplicate_processing)
-
-        if asyncio.iscoroutine(res):
-            res = await res
-        elif not isinstance(res, (dict, type(None), bool)):
-            return await asyncio.to_thread(self.delete_term, term_guid, for_lineage=for_lineage, for_duplicate_processing=for_duplicate_processing)
-
-        if isinstance(res, dict):
-            return bool(res.get("success", True))
-        return True if res is None else bool(res)
-
-    # ------------------ helpers ------------------
+        return body
+
+    def _unindex_glossary(self, glossary_guid: str, cascade: bool) -> None:
+        self._search_index("glossaries").remove(glossary_guid)
+        if cascade:
+            # Its terms went with it, and the index doesn't know which terms those were
+            self._search_index("terms").clear()
+
+    @staticmethod
+    def _term_record(body: Dict[str, Any]) -> Dict[str, Any]:
+        """Searchable fields of a new term, from its create_controlled_glossary_term body."""
+        props = body.get("elementProperties") or {}
+        return {k: props.get(k) for k in ("displayName", "summary", "description", "aliases")}
 
     def _ensure_list_like(self, res: Any, keys: tuple[str, ...]) -> List[Dict[str, Any]]:
         if isinstance(res, list):
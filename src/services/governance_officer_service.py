@@ -8,15 +8,16 @@ This module provides services for the Governance Officer related functions of my
 
 """
 import asyncio
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from .base_service import BaseService
+from .projections import GOVERNANCE_DEFINITION_COLUMNS, Projection
+from .records import GovernanceDefinitionRecord
 from utils.config import EgeriaConfig
 
 
 class GovernanceOfficerService(BaseService):
     def __init__(self, config: Optional[EgeriaConfig] = None, manager=None):
         super().__init__(config=config, manager=manager)
-        self.config = config
         self.definition_guid:str = ""
 
     def display_glossaries(self, search_string:str = "*") -> List[Dict[str, Any]]:
@@ -29,6 +30,28 @@ class GovernanceOfficerService(BaseService):
         self.payload = payload
         return self.manager.get_collections_by_name(self.payload)
 
+    def get_collection(self, collection_guid: str) -> Dict[str, Any]:
+        """Details of one collection (used to identify a marketplace root)."""
+        if not collection_guid:
+            raise ValueError("collection_guid is required")
+        res = self._invoke("get_collection", args=(collection_guid,), kwargs={"output_format": "DICT"})
+        if isinstance(res, list) and res:
+            return res[0]
+        if isinstance(res, dict):
+            return res
+        raise ConnectionError("Failed to retrieve collection details (unexpected response shape).")
+
+    def get_collection_members(self, collection_guid: str) -> List[Dict[str, Any]]:
+        """Direct members of one collection; the marketplace tree calls this per expanded node."""
+        if not collection_guid:
+            raise ValueError("collection_guid is required")
+        res = self._invoke(
+            "get_member_list",
+            args=(),
+            kwargs={"collection_guid": collection_guid, "collection_name": None, "collection_qname": None},
+        )
+        return [m for m in self._normalize_list(res, keys=("members", "elements", "results", "items")) if isinstance(m, dict)]
+
     def create_governance_definition(self, payload):
         # return self.config.manager.create_governance_definition(self.definition_guid)
         pass
@@ -38,21 +61,49 @@ class GovernanceOfficerService(BaseService):
     def update_governance_definition(self, payload):
         # return self.config.manager.update_governance_definition(self.definition_guid)
         pass
-    def find_governance_definitions(self, search: str = "*") -> List[Dict[str, Any]]:
+    def find_governance_definitions(
+        self,
+        search: str = "*",
+        use_cache: bool = True,
+        start_from: int = 0,
+        page_size: Optional[int] = None,
+        columns: Optional[Projection] = GOVERNANCE_DEFINITION_COLUMNS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Governance definitions (collections, for now) matching `search`, as DICT rows.
+        Only the `columns` fields are requested and kept; columns=None returns full elements
+        with their classifications and members.
+        """
         # need those collections with digital product in their collection name
-        # move to Dan's new method of handing him a list with what output columns are needed
-        output_struct: list = [
-            "collection_name",
-            "collection_qname",
-            "collection_guid",
-            "collection_category",
-            "initial_classifications",
-            "members"]
-        res = self._invoke("find_collections", args=(search,), kwargs={"output_format": "DICT"})
-        # res = self._invoke("find_collections", args=(search,), kwargs={"output_format": "DICT", "output_format_set" : {output_struct}})
-        # return self.config.manager.find_governance_definition(res)
-        # return self._ensure_list_like(res, keys=("collection_name", "collection_qname", "collection_guid", "collection_type", "initial_classifications", "members"))
-        return res
+        res = self._invoke_projected(
+            "find_collections",
+            args=(search,),
+            kwargs={"output_format": "DICT", **self._paging_kwargs(start_from, page_size)},
+            columns=columns,
+            use_cache=use_cache,
+        )
+        if columns is None:
+            return res
+        return columns.retain(self._normalize_list(res, keys=("collections", "elements", "results", "items")))
+
+    def iter_governance_definitions(
+        self,
+        search: str = "*",
+        page_size: Optional[int] = None,
+        use_cache: bool = True,
+        columns: Optional[Projection] = GOVERNANCE_DEFINITION_COLUMNS,
+    ) -> AsyncIterator[List[GovernanceDefinitionRecord]]:
+        """Async iterator over pages of governance definitions (as records), prefetching the next page."""
+        return self._iter_pages(
+            lambda start, size: self._normalize_list(
+                self.find_governance_definitions(
+                    search, use_cache=use_cache, start_from=start, page_size=size, columns=columns
+                ),
+                keys=("collections", "elements", "results", "items"),
+            ),
+            page_size,
+            convert=GovernanceDefinitionRecord.from_list,
+        )
 
     # def _ensure_list_like(self, res: Any, keys: tuple[str, ...]) -> List[Dict[str, Any]]:
     #     """
@@ -0,0 +1,318 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides the streaming bulk import of glossaries, terms and collections for my_egeria.
+
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import os
+import re
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .collection_service import CollectionService
+from .glossary_service import GlossaryService
+from .records import FIELD_KEYS
+from utils.config import EgeriaConfig
+from utils.import_source import ImportCheckpoint, SourceRow, read_rows, source_format
+
+KINDS = ("glossaries", "terms", "collections")
+
+# The find call listing existing records of each kind by name
+_FIND_METHODS = {"glossaries": "find_glossaries", "terms": "find_glossary_terms", "collections": "find_collections"}
+_LIST_KEYS = ("glossaries", "terms", "collections", "elements", "results", "items")
+
+# Records validated and written together, then checkpointed (EGERIA_IMPORT_BATCH_SIZE)
+BATCH_SIZE = int(os.getenv("EGERIA_IMPORT_BATCH_SIZE", "200"))
+# Creates in flight at once (EGERIA_IMPORT_CONCURRENCY)
+CONCURRENCY = int(os.getenv("EGERIA_IMPORT_CONCURRENCY", "8"))
+
+
+@dataclass
+class ImportProgress:
+    """Counts of an import so far; passed to on_progress after every batch."""
+
+    source: str
+    kind: str
+    rows: int = 0
+    created: int = 0
+    invalid: int = 0
+    failed: int = 0
+    bytes_read: int = 0
+    total_bytes: int = 0
+    done: bool = False
+
+    @property
+    def fraction(self) -> float:
+        return min(1.0, self.bytes_read / self.total_bytes) if self.total_bytes else 1.0
+
+
+def checkpoint_path_for(path: str) -> str:
+    return f"{path}.checkpoint.json"
+
+
+def errors_path_for(path: str) -> str:
+    """Rejected records, as JSONL that can be fixed and imported again."""
+    return f"{path}.errors.jsonl"
+
+
+class _Writer:
+    """Validates records with the owning service's payload rules and creates them."""
+
+    def __init__(self, kind: str, config: Optional[EgeriaConfig], glossary_guid: Optional[str], concurrency: int):
+        self.kind = kind
+        self.service = CollectionService(config=config) if kind == "collections" else GlossaryService(config=config)
+        self.glossary_guid = glossary_guid
+        self.concurrency = max(1, concurrency)
+
+    def validate(self, data: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """(glossary GUID for terms, payload); raises ValueError as the add_* methods would."""
+        if self.kind == "glossaries":
+            self.service._glossary_args(data)
+            return "", data
+        if self.kind == "collections":
+            self.service._collection_args(data)
+            return "", data
+        glossary_guid = data.get("glossary_guid") or self.glossary_guid
+        if not glossary_guid:
+            raise ValueError("glossary_guid is required (a column, or the import's default glossary)")
+        return glossary_guid, self.service._build_term_body(data)
+
+    async def write(self, batch: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[Exception]]:
+        """Create a batch of validated records; the error of each, or None when created."""
+        if self.kind == "terms":
+            return await self._write_terms(batch)
+        create = self.service.add_collection_async if self.kind == "collections" else self.service.add_glossary_async
+        gate = asyncio.Semaphore(self.concurrency)
+
+        async def _create(payload: Dict[str, Any]) -> Optional[Exception]:
+            async with gate:
+                try:
+                    await create(payload, index=False)
+                    return None
+                except Exception as e:
+                    return e
+
+        return list(await asyncio.gather(*(_create(payload) for _, payload in batch)))
+
+    async def _write_terms(self, batch: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[Exception]]:
+        errors: List[Optional[Exception]] = [None] * len(batch)
+        by_glossary: Dict[str, List[int]] = {}
+        for i, (glossary_guid, _) in enumerate(batch):
+            by_glossary.setdefault(glossary_guid, []).append(i)
+        for glossary_guid, positions in by_glossary.items():
+            results = await self.service.add_terms(
+                glossary_guid,
+                [batch[i][1] for i in positions],
+                concurrency=self.concurrency,
+                chunk_size=len(positions),
+                index=False,
+            )
+            for i, result in zip(positions, results):
+                errors[i] = result.error
+        return errors
+
+    async def existing(self, batch: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Whether each validated record is already on the server (True/False), or the
+        lookup's error. Used for a batch an interrupted import may have partly written.
+        """
+        gate = asyncio.Semaphore(self.concurrency)
+
+        async def _exists(glossary_guid: str, payload: Dict[str, Any]) -> Any:
+            display_name, qualified_name = self._names(payload)
+            kwargs: Dict[str, Any] = {"output_format": "DICT"}
+            if self.kind == "terms":
+                kwargs["glossary_guid"] = glossary_guid
+            async with gate:
+                try:
+                    res = await self.service._ainvoke(
+                        _FIND_METHODS[self.kind], args=(re.escape(display_name),), kwargs=kwargs, use_cache=False
+                    )
+                except Exception as e:
+                    return e
+            if qualified_name:
+                wanted, keys = qualified_name, FIELD_KEYS["qualified_name"]
+            else:
+                wanted, keys = display_name, FIELD_KEYS["display_name"]
+            return any(
+                isinstance(r, dict) and any(r.get(k) == wanted for k in keys)
+                for r in self.service._ensure_list_like(res, keys=_LIST_KEYS)
+            )
+
+        return list(await asyncio.gather(*(_exists(g, payload) for g, payload in batch)))
+
+    def _names(self, payload: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        # (display name, qualified name when the record fixes one rather than letting the server template it)
+        if self.kind == "terms":
+            props = payload.get("elementProperties") or {}
+            display_name, qualified_name = props.get("displayName"), props.get("qualifiedName")
+        else:
+            display_name = payload.get("display_name") or payload.get("name")
+            qualified_name = payload.get("qualified_name")
+        if qualified_name and "{$" in str(qualified_name):
+            qualified_name = None
+        return str(display_name), qualified_name
+
+
+async def import_metadata(
+    path: str,
+    kind: str,
+    fmt: Optional[str] = None,
+    glossary_guid: Optional[str] = None,
+    batch_size: int = BATCH_SIZE,
+    concurrency: int = CONCURRENCY,
+    checkpoint_path: Optional[str] = None,
+    errors_path: Optional[str] = None,
+    restart: bool = False,
+    on_progress: Optional[Callable[[ImportProgress], Any]] = None,
+    config: Optional[EgeriaConfig] = None,
+) -> ImportProgress:
+    """
+    Stream `path` (CSV or JSONL) into Egeria as `kind` records ('glossaries', 'terms' or
+    'collections'). Records are read one at a time and written `batch_size` at a time,
+    at most `concurrency` in flight, so memory doesn't grow with the file. Terms go to
+    their row's glossary_guid, or to `glossary_guid`.
+
+    Invalid and failed records are appended, with their row number and error, to
+    `errors_path`. After each batch the position is saved to `checkpoint_path`; running
+    the same import again resumes from there unless `restart` is set or the file has
+    changed since. Records of a batch interrupted part way are looked up by name on
+    resume and only those not on the server yet are sent again.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unknown import kind {kind!r}; expected one of {', '.join(KINDS)}")
+    fmt = source_format(path, fmt)
+    source = os.path.abspath(path)
+    checkpoint_path = checkpoint_path or checkpoint_path_for(path)
+    errors_path = errors_path or errors_path_for(path)
+
+    stat = os.stat(path)
+    checkpoint = None if restart else ImportCheckpoint.load(checkpoint_path)
+    if checkpoint is None or not checkpoint.resumes(source, kind, stat):
+        checkpoint = ImportCheckpoint(source, kind, size=stat.st_size, mtime=stat.st_mtime)
+        if os.path.exists(errors_path):
+            os.remove(errors_path)
+    progress = ImportProgress(
+        source,
+        kind,
+        rows=checkpoint.rows,
+        created=checkpoint.created,
+        invalid=checkpoint.invalid,
+        failed=checkpoint.failed,
+        bytes_read=checkpoint.offset,
+        total_bytes=stat.st_size,
+        done=checkpoint.done,
+    )
+    if checkpoint.done:
+        await _report(on_progress, progress)
+        return progress
+
+    writer = _Writer(kind, config, glossary_guid, concurrency)
+    batch: List[SourceRow] = []
+
+    with open(errors_path, "a", encoding="utf-8") as errors:
+
+        async def flush(offset: int) -> None:
+            # Saved before any write: a resume looks up records before `pending` instead of resending them
+            _checkpoint(checkpoint, progress, progress.bytes_read, max(offset, checkpoint.pending)).save(
+                checkpoint_path
+            )
+            valid: List[Tuple[SourceRow, Tuple[str, Dict[str, Any]]]] = []
+            for row in batch:
+                error = row.error
+                if error is None:
+                    try:
+                        valid.append((row, writer.validate(row.data)))
+                        continue
+                    except ValueError as e:
+                        error = str(e)
+                _reject(errors, row, error)
+                progress.invalid += 1
+            if valid and valid[0][0].offset <= checkpoint.pending:
+                valid = await _skip_existing(writer, valid, checkpoint.pending, errors, progress)
+            outcomes = await writer.write([prepared for _, prepared in valid]) if valid else []
+            for (row, _), error in zip(valid, outcomes):
+                if error is None:
+                    progress.created += 1
+                else:
+                    _reject(errors, row, f"{type(error).__name__}: {error}")
+                    progress.failed += 1
+            # Rejections must be on disk before the checkpoint moves past them
+            errors.flush()
+            progress.rows += len(batch)
+            progress.bytes_read = offset
+            batch.clear()
+            _checkpoint(checkpoint, progress, offset, checkpoint.pending).save(checkpoint_path)
+            await _report(on_progress, progress)
+
+        for row in read_rows(path, fmt, offset=checkpoint.offset, number=checkpoint.rows):
+            batch.append(row)
+            if len(batch) >= max(1, batch_size):
+                await flush(row.offset)
+        if batch:
+            await flush(batch[-1].offset)
+
+    progress.done = True
+    progress.bytes_read = progress.total_bytes
+    _checkpoint(checkpoint, progress, progress.total_bytes).save(checkpoint_path)
+    await _report(on_progress, progress)
+    return progress
+
+
+async def _skip_existing(
+    writer: _Writer,
+    valid: List[Tuple[SourceRow, Tuple[str, Dict[str, Any]]]],
+    pending: int,
+    errors,
+    progress: ImportProgress,
+) -> List[Tuple[SourceRow, Tuple[str, Dict[str, Any]]]]:
+    # The interrupted run may have written any record up to `pending`; those found are counted as created
+    recheck = [(row, prepared) for row, prepared in valid if row.offset <= pending]
+    skipped = set()
+    for (row, _), found in zip(recheck, await writer.existing([prepared for _, prepared in recheck])):
+        if found is False:
+            continue
+        skipped.add(row.number)
+        if found is True:
+            progress.created += 1
+        else:
+            _reject(errors, row, f"{type(found).__name__}: {found}")
+            progress.failed += 1
+    return [(row, prepared) for row, prepared in valid if row.number not in skipped]
+
+
+def _reject(errors, row: SourceRow, error: str) -> None:
+    errors.write(json.dumps({**row.data, "import_row": row.number, "import_error": error}) + "\n")
+
+
+def _checkpoint(base: ImportCheckpoint, progress: ImportProgress, offset: int, pending: int = 0) -> ImportCheckpoint:
+    return replace(
+        base,
+        offset=offset,
+        pending=pending if pending > offset else 0,
+        rows=progress.rows,
+        created=progress.created,
+        invalid=progress.invalid,
+        failed=progress.failed,
+        done=progress.done,
+    )
+
+
+async def _report(on_progress: Optional[Callable[[ImportProgress], Any]], progress: ImportProgress) -> None:
+    if on_progress is None:
+        return
+    result = on_progress(progress)
+    if inspect.isawaitable(result):
+        await result
+
+
+__all__ = ["BATCH_SIZE", "CONCURRENCY", "KINDS", "ImportProgress", "checkpoint_path_for", "errors_path_for", "import_metadata"]
@@ -0,0 +1,94 @@
+# python
+
+"""PDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+This module provides declarative column projections for the list calls of my_egeria services.
+
+
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from .records import FIELD_KEYS
+
+# Column headings sent to pyegeria for each record field
+FIELD_HEADINGS: Dict[str, str] = {
+    "guid": "GUID",
+    "display_name": "Display Name",
+    "qualified_name": "Qualified Name",
+    "description": "Description",
+    "summary": "Summary",
+    "category": "Category",
+    "type_name": "Type Name",
+    "language": "Language",
+    "usage": "Usage",
+    "status": "Status",
+    "aliases": "Aliases",
+}
+
+
+@dataclass(frozen=True)
+class Projection:
+    """
+    The record fields a screen needs from a list call. Services pass it to pyegeria as an
+    `output_format_set` so the server only renders those columns, and retain() trims
+    whatever comes back (older clients ignore or reject the format set) to the same fields.
+    """
+
+    name: str
+    fields: Tuple[str, ...]
+    _keys: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        unknown = [f for f in self.fields if f not in FIELD_KEYS]
+        if unknown:
+            raise ValueError(f"Unknown projection fields: {unknown}")
+        object.__setattr__(self, "_keys", frozenset(k for f in self.fields for k in FIELD_KEYS[f]))
+
+    def output_format_set(self) -> Dict[str, Any]:
+        """The pyegeria format set (DICT only) selecting these columns."""
+        return {
+            "heading": self.name,
+            "description": f"my_egeria {self.name} columns",
+            "formats": {
+                "types": ["DICT"],
+                "columns": [{"name": FIELD_HEADINGS[f], "key": f} for f in self.fields],
+            },
+        }
+
+    def retain(self, rows: Optional[List[Any]]) -> List[Any]:
+        """Drop every property of each row that isn't one of the projected fields."""
+        keys = self._keys
+        return [
+            {k: v for k, v in r.items() if k in keys} if isinstance(r, dict) else r
+            for r in (rows or [])
+        ]
+
+
+# What each browser table displays, plus what the search index ranks on
+COLLECTION_COLUMNS = Projection(
+    "Collections", ("guid", "display_name", "qualified_name", "description", "summary", "category")
+)
+GLOSSARY_COLUMNS = Projection(
+    "Glossaries", ("guid", "display_name", "qualified_name", "description", "summary", "language", "usage")
+)
+TERM_COLUMNS = Projection(
+    "Terms", ("guid", "display_name", "qualified_name", "summary", "description", "status", "aliases")
+)
+GOVERNANCE_DEFINITION_COLUMNS = Projection(
+    "Governance Definitions", ("guid", "display_name", "qualified_name", "description", "category", "type_name")
+)
+
+
+__all__ = [
+    "COLLECTION_COLUMNS",
+    "FIELD_HEADINGS",
+    "GLOSSARY_COLUMNS",
+    "GOVERNANCE_DEFINITION_COLUMNS",
+    "Projection",
+    "TERM_COLUMNS",
+]
@@ -0,0 +1,177 @@
+# python
+
+"""PDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+This module provides compact, typed records for the results of my_egeria services.
+
+
+"""
+
+from __future__ import annotations
+
+import sys
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+
+R = TypeVar("R", bound="_Record")
+
+# pyegeria DICT output spells the same property several ways depending on the call
+_GUID = ("GUID", "guid", "Id", "ID")
+_DISPLAY_NAME = ("display_name", "displayName", "Display Name", "name", "Name")
+_QUALIFIED_NAME = ("qualified_name", "qualifiedName", "Qualified Name")
+_DESCRIPTION = ("description", "Description")
+_SUMMARY = ("summary", "Summary")
+_CATEGORY = ("category", "Category", "collection_type", "collectionType")
+_TYPE_NAME = ("type_name", "typeName", "Type Name")
+_LANGUAGE = ("language", "Language")
+_USAGE = ("usage", "Usage")
+_STATUS = ("status", "Status")
+_ALIASES = ("aliases", "Aliases")
+
+# Every spelling of each record field, so a projection can keep exactly what the records read
+FIELD_KEYS: Dict[str, Tuple[str, ...]] = {
+    "guid": _GUID,
+    "display_name": _DISPLAY_NAME,
+    "qualified_name": _QUALIFIED_NAME,
+    "description": _DESCRIPTION,
+    "summary": _SUMMARY,
+    "category": _CATEGORY,
+    "type_name": _TYPE_NAME,
+    "language": _LANGUAGE,
+    "usage": _USAGE,
+    "status": _STATUS,
+    "aliases": _ALIASES,
+}
+
+
+def _first(d: Dict[str, Any], keys: Tuple[str, ...]) -> str:
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return str(v)
+    return ""
+
+
+def _interned(d: Dict[str, Any], keys: Tuple[str, ...]) -> str:
+    # Low-cardinality values (types, categories, statuses) repeat across thousands of rows
+    return sys.intern(_first(d, keys))
+
+
+class _Record(ABC):
+    """Base of the record types; each one maps a pyegeria DICT result in from_dict()."""
+
+    __slots__ = ()
+
+    @classmethod
+    @abstractmethod
+    def from_dict(cls: Type[R], d: Dict[str, Any]) -> R:
+        """The record for one pyegeria DICT result."""
+
+    @classmethod
+    def from_list(cls: Type[R], items: Optional[Iterable[Any]]) -> List[R]:
+        """Map a service result once; entries that aren't dicts are dropped."""
+        return [cls.from_dict(d) for d in (items or ()) if isinstance(d, dict)]
+
+
+@dataclass(frozen=True, slots=True)
+class CollectionRecord(_Record):
+    guid: str = ""
+    display_name: str = ""
+    qualified_name: str = ""
+    description: str = ""
+    category: str = ""
+    type_name: str = ""
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "CollectionRecord":
+        return cls(
+            guid=_first(d, _GUID),
+            display_name=_first(d, _DISPLAY_NAME),
+            qualified_name=_first(d, _QUALIFIED_NAME),
+            description=_first(d, _DESCRIPTION + _SUMMARY),
+            category=_interned(d, _CATEGORY),
+            type_name=_interned(d, _TYPE_NAME),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class GlossaryRecord(_Record):
+    guid: str = ""
+    display_name: str = ""
+    qualified_name: str = ""
+    description: str = ""
+    language: str = ""
+    usage: str = ""
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "GlossaryRecord":
+        return cls(
+            guid=_first(d, _GUID),
+            display_name=_first(d, _DISPLAY_NAME),
+            qualified_name=_first(d, _QUALIFIED_NAME),
+            description=_first(d, _DESCRIPTION + _SUMMARY),
+            language=_interned(d, _LANGUAGE),
+            usage=_first(d, _USAGE),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TermRecord(_Record):
+    guid: str = ""
+    display_name: str = ""
+    qualified_name: str = ""
+    summary: str = ""
+    description: str = ""
+    status: str = ""
+    aliases: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "TermRecord":
+        aliases = next((d[k] for k in _ALIASES if d.get(k)), ())
+        if isinstance(aliases, str):
+            aliases = (aliases,)
+        return cls(
+            guid=_first(d, _GUID),
+            display_name=_first(d, _DISPLAY_NAME),
+            qualified_name=_first(d, _QUALIFIED_NAME),
+            summary=_first(d, _SUMMARY),
+            description=_first(d, _DESCRIPTION),
+            status=_interned(d, _STATUS),
+            aliases=tuple(str(a) for a in aliases if a),
+        )
+
+    @property
+    def summary_or_description(self) -> str:
+        return self.summary or self.description
+
+
+@dataclass(frozen=True, slots=True)
+class GovernanceDefinitionRecord(_Record):
+    guid: str = ""
+    display_name: str = ""
+    qualified_name: str = ""
+    category: str = ""
+    type_name: str = ""
+    description: str = ""
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "GovernanceDefinitionRecord":
+        return cls(
+            guid=_first(d, _GUID),
+            display_name=_first(d, _DISPLAY_NAME),
+            qualified_name=_first(d, _QUALIFIED_NAME),
+            category=_interned(d, _CATEGORY),
+            type_name=_interned(d, _TYPE_NAME),
+            description=_first(d, _DESCRIPTION),
+        )
+
+
+__all__ = [
+    "CollectionRecord",
+    "FIELD_KEYS",
+    "GlossaryRecord",
+    "GovernanceDefinitionRecord",
+    "TermRecord",
+]
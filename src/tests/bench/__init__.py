@@ -0,0 +1,11 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   Offline benchmarks for my_egeria, served by an in-process fake Egeria (fake_egeria.py).
+   Run them with `python -m tests.bench` from src/. Results are compared with the baselines
+   of an earlier run (see harness.Baselines) and a regression fails its benchmark.
+
+
+"""
@@ -0,0 +1,20 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file runs the my_egeria benchmarks: python -m tests.bench [pytest options]
+
+
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# bench_*.py aren't collected by the regular test run; name them explicitly here
+BENCHMARKS = sorted(str(p) for p in Path(__file__).resolve().parent.glob("bench_*.py"))
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", "-s", *BENCHMARKS, *sys.argv[1:]]))
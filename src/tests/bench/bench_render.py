@@ -0,0 +1,130 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file benchmarks time-to-interactive of every screen registered in MyEgeria.SCREENS.
+
+
+"""
+
+import asyncio
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import pytest
+from textual.widgets import DataTable, Tree
+
+import my_egeria
+from my_egeria import MyEgeria
+from utils.lazy import lazy_screen, load_attr
+from widgets.virtual_table import VirtualTable
+
+from tests.bench.fake_egeria import FakeDataset, fake_egeria
+
+# Listing sizes to render at (EGERIA_BENCH_RENDER_ROWS, comma separated)
+ROW_COUNTS = tuple(int(n) for n in os.getenv("EGERIA_BENCH_RENDER_ROWS", "100,1000,10000").split(","))
+# Longest wait for a screen's first row or focus (EGERIA_BENCH_RENDER_TIMEOUT)
+TIMEOUT = float(os.getenv("EGERIA_BENCH_RENDER_TIMEOUT", "30"))
+# A mounted screen with no running workers that changed nothing for this long won't show more
+SETTLE_SECONDS = 0.25
+
+# Registered screens whose constructors need arguments, built against the fake dataset's elements
+SCREEN_FACTORIES: Dict[str, Callable[[], object]] = {
+    "glossary_list_screen": lambda: load_attr("screens.glossary.glossary_list_screen:GlossaryListScreen")(
+        load_attr("services.glossary_service:GlossaryService")()
+    ),
+    "term_details": lazy_screen("screens.glossary.term_details:TermDetailsScreen", "glo-0000-t000000"),
+    "term_list_screen": lazy_screen("screens.glossary.term_list_screen:TermListScreen", "Glossary 0"),
+    "collection_details": lazy_screen("screens.a_collections.collection_details:CollectionDetailsScreen", "col-000000"),
+    "delete_collection": lazy_screen("screens.a_collections.delete_collection:DeleteCollectionScreen", "col-000000"),
+    "delete_governance_definition": lazy_screen(
+        "screens.GovernanceOfficer.delete_governance_definition:DeleteGovernanceDefinitionScreen", "col-000000"
+    ),
+    "marketplace_tree": lazy_screen(
+        "screens.GovernanceOfficer.marketplace_tree:MarketPlaceTree", "mkt-root", "Data Marketplace"
+    ),
+    "product_manager_browser": lambda: load_attr("screens.ProductManager.product_manager_browser:ProductManagerBrowser")(
+        load_attr("services.product_manager_service:ProductManagerService")()
+    ),
+}
+
+
+def _dataset(rows: int) -> FakeDataset:
+    """The listings screens open on (collections, glossaries) `rows` long."""
+    return FakeDataset(collections=rows, glossaries=rows, terms_per_glossary=1)
+
+
+class RenderApp(MyEgeria):
+    """MyEgeria without the splash: each benchmark pushes the one screen it measures."""
+
+    # CSS_PATH resolves against the defining module; keep MyEgeria's stylesheet
+    CSS_PATH = [str(Path(my_egeria.__file__).parent / "styles" / "common.css")]
+
+    async def on_mount(self) -> None:
+        pass
+
+
+def _shows_rows(screen) -> bool:
+    if any(table.row_count for table in screen.query(DataTable)):
+        return True
+    if any(table.row_count for table in screen.query(VirtualTable)):
+        return True
+    return any(tree.root.children for tree in screen.query(Tree))
+
+
+def _settled(app, screen) -> bool:
+    return screen._is_mounted and all(worker.is_finished for worker in app.workers)
+
+
+async def _time_to_interactive(name: str) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Seconds from pushing screen `name` until a table or tree shows its first row, and until
+    a widget on it has focus. None for a figure the screen never reaches (no table, nothing
+    focusable) once it has settled.
+    """
+    first_row = focus = None
+    async with RenderApp().run_test() as pilot:
+        app = pilot.app
+        # An instance, so push_screen waits for it to mount as it would for a screen the app builds
+        screen = (SCREEN_FACTORIES.get(name) or MyEgeria.SCREENS[name])()
+        started = time.perf_counter()
+        await app.push_screen(screen)
+        quiet_since = None
+        while (first_row is None or focus is None) and app.is_running:
+            elapsed = time.perf_counter() - started
+            if first_row is None and _shows_rows(screen):
+                first_row, quiet_since = elapsed, None
+            if focus is None and screen.focused is not None:
+                focus, quiet_since = elapsed, None
+            if _settled(app, screen):
+                quiet_since = quiet_since or time.perf_counter()
+                if time.perf_counter() - quiet_since > SETTLE_SECONDS:
+                    break
+            else:
+                quiet_since = None
+            if elapsed > TIMEOUT:
+                break
+            await asyncio.sleep(0.002)
+        # Let callbacks queued during mount run before the app shuts down
+        await pilot.pause()
+    return first_row, focus
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+@pytest.mark.parametrize("name", sorted(MyEgeria.SCREENS))
+async def test_time_to_interactive(bench, name, rows):
+    with fake_egeria(_dataset(rows)):
+        try:
+            first_row, focus = await _time_to_interactive(name)
+        except Exception as e:
+            pytest.skip(f"{name} failed to render: {type(e).__name__}: {e}")
+    if first_row is not None:
+        bench(f"render.{name}.{rows}.first_row.seconds", first_row, "s")
+    if focus is not None:
+        bench(f"render.{name}.{rows}.focus.seconds", focus, "s")
+    if first_row is None and focus is None:
+        pytest.skip(f"{name} shows no rows and takes no focus")
@@ -0,0 +1,79 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file benchmarks end-to-end browser screen loads against the fake Egeria.
+
+
+"""
+
+import asyncio
+import statistics
+import time
+
+import pytest
+from textual.app import App
+
+from screens.a_collections.collection_browser import CollectionBrowserScreen
+from screens.GovernanceOfficer.governance_officer_browser import GovernanceOfficerBrowserScreen
+from screens.glossary.glossary_browser import GlossaryBrowserScreen
+
+from tests.bench.fake_egeria import FakeDataset, fake_egeria
+
+DATASET = FakeDataset(collections=2000, glossaries=200, terms_per_glossary=10)
+LATENCY = 0.01
+JITTER = 0.005
+# The collections listing also holds the fake marketplace root and its folders
+COLLECTION_ROWS = DATASET.collections + sum(DATASET.marketplace_fanout ** d for d in range(DATASET.marketplace_depth + 1))
+
+
+class BenchApp(App):
+    """Empty app; each benchmark pushes the screen it measures."""
+
+
+async def _time_until_loaded(pilot, screen, expected_rows: int, timeout: float = 30.0) -> float:
+    """Seconds from pushing `screen` until its table holds `expected_rows` rows."""
+    started = time.perf_counter()
+    await pilot.app.push_screen(screen)
+    while True:
+        table = getattr(screen, "table", None)
+        if table is not None and table.row_count >= expected_rows:
+            return time.perf_counter() - started
+        if time.perf_counter() - started > timeout:
+            pytest.fail(f"{type(screen).__name__} showed {table.row_count if table else 0}/{expected_rows} rows")
+        await asyncio.sleep(0.005)
+
+
+async def _cold_and_warm(screen_class, expected_rows: int, repeat: int = 3):
+    """Median load time of a first visit (nothing cached) and of a second visit to the screen."""
+    cold, warm = [], []
+    for _ in range(repeat):
+        with fake_egeria(DATASET, latency=LATENCY, jitter=JITTER):
+            async with BenchApp().run_test() as pilot:
+                cold.append(await _time_until_loaded(pilot, screen_class(), expected_rows))
+                await pilot.app.pop_screen()
+                # Rows remembered from the first paint and cached responses
+                warm.append(await _time_until_loaded(pilot, screen_class(), expected_rows))
+    return statistics.median(cold), statistics.median(warm)
+
+
+@pytest.mark.asyncio
+async def test_collection_browser_load(bench):
+    cold, warm = await _cold_and_warm(CollectionBrowserScreen, COLLECTION_ROWS)
+    bench("screens.collection_browser.cold.seconds", cold, "s")
+    bench("screens.collection_browser.warm.seconds", warm, "s")
+
+
+@pytest.mark.asyncio
+async def test_glossary_browser_load(bench):
+    cold, warm = await _cold_and_warm(GlossaryBrowserScreen, DATASET.glossaries)
+    bench("screens.glossary_browser.cold.seconds", cold, "s")
+    bench("screens.glossary_browser.warm.seconds", warm, "s")
+
+
+@pytest.mark.asyncio
+async def test_governance_officer_browser_load(bench):
+    cold, warm = await _cold_and_warm(GovernanceOfficerBrowserScreen, COLLECTION_ROWS)
+    bench("screens.governance_officer_browser.cold.seconds", cold, "s")
+    bench("screens.governance_officer_browser.warm.seconds", warm, "s")
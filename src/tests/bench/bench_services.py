@@ -0,0 +1,124 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file benchmarks the my_egeria services against the fake Egeria.
+
+
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from services.base_service import clear_response_cache
+from services.collection_service import CollectionService
+from services.glossary_service import GlossaryService
+from services.metadata_import import import_metadata
+from services.projections import COLLECTION_COLUMNS
+from services.records import CollectionRecord
+
+from tests.bench.fake_egeria import FakeDataset, fake_egeria
+from tests.bench.harness import ameasure, measure, peak_memory
+
+COLLECTIONS = FakeDataset(collections=5000, members_per_collection=10, classifications=8)
+GLOSSARIES = FakeDataset(glossaries=20, terms_per_glossary=500)
+
+
+def _drain(pages) -> int:
+    async def _count():
+        return sum([len(page) async for page in pages])
+
+    return asyncio.run(_count())
+
+
+def test_collection_paging_throughput(bench):
+    with fake_egeria(COLLECTIONS, latency=0.002):
+        service = CollectionService()
+        total = _drain(service.iter_collections("*", page_size=200, use_cache=False))
+        seconds = measure(lambda: _drain(service.iter_collections("*", page_size=200, use_cache=False)), repeat=3)
+    bench("collections.iter_pages.rows_per_second", total / seconds, "rows/s", higher_is_better=True)
+
+
+def test_collection_list_memory_full_vs_projected(bench):
+    with fake_egeria(COLLECTIONS):
+        service = CollectionService()
+        full = peak_memory(lambda: service.list_collections("*", use_cache=False))
+        clear_response_cache()
+        projected = peak_memory(
+            lambda: CollectionRecord.from_list(
+                service.list_collections("*", use_cache=False, columns=COLLECTION_COLUMNS)
+            )
+        )
+    bench("collections.list.full.peak_mib", full, "MiB")
+    bench("collections.list.projected_records.peak_mib", projected, "MiB")
+    assert projected < full
+
+
+def test_cached_list_latency(bench):
+    with fake_egeria(COLLECTIONS, latency=0.05):
+        service = CollectionService()
+        service.list_collections("*")
+        seconds = measure(lambda: service.list_collections("*"), repeat=20)
+    bench("collections.list.cached.seconds", seconds, "s")
+
+
+def test_indexed_search_latency(bench):
+    with fake_egeria(COLLECTIONS, latency=0.05):
+        service = CollectionService()
+        service.list_collections("*")  # a full listing completes the local index
+        seconds = measure(lambda: service.search_indexed("collections", "collection 12"), repeat=20)
+    bench("collections.search.indexed.seconds", seconds, "s")
+
+
+@pytest.mark.asyncio
+async def test_glossary_fan_out_with_latency(bench):
+    with fake_egeria(GLOSSARIES, latency=0.01, jitter=0.005):
+        service = GlossaryService()
+        guids = [g["GUID"] for g in service.list_glossaries("*")]
+
+        async def fan_out():
+            clear_response_cache()
+            return sum([len(r.terms) async for r in service.get_terms_for_glossaries(guids)])
+
+        assert await fan_out() == GLOSSARIES.glossaries * GLOSSARIES.terms_per_glossary
+        seconds = await ameasure(fan_out, repeat=3)
+    bench("glossaries.fan_out.seconds", seconds, "s")
+
+
+@pytest.mark.asyncio
+async def test_bulk_term_create_throughput(bench):
+    payloads = [{"display_name": f"Imported {i}", "summary": "Bulk import"} for i in range(500)]
+    with fake_egeria(GLOSSARIES, latency=0.01, jitter=0.005):
+        service = GlossaryService()
+        started = time.perf_counter()
+        for payload in payloads[:50]:
+            await service.add_term_async("glo-0000", payload)
+        one_by_one = 50 / (time.perf_counter() - started)
+        started = time.perf_counter()
+        results = await service.add_terms("glo-0000", payloads)
+        bulk = len(payloads) / (time.perf_counter() - started)
+    assert all(r.ok for r in results)
+    bench("terms.create.one_by_one.per_second", one_by_one, "terms/s", higher_is_better=True)
+    bench("terms.create.bulk.per_second", bulk, "terms/s", higher_is_better=True)
+
+
+def _import_peak_mib(tmp_path, rows: int) -> float:
+    path = tmp_path / f"collections-{rows}.jsonl"
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(rows):
+            f.write(json.dumps({"display_name": f"Imported {i}", "description": "Bulk import", "category": "Folders"}) + "\n")
+    return peak_memory(lambda: asyncio.run(import_metadata(str(path), "collections", restart=True)))
+
+
+def test_import_memory_is_flat(bench, tmp_path):
+    with fake_egeria(COLLECTIONS):
+        small = _import_peak_mib(tmp_path, 2_000)
+        large = _import_peak_mib(tmp_path, 20_000)
+    bench("import.collections.2k.peak_mib", small, "MiB")
+    bench("import.collections.20k.peak_mib", large, "MiB")
+    # Ten times the rows must not mean ten times the memory
+    assert large < small * 2
@@ -0,0 +1,51 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides the fixtures of the my_egeria benchmarks.
+
+
+"""
+
+import os
+
+import pytest
+
+from tests.bench.harness import Baselines, Result
+
+_BASELINES = Baselines()
+
+
+@pytest.fixture
+def bench():
+    """record(name, value, unit, higher_is_better=False): report a figure and fail on a regression."""
+
+    def record(name: str, value: float, unit: str, higher_is_better: bool = False) -> Result:
+        result = Result(name, value, unit, higher_is_better)
+        print(f"\n[bench] {result}")
+        regression = _BASELINES.check(result)
+        if regression:
+            pytest.fail(regression)
+        return result
+
+    return record
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Print the run beside its baselines; EGERIA_BENCH_REPORT also writes it as JSON."""
+    report = _BASELINES.report()
+    if not report:
+        return
+    terminalreporter.section("benchmarks")
+    for line in report.splitlines():
+        terminalreporter.write_line(line)
+    path = os.getenv("EGERIA_BENCH_REPORT")
+    if path:
+        _BASELINES.write_report(path)
+        terminalreporter.write_line(f"report written to {path}")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if _BASELINES.results:
+        _BASELINES.save()
@@ -0,0 +1,310 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides an in-process fake of pyegeria's EgeriaTech for the my_egeria benchmarks.
+
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+import utils.egeria_client as egeria_client
+from services.base_service import clear_response_cache, invalidate_method_cache
+from utils.egeria_client import close_all_managers
+from utils.swr import forget_rows
+
+
+@dataclass(frozen=True)
+class FakeDataset:
+    """Shape of the fake server's metadata; every element is generated deterministically."""
+
+    glossaries: int = 10
+    terms_per_glossary: int = 100
+    collections: int = 200
+    members_per_collection: int = 5
+    # A "Data Marketplace" collection with folders `marketplace_fanout` wide, `marketplace_depth` deep
+    marketplace_depth: int = 3
+    marketplace_fanout: int = 4
+    # Classifications attached to each element, to make payloads as wide as real ones
+    classifications: int = 4
+
+
+def _element(kind: str, guid: str, name: str, **extra: Any) -> Dict[str, Any]:
+    return {
+        "GUID": guid,
+        "display_name": name,
+        "qualified_name": f"{kind}::{name}",
+        "description": f"Generated {kind.lower()} {name} for benchmarking my_egeria.",
+        "type_name": kind,
+        **extra,
+    }
+
+
+class _Store:
+    """The generated elements of one dataset, shared by every client built for it."""
+
+    def __init__(self, dataset: FakeDataset):
+        self.dataset = dataset
+        classifications = [{"name": f"Classification{i}", "properties": {"note": "x" * 40}} for i in range(dataset.classifications)]
+        self.collections: List[Dict[str, Any]] = []
+        self.members: Dict[str, List[Dict[str, Any]]] = {}
+        for i in range(dataset.collections):
+            guid = f"col-{i:06d}"
+            members = [
+                _element("Asset", f"{guid}-m{j}", f"Asset {i}.{j}") for j in range(dataset.members_per_collection)
+            ]
+            self.members[guid] = members
+            self.collections.append(
+                _element(
+                    "Collection",
+                    guid,
+                    f"Collection {i}",
+                    category="DataProducts" if i % 3 else "Folders",
+                    classifications=classifications,
+                    members=[m["GUID"] for m in members],
+                )
+            )
+        self._add_marketplace(classifications)
+
+        self.glossaries: List[Dict[str, Any]] = []
+        self.terms: List[Dict[str, Any]] = []
+        self.terms_by_glossary: Dict[str, List[Dict[str, Any]]] = {}
+        for g in range(dataset.glossaries):
+            gguid = f"glo-{g:04d}"
+            self.glossaries.append(_element("Glossary", gguid, f"Glossary {g}", language="English", usage="Benchmarks"))
+            terms = [
+                _element(
+                    "GlossaryTerm",
+                    f"{gguid}-t{t:06d}",
+                    f"Term {g}.{t}",
+                    summary=f"Summary of term {g}.{t}",
+                    status="ACTIVE" if t % 5 else "DRAFT",
+                    aliases=[f"T{g}_{t}"],
+                    glossary_guid=gguid,
+                    classifications=classifications,
+                )
+                for t in range(dataset.terms_per_glossary)
+            ]
+            self.terms_by_glossary[gguid] = terms
+            self.terms.extend(terms)
+        self.by_guid: Dict[str, Dict[str, Any]] = {c["GUID"]: c for c in self.collections}
+
+    def _add_marketplace(self, classifications: List[Dict[str, Any]]) -> None:
+        root = _element("Collection", "mkt-root", "Data Marketplace", category="Marketplace", classifications=classifications)
+        self.collections.append(root)
+        level = [root]
+        for depth in range(self.dataset.marketplace_depth):
+            next_level = []
+            for parent in level:
+                children = [
+                    _element("Collection", f"{parent['GUID']}.{k}", f"Folder {depth}.{k}", category="Folder")
+                    for k in range(self.dataset.marketplace_fanout)
+                ]
+                self.members[parent["GUID"]] = children
+                self.collections.extend(children)
+                next_level.extend(children)
+            level = next_level
+
+
+_STORES: Dict[FakeDataset, _Store] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def _store(dataset: FakeDataset) -> _Store:
+    with _STORES_LOCK:
+        store = _STORES.get(dataset)
+        if store is None:
+            store = _STORES[dataset] = _Store(dataset)
+        return store
+
+
+class FakeEgeriaTech:
+    """
+    Stand-in for pyegeria.EgeriaTech serving a generated FakeDataset. Every call sleeps
+    `latency` ± `jitter` seconds (sync methods block, _async_* methods await), pages with
+    start_from/page_size, honours output_format_set column projections and returns
+    freshly parsed JSON, as a client reading an HTTP response would.
+    """
+
+    # Set by fake_egeria(); the constructor signature must match EgeriaTech's keyword call
+    dataset = FakeDataset()
+    latency = 0.0
+    jitter = 0.0
+    calls: Counter = Counter()
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        self.store = _store(self.dataset)
+        self._random = random.Random(0)
+        self._created = itertools.count()
+
+    # ------------------ latency ------------------
+
+    def _delay(self) -> float:
+        delay = self.latency + (self._random.uniform(-self.jitter, self.jitter) if self.jitter else 0.0)
+        return max(0.0, delay)
+
+    def _count(self, method: str) -> None:
+        FakeEgeriaTech.calls[method] += 1
+
+    # ------------------ results ------------------
+
+    @staticmethod
+    def _matches(search: Optional[str], element: Dict[str, Any]) -> bool:
+        s = (search or "*").strip()
+        if s in ("", "*"):
+            return True
+        pattern = re.compile(s if any(c in s for c in ".^$*+?[]()|") else re.escape(s), re.IGNORECASE)
+        return bool(pattern.search(element["display_name"]) or pattern.search(element["qualified_name"]))
+
+    @staticmethod
+    def _shape(elements: List[Dict[str, Any]], start_from: int, page_size: int, output_format_set: Any) -> List[Dict[str, Any]]:
+        if page_size:
+            elements = elements[start_from:start_from + page_size]
+        keys = None
+        if isinstance(output_format_set, dict):
+            keys = {c["key"] for c in output_format_set.get("formats", {}).get("columns", [])}
+            # The fake stores GUIDs under "GUID", as pyegeria's DICT output does
+            if "guid" in keys:
+                keys.add("GUID")
+        if keys is not None:
+            elements = [{k: v for k, v in e.items() if k in keys} for e in elements]
+        # Serialise and parse, so payload width costs time and memory as it does over HTTP
+        return json.loads(json.dumps(elements))
+
+    # ------------------ EgeriaTech API ------------------
+
+    def create_egeria_bearer_token(self, user_id: str = None, user_pwd: str = None) -> str:
+        self._count("create_egeria_bearer_token")
+        time.sleep(self._delay())
+        return "fake-token"
+
+    async def _async_create_egeria_bearer_token(self, user_id: str = None, user_pwd: str = None) -> str:
+        self._count("create_egeria_bearer_token")
+        await asyncio.sleep(self._delay())
+        return "fake-token"
+
+    def close_session(self) -> None:
+        pass
+
+    # Read bodies; _served() wraps each in a blocking method and an `_async_` variant
+
+    def _find_collections(
+        self, search_string: str = "*", classification_names=None, metadata_element_types=None,
+        starts_with: bool = True, ends_with: bool = False, ignore_case: bool = False,
+        start_from: int = 0, page_size: int = 0, output_format: str = "JSON",
+        output_format_set: Any = None, body: Any = None,
+    ) -> List[Dict[str, Any]]:
+        found = [c for c in self.store.collections if self._matches(search_string, c)]
+        return self._shape(found, start_from, page_size, output_format_set)
+
+    def _get_collection(self, collection_guid: str, output_format: str = "JSON", **_: Any) -> Dict[str, Any]:
+        element = self.store.by_guid.get(collection_guid)
+        if element is None:
+            raise ValueError(f"Unknown collection {collection_guid}")
+        return json.loads(json.dumps(element))
+
+    def _get_member_list(
+        self, collection_guid: str = None, collection_name: str = None, collection_qname: str = None, **_: Any
+    ) -> List[Dict[str, Any]]:
+        return json.loads(json.dumps(self.store.members.get(collection_guid, [])))
+
+    def _find_glossaries(
+        self, search_string: str = "*", start_from: int = 0, page_size: int = 0,
+        output_format: str = "JSON", output_format_set: Any = None, **_: Any,
+    ) -> List[Dict[str, Any]]:
+        found = [g for g in self.store.glossaries if self._matches(search_string, g)]
+        return self._shape(found, start_from, page_size, output_format_set)
+
+    def _find_glossary_terms(
+        self, search_string: str = "*", glossary_guid: str = None, start_from: int = 0, page_size: int = 0,
+        output_format: str = "JSON", output_format_set: Any = None, **_: Any,
+    ) -> List[Dict[str, Any]]:
+        pool = self.store.terms_by_glossary.get(glossary_guid, []) if glossary_guid else self.store.terms
+        found = [t for t in pool if self._matches(search_string, t)]
+        return self._shape(found, start_from, page_size, output_format_set)
+
+    # Generated stores are shared between runs, so created elements aren't kept
+
+    def _create_controlled_glossary_term(self, glossary_guid: str, body: Dict[str, Any]) -> str:
+        return f"{glossary_guid}-new{next(self._created):06d}"
+
+    def _create_glossary(self, display_name: str, description: str, language: str = "English", usage: str = None) -> str:
+        return f"glo-new{next(self._created):06d}"
+
+    def _create_collection(
+        self, display_name: str, description: str, category: str, initial_classifications=None, **_: Any
+    ) -> str:
+        return f"col-new{next(self._created):06d}"
+
+
+def _served(name: str) -> None:
+    body = getattr(FakeEgeriaTech, f"_{name}")
+
+    def blocking(self, *args: Any, **kwargs: Any):
+        self._count(name)
+        time.sleep(self._delay())
+        return body(self, *args, **kwargs)
+
+    async def awaitable(self, *args: Any, **kwargs: Any):
+        self._count(name)
+        await asyncio.sleep(self._delay())
+        return body(self, *args, **kwargs)
+
+    blocking.__name__, awaitable.__name__ = name, f"_async_{name}"
+    setattr(FakeEgeriaTech, name, blocking)
+    setattr(FakeEgeriaTech, f"_async_{name}", awaitable)
+
+
+for _name in (
+    "find_collections", "get_collection", "get_member_list", "find_glossaries", "find_glossary_terms",
+    "create_controlled_glossary_term", "create_glossary", "create_collection",
+):
+    _served(_name)
+
+
+def _reset_caches() -> None:
+    close_all_managers()
+    clear_response_cache()
+    invalidate_method_cache()
+    forget_rows()
+
+
+@contextmanager
+def fake_egeria(
+    dataset: Optional[FakeDataset] = None, latency: float = 0.0, jitter: float = 0.0
+) -> Iterator[type]:
+    """
+    Serve every client my_egeria builds (services, screens, the client pool) from
+    FakeEgeriaTech for the duration of the block. Caches, pooled clients and remembered
+    rows are reset on entry and exit so measurements start cold.
+    """
+    previous = egeria_client.egeria_tech_class
+    FakeEgeriaTech.dataset = dataset or FakeDataset()
+    FakeEgeriaTech.latency = latency
+    FakeEgeriaTech.jitter = jitter
+    FakeEgeriaTech.calls = Counter()
+    _store(FakeEgeriaTech.dataset)  # generate outside the timed region
+    _reset_caches()
+    egeria_client.egeria_tech_class = lambda: FakeEgeriaTech
+    try:
+        yield FakeEgeriaTech
+    finally:
+        egeria_client.egeria_tech_class = previous
+        _reset_caches()
+
+
+__all__ = ["FakeDataset", "FakeEgeriaTech", "fake_egeria"]
@@ -0,0 +1,183 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides timing, memory and baseline helpers for the my_egeria benchmarks.
+
+
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+BENCH_DIR = Path(__file__).resolve().parent
+
+
+@dataclass
+class Result:
+    """One benchmark figure; `higher_is_better` for throughputs, lower for times and memory."""
+
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool = False
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.value:.4g} {self.unit}"
+
+
+def measure(fn: Callable[[], Any], repeat: int = 5, warmup: int = 1) -> float:
+    """Median wall time of `fn()` in seconds over `repeat` runs, after `warmup` untimed runs."""
+    for _ in range(warmup):
+        fn()
+    times: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+
+async def ameasure(fn: Callable[[], Awaitable[Any]], repeat: int = 5, warmup: int = 1) -> float:
+    """measure() for coroutine functions."""
+    for _ in range(warmup):
+        await fn()
+    times: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+
+def peak_memory(fn: Callable[[], Any]) -> float:
+    """Peak Python heap allocated while running `fn()`, in MiB (tracemalloc)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+
+def _machine() -> Dict[str, str]:
+    return {"python": platform.python_version(), "platform": platform.platform()}
+
+
+class Baselines:
+    """
+    Benchmark results kept from an earlier run (EGERIA_BENCH_BASELINES, default
+    tests/bench/.baselines.json; machine-specific, so not committed). A result more
+    than EGERIA_BENCH_TOLERANCE (default 0.5 = 50%) worse than its baseline is a
+    regression, unless it is a time within EGERIA_BENCH_NOISE_SECONDS (default 0.1)
+    of the baseline: short UI timings jitter by more than their relative tolerance.
+    Results without a baseline are recorded; EGERIA_BENCH_UPDATE=1 re-records all of them.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        tolerance: Optional[float] = None,
+        update: Optional[bool] = None,
+        noise_seconds: Optional[float] = None,
+    ):
+        self.path = Path(path or os.getenv("EGERIA_BENCH_BASELINES") or BENCH_DIR / ".baselines.json")
+        self.tolerance = tolerance if tolerance is not None else float(os.getenv("EGERIA_BENCH_TOLERANCE", "0.5"))
+        if noise_seconds is None:
+            noise_seconds = float(os.getenv("EGERIA_BENCH_NOISE_SECONDS", "0.1"))
+        self.noise_seconds = noise_seconds
+        if update is None:
+            update = os.getenv("EGERIA_BENCH_UPDATE", "").lower() in ("1", "true", "yes")
+        self.update = update
+        self.results: List[Result] = []
+        self.regressions: List[str] = []
+        self._data: Dict[str, Any] = self._load()
+        # Baselines as loaded; save() adds to _data, reports still compare with these
+        self._previous: Dict[str, Any] = dict(self._data.get("results", {}))
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def check(self, result: Result) -> Optional[str]:
+        """Record `result`; returns a message when it regressed against its baseline."""
+        self.results.append(result)
+        old = self._baseline(result)
+        if old is None or self.update:
+            return None
+        if old <= 0:
+            return None
+        if result.unit == "s" and abs(result.value - old) < self.noise_seconds:
+            return None
+        change = self._change(result, old)
+        if change > self.tolerance:
+            message = f"{result.name} regressed {change:.0%}: {result.value:.4g} {result.unit} (baseline {old:.4g})"
+            self.regressions.append(message)
+            return message
+        return None
+
+    @staticmethod
+    def _change(result: Result, old: float) -> float:
+        """How much worse `result` is than `old`, as a fraction (negative when better)."""
+        return (old - result.value) / old if result.higher_is_better else (result.value - old) / old
+
+    def _baseline(self, result: Result) -> Optional[float]:
+        baseline = self._previous.get(result.name)
+        return float(baseline["value"]) if baseline is not None else None
+
+    def report(self) -> str:
+        """This run's results beside their baselines, one aligned line per result."""
+        if not self.results:
+            return ""
+        width = max(len(r.name) for r in self.results)
+        lines = [f"{'benchmark':<{width}}  {'value':>12}  {'baseline':>12}  change"]
+        for r in self.results:
+            old = self._baseline(r)
+            value = f"{r.value:.4g} {r.unit}"
+            if old is None:
+                lines.append(f"{r.name:<{width}}  {value:>12}  {'-':>12}  new")
+                continue
+            change = self._change(r, old) if old > 0 else 0.0
+            verdict = f"{'worse' if change > 0 else 'better'} {abs(change):.0%}"
+            lines.append(f"{r.name:<{width}}  {value:>12}  {old:>12.4g}  {verdict}")
+        return "\n".join(lines)
+
+    def write_report(self, path: str) -> None:
+        """Write this run's results and their baselines as JSON, to compare runs or machines."""
+        results = {}
+        for r in self.results:
+            results[r.name] = {**asdict(r), "baseline": self._baseline(r)}
+        report = {"machine": _machine(), "results": results, "regressions": self.regressions}
+        Path(path).write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+
+    def save(self) -> None:
+        """Write results that had no baseline (or all of them with update) back to the file."""
+        stored = self._data.setdefault("results", {})
+        changed = False
+        for r in self.results:
+            if self.update or r.name not in stored:
+                stored[r.name] = asdict(r)
+                changed = True
+        if not changed:
+            return
+        self._data["machine"] = _machine()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self._data, indent=2, sort_keys=True), encoding="utf-8")
+
+
+__all__ = ["Baselines", "Result", "ameasure", "measure", "peak_memory"]
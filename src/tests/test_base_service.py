@@ -0,0 +1,289 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import asyncio
+
+import pytest
+
+from services.base_service import (
+    BaseService,
+    clear_response_cache,
+    invalidate_method_cache,
+    method_cache_stats,
+    single_flight_stats,
+)
+from services.collection_service import CollectionService
+from utils.config import EgeriaConfig
+from utils.egeria_client import AsyncEgeriaTechClientManager
+from utils.retry import RetryPolicy
+
+
+CFG = EgeriaConfig("https://localhost:9443", "qs-view-server", "erinoverview", "secret")
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = []
+
+    def old_find(self, search):
+        self.calls.append("old_find")
+        raise AttributeError("removed in this pyegeria")
+
+    def find(self, search):
+        self.calls.append("find")
+        return {"elements": [{"GUID": "g1", "display_name": search}]}
+
+    def find_collections(self, search, output_format="DICT"):
+        self.calls.append("find_collections")
+        return [{"GUID": "c1", "display_name": search}]
+
+    def create_collection(self, display_name, description, category, classifications):
+        self.calls.append("create_collection")
+        return {"GUID": "c2"}
+
+
+class DirectManager:
+    """Stands in for the pooled manager: hands every call the same fake client."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def invoke_with_auto_refresh(self, fn, args=(), kwargs=None):
+        return fn(self.client, *args, **(kwargs or {}))
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def service():
+    invalidate_method_cache()
+    clear_response_cache()
+    return BaseService(config=CFG, manager=DirectManager(FakeClient()))
+
+
+def test_call_list_like_remembers_working_candidate(service):
+    candidates = [("old_find", ("x",), {}), ("find", ("x",), {})]
+    for _ in range(3):
+        rows = service._call_list_like(candidates, keys=("elements",))
+        assert rows[0]["GUID"] == "g1"
+    # Only the first call pays for the broken candidate
+    assert service.manager.client.calls == ["old_find", "find", "find", "find"]
+    stats = method_cache_stats()
+    assert stats["hits"] == 2
+    assert stats["skipped_calls"] == 2
+
+
+def test_method_cache_invalidated_per_config(service):
+    candidates = [("old_find", ("x",), {}), ("find", ("x",), {})]
+    service._call_first(candidates)
+    invalidate_method_cache(CFG)
+    service._call_first(candidates)
+    assert service.manager.client.calls == ["old_find", "find", "old_find", "find"]
+
+
+def test_read_responses_are_cached_until_a_write():
+    clear_response_cache()
+    client = FakeClient()
+    service = CollectionService(config=CFG, manager=DirectManager(client))
+    service.list_collections("*")
+    service.list_collections("*")
+    assert client.calls == ["find_collections"]
+
+    service.add_collection({"display_name": "n", "description": "d", "category": "c"})
+    service.list_collections("*")
+    assert client.calls == ["find_collections", "create_collection", "find_collections"]
+
+
+def test_use_cache_false_forces_round_trip(service):
+    service._invoke("find_collections", args=("*",))
+    service._invoke("find_collections", args=("*",), use_cache=False)
+    service._invoke("find_collections", args=("*",))
+    assert service.manager.client.calls == ["find_collections", "find_collections"]
+
+
+class PagedClient(FakeClient):
+    def __init__(self, total):
+        super().__init__()
+        self.rows = [{"GUID": f"c{i}"} for i in range(total)]
+
+    def find_collections(self, search, output_format="DICT", start_from=0, page_size=0):
+        self.calls.append((start_from, page_size))
+        return self.rows[start_from:start_from + page_size] if page_size else list(self.rows)
+
+
+@pytest.mark.asyncio
+async def test_iter_collections_pages_until_short_page():
+    clear_response_cache()
+    client = PagedClient(total=25)
+    service = CollectionService(config=CFG, manager=DirectManager(client))
+    pages = [page async for page in service.iter_collections("*", page_size=10)]
+    assert [len(p) for p in pages] == [10, 10, 5]
+    assert client.calls == [(0, 10), (10, 10), (20, 10)]
+    # Without page_size the call is unchanged: everything in one request
+    assert len(service.list_collections("*", use_cache=False)) == 25
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_stops_when_server_ignores_paging():
+    clear_response_cache()
+    client = PagedClient(total=30)
+    client.find_collections = lambda search, output_format="DICT", **_: list(client.rows)
+    service = CollectionService(config=CFG, manager=DirectManager(client))
+    pages = [page async for page in service.iter_collections("*", page_size=10)]
+    assert [len(p) for p in pages] == [30]
+
+
+class AsyncFakeClient(FakeClient):
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.peak = 0
+
+    async def _async_create_egeria_bearer_token(self, user_id, user_pwd):
+        return "token"
+
+    async def _async_find_collections(self, search, output_format="DICT"):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.calls.append("_async_find_collections")
+        return [{"GUID": "c1", "display_name": search}]
+
+
+@pytest.fixture
+def async_service():
+    clear_response_cache()
+    client = AsyncFakeClient()
+    amanager = AsyncEgeriaTechClientManager(CFG)
+    amanager._build_client = lambda: client
+    return CollectionService(config=CFG, manager=DirectManager(client), async_manager=amanager)
+
+
+@pytest.mark.asyncio
+async def test_async_calls_run_concurrently_on_the_loop(async_service):
+    client = async_service.manager.client
+    searches = [f"s{i}" for i in range(40)]
+    results = await asyncio.gather(*(async_service.list_collections_async(s) for s in searches))
+    assert [r[0]["display_name"] for r in results] == searches
+    assert client.peak == 40
+    # Served from the response cache shared with the sync path
+    assert async_service.list_collections("s0")[0]["display_name"] == "s0"
+    assert client.calls.count("find_collections") == 0
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_uses_a_thread_only_without_async_variant(async_service):
+    res = await async_service.add_collection_async({"display_name": "n", "description": "d", "category": "c"})
+    assert res == {"GUID": "c2"}
+    assert async_service.manager.client.calls == ["create_collection"]
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_times_out(async_service):
+    async def hang(*a, **k):
+        await asyncio.sleep(10)
+
+    async_service.manager.client._async_find_collections = hang
+    async_service._async_manager.retry_policy = RetryPolicy(max_attempts=1)
+    with pytest.raises(TimeoutError):
+        await async_service._ainvoke("find_collections", args=("x",), timeout=0.05)
+
+
+def test_identical_concurrent_reads_share_one_call(service):
+    import threading
+
+    release = threading.Event()
+    client = service.manager.client
+    original = client.find_collections
+
+    def slow_find(search, output_format="DICT"):
+        release.wait(2)
+        return original(search, output_format)
+
+    client.find_collections = slow_find
+    before = single_flight_stats()
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(service._invoke("find_collections", args=("x",), use_cache=False)))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    while single_flight_stats()["coalesced"] - before["coalesced"] < 4:
+        pass
+    release.set()
+    for t in threads:
+        t.join()
+    assert client.calls == ["find_collections"]
+    assert len(results) == 5 and all(r == results[0] for r in results)
+    # Each caller owns its list
+    assert len({id(r) for r in results}) == 5
+
+
+@pytest.mark.asyncio
+async def test_async_reads_coalesce_and_survive_a_cancelled_caller(async_service):
+    client = async_service.manager.client
+    first = asyncio.ensure_future(async_service.list_collections_async("x"))
+    others = [asyncio.ensure_future(async_service.list_collections_async("x")) for _ in range(3)]
+    await asyncio.sleep(0)
+    first.cancel()
+    results = await asyncio.gather(*others)
+    assert client.calls == ["_async_find_collections"]
+    assert all(r[0]["display_name"] == "x" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_async_read_is_cancelled_once_every_caller_gives_up(async_service):
+    client = async_service.manager.client
+    started, cancelled = asyncio.Event(), asyncio.Event()
+
+    async def hang(search, output_format="DICT"):
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    client._async_find_collections = hang
+    callers = [asyncio.ensure_future(async_service.list_collections_async("x")) for _ in range(2)]
+    await started.wait()
+    for c in callers:
+        c.cancel()
+    await asyncio.wait_for(cancelled.wait(), 1)
+    # The abandoned flight is gone: a new read makes a new call
+    del client._async_find_collections
+    assert (await async_service.list_collections_async("x"))[0]["display_name"] == "x"
+
+
+@pytest.mark.asyncio
+async def test_write_during_read_is_not_masked_by_the_stale_read(async_service):
+    client = async_service.manager.client
+    release = asyncio.Event()
+    original = client._async_find_collections
+
+    async def gated_find(search, output_format="DICT"):
+        await release.wait()
+        return await original(search, output_format)
+
+    client._async_find_collections = gated_find
+    pending = asyncio.ensure_future(async_service.list_collections_async("x"))
+    await asyncio.sleep(0)
+    await async_service.add_collection_async({"display_name": "n", "description": "d", "category": "c"})
+    # A read issued after the write must not join the read that started before it
+    after = asyncio.ensure_future(async_service.list_collections_async("x"))
+    release.set()
+    await asyncio.gather(pending, after)
+    assert client.calls.count("_async_find_collections") == 2
+    # ...and the pre-write result was not cached over the post-write one
+    await async_service.list_collections_async("x")
+    assert client.calls.count("_async_find_collections") == 2
@@ -0,0 +1,71 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import pytest
+
+from utils.config import EgeriaConfig
+from utils.disk_cache import DiskCache, close_disk_cache, get_disk_cache, scope_of
+from utils.swr import forget_rows, last_rows, load_snapshot, remember_rows, snapshot_key
+
+CFG = EgeriaConfig("https://localhost:9443", "qs-view-server", "erinoverview", "secret")
+
+
+def test_round_trip_respects_stamp_and_ttl(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = DiskCache(path, stamp="1:a")
+    cache.put("s", "collections", ("*",), [("g1", "Name")])
+    assert cache.flush() == 1
+    assert cache.load("s") == [("collections", ("*",), [("g1", "Name")])]
+    assert cache.load("other") == []
+    cache.close()
+
+    # Another version's file contents are ignored (and pruned)
+    assert DiskCache(path, stamp="1:b").load("s") == []
+    expired = DiskCache(path, stamp="1:a", ttl=0)
+    expired.put("s", "collections", ("*",), [("g1", "Name")])
+    expired.flush()
+    assert expired.load("s") == []
+
+
+def test_scope_excludes_password():
+    assert "secret" not in scope_of(CFG)
+    assert scope_of(CFG) == scope_of(CFG.with_overrides(password="other"))
+
+
+@pytest.fixture
+def disk_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("EGERIA_DISK_CACHE", str(tmp_path / "cache.sqlite3"))
+    close_disk_cache()
+    forget_rows()
+    yield
+    close_disk_cache()
+    forget_rows()
+
+
+@pytest.mark.asyncio
+async def test_snapshots_survive_a_restart(disk_env):
+    key = snapshot_key("collections", CFG, "*")
+    remember_rows(key, [("g1", "Customer Data")])
+    # Simulate a new process: flush to disk, drop everything in memory
+    close_disk_cache()
+    forget_rows()
+    assert get_disk_cache() is not None
+    # last_rows never reads SQLite; load_snapshot does, off the event loop
+    assert last_rows(key) is None
+    assert await load_snapshot(key) == [("g1", "Customer Data")]
+    # Another user on the same platform gets nothing from this user's cache
+    other = CFG.with_overrides(user="garygeeke")
+    assert await load_snapshot(snapshot_key("collections", other, "*")) is None
+
+
+def test_disabled_without_env(monkeypatch):
+    monkeypatch.delenv("EGERIA_DISK_CACHE", raising=False)
+    close_disk_cache()
+    assert get_disk_cache() is None
@@ -0,0 +1,144 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import threading
+import time
+
+import pytest
+
+from utils.config import EgeriaConfig
+from utils.egeria_client import (
+    AsyncEgeriaTechClientManager,
+    EgeriaClientPool,
+    EgeriaTechClientManager,
+    PooledClientManager,
+)
+
+
+CFG = EgeriaConfig("https://localhost:9443", "qs-view-server", "erinoverview", "secret")
+
+
+class FakeClient:
+    auth_calls = 0
+
+    def create_egeria_bearer_token(self, user_id, user_pwd):
+        FakeClient.auth_calls += 1
+        return "token"
+
+    def close_session(self):
+        pass
+
+    def find_collections(self, search, output_format="DICT"):
+        return [{"GUID": "c1", "display_name": search}]
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    FakeClient.auth_calls = 0
+
+    def get_client(self):
+        if self._client is None:
+            self._client = FakeClient()
+            self._authenticate()
+        return self._client
+
+    monkeypatch.setattr(EgeriaTechClientManager, "get_client", get_client)
+
+
+def test_checkout_reuses_idle_manager():
+    pool = EgeriaClientPool(max_size=2, idle_timeout=60)
+    first = pool.checkout(CFG)
+    pool.checkin(first)
+    assert pool.checkout(CFG) is first
+    assert pool.stats()["managers"] == 1
+
+
+def test_checkout_times_out_when_pool_is_full():
+    pool = EgeriaClientPool(max_size=1, idle_timeout=60)
+    pool.checkout(CFG)
+    with pytest.raises(TimeoutError):
+        pool.checkout(CFG, timeout=0.01)
+
+
+def test_idle_managers_are_evicted():
+    pool = EgeriaClientPool(max_size=2, idle_timeout=0.001)
+    pool.checkin(pool.checkout(CFG))
+    time.sleep(0.01)
+    assert pool.evict_idle() == 1
+    assert pool.stats()["managers"] == 0
+
+
+def test_pooled_managers_share_one_authentication(fake_client):
+    pool = EgeriaClientPool(max_size=2, idle_timeout=60)
+    call = lambda client, s: client.find_collections(s)
+    for search in ("a", "b", "c"):
+        # A new facade per "screen push" must not mean a new client
+        res = PooledClientManager(CFG, pool=pool).invoke_with_auto_refresh(call, args=(search,))
+        assert res[0]["display_name"] == search
+    assert FakeClient.auth_calls == 1
+
+
+def test_concurrent_refreshes_coalesce_into_one_authentication(fake_client):
+    manager = EgeriaTechClientManager(CFG)
+    manager.get_client()
+    seen = manager._auth_generation
+    workers = [
+        threading.Thread(target=manager.refresh_token, kwargs={"seen_generation": seen})
+        for _ in range(8)
+    ]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    # One initial authentication plus exactly one refresh for all eight stale callers
+    assert FakeClient.auth_calls == 2
+    manager.close()
+
+
+def test_background_renewal_runs_before_ttl(fake_client):
+    cfg = CFG.with_overrides(token_ttl_seconds=1, token_renew_ahead_seconds=1)
+    manager = EgeriaTechClientManager(cfg)
+    manager.get_client()
+    time.sleep(0.8)
+    assert FakeClient.auth_calls >= 2
+    manager.close()
+
+
+@pytest.mark.asyncio
+async def test_async_manager_refreshes_once_for_concurrent_auth_failures():
+    import asyncio
+
+    class AuthError(Exception):
+        status_code = 401
+
+    class AsyncClient(FakeClient):
+        expired = True
+
+        async def _async_create_egeria_bearer_token(self, user_id, user_pwd):
+            FakeClient.auth_calls += 1
+            AsyncClient.expired = False
+            await asyncio.sleep(0.01)
+
+        async def _async_find_collections(self, search):
+            if AsyncClient.expired:
+                raise AuthError("token expired")
+            return [search]
+
+    FakeClient.auth_calls = 0
+    manager = AsyncEgeriaTechClientManager(CFG)
+    manager._build_client = AsyncClient
+    await manager.get_client()
+    AsyncClient.expired = True
+
+    call = lambda client, s: client._async_find_collections(s)
+    results = await asyncio.gather(*(manager.invoke_with_auto_refresh(call, args=(i,)) for i in range(10)))
+    assert results == [[i] for i in range(10)]
+    # One initial authentication plus one refresh shared by all ten callers
+    assert FakeClient.auth_calls == 2
@@ -0,0 +1,78 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import contextvars
+import threading
+import time
+
+import pytest
+
+from utils.executor import EgeriaExecutor, Priority
+
+
+def test_interactive_jobs_run_before_background_ones():
+    ex = EgeriaExecutor(max_workers=1, per_platform=1)
+    gate = threading.Event()
+    order = []
+    started = threading.Event()
+    ex.submit(lambda: (started.set(), gate.wait()))  # occupy the only worker while the queue fills
+    started.wait(2)
+    futures = [ex.submit(order.append, f"bg{i}", priority=Priority.BACKGROUND) for i in range(3)]
+    futures += [ex.submit(order.append, f"ui{i}") for i in range(2)]
+    assert ex.stats()["queued"] == {"interactive": 2, "background": 3}
+    gate.set()
+    for f in futures:
+        f.result(timeout=2)
+    assert order == ["ui0", "ui1", "bg0", "bg1", "bg2"]
+    ex.shutdown()
+
+
+def test_per_platform_cap_leaves_room_for_other_platforms():
+    ex = EgeriaExecutor(max_workers=4, per_platform=2)
+    lock = threading.Lock()
+    running = {"a": 0, "b": 0}
+    peak = {"a": 0, "b": 0}
+
+    def call(platform):
+        with lock:
+            running[platform] += 1
+            peak[platform] = max(peak[platform], running[platform])
+        time.sleep(0.02)
+        with lock:
+            running[platform] -= 1
+
+    futures = [ex.submit(call, "a", platform="a") for _ in range(6)]
+    futures += [ex.submit(call, "b", platform="b") for _ in range(2)]
+    for f in futures:
+        f.result(timeout=2)
+    assert peak == {"a": 2, "b": 2}
+    stats = ex.stats()
+    assert stats["completed"] == 8 and stats["max_wait_seconds"] > 0
+    ex.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_propagates_results_and_errors():
+    ex = EgeriaExecutor(max_workers=2)
+    assert await ex.run(sum, [1, 2, 3]) == 6
+    with pytest.raises(ZeroDivisionError):
+        await ex.run(lambda: 1 / 0)
+    ex.shutdown()
+
+
+REQUEST_ID = contextvars.ContextVar("request_id", default=None)
+
+
+@pytest.mark.asyncio
+async def test_run_carries_the_callers_context():
+    ex = EgeriaExecutor(max_workers=1)
+    REQUEST_ID.set("r-1")
+    assert await ex.run(REQUEST_ID.get) == "r-1"
+    ex.shutdown()
@@ -40,3 +40,67 @@ def test_glossary_service_connection(monkeypatch):
 
     # terms = service.list_terms("123")
     # assert terms[0]["displayName"] == "Test Term"
+
+
+@pytest.mark.asyncio
+async def test_get_terms_for_glossaries_fans_out_with_bounded_concurrency():
+    import asyncio
+
+    service = GlossaryService()
+    state = {"active": 0, "peak": 0}
+
+    async def get_glossary_terms_async(glossary_guid, search="", columns=None):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.02)
+        state["active"] -= 1
+        if glossary_guid == "bad":
+            raise ConnectionError("view server unavailable")
+        return [{"guid": f"{glossary_guid}-t1"}]
+
+    service.get_glossary_terms_async = get_glossary_terms_async
+    results = [
+        r async for r in service.get_terms_for_glossaries(
+            ["g1", "g2", "bad", "g3", "g4", "g1"], max_concurrency=2
+        )
+    ]
+    assert sorted(r.glossary_guid for r in results) == ["bad", "g1", "g2", "g3", "g4"]
+    assert [r.glossary_guid for r in results if not r.ok] == ["bad"]
+    assert state["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_add_terms_reports_per_item_results_and_resumes():
+    import asyncio
+
+    service = GlossaryService()
+    state = {"active": 0, "peak": 0, "sent": [], "fail": {"T2"}}
+
+    async def _ainvoke(method_name, args=(), kwargs=None, use_cache=True, timeout=None):
+        body = args[1]
+        name = body["elementProperties"]["displayName"]
+        state["sent"].append(name)
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        if name in state["fail"]:
+            raise ConnectionError("view server unavailable")
+        return f"guid-{name}"
+
+    service._ainvoke = _ainvoke
+    payloads = [{"display_name": f"T{i}"} for i in range(6)] + [{"summary": "no name"}]
+
+    results = await service.add_terms("g1", payloads, concurrency=2, chunk_size=4)
+    assert [r.index for r in results] == list(range(7))
+    assert [r.guid for r in results[:2]] == ["guid-T0", "guid-T1"]
+    assert [r.index for r in results if not r.ok] == [2, 6]
+    assert isinstance(results[6].error, ValueError)
+    assert state["peak"] == 2
+
+    state["fail"].clear()
+    state["sent"].clear()
+    retried = await service.add_terms("g1", payloads, resume=results)
+    assert state["sent"] == ["T2"]
+    assert [r.index for r in retried if not r.ok] == [6]
+    assert retried[2].guid == "guid-T2"
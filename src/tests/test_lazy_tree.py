@@ -0,0 +1,114 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import asyncio
+
+import pytest
+from textual.app import App
+
+from widgets.lazy_tree import LazyNode, LazyTree, LazyTreeSource
+
+
+# root -> folder-0..2 -> product-<folder>-0..1
+def fetch_children(node_id):
+    if node_id == "root":
+        return [LazyNode(f"folder-{i}", f"Folder {i}") for i in range(3)]
+    return [LazyNode(f"product-{node_id}-{i}", f"Product {i}", expandable=False) for i in range(2)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_expansions_share_one_fetch_and_are_cached():
+    calls = []
+
+    async def slow_fetch(node_id):
+        calls.append(node_id)
+        await asyncio.sleep(0.01)
+        return fetch_children(node_id)
+
+    source = LazyTreeSource(slow_fetch)
+    first, second = await asyncio.gather(source.children("root"), source.children("root"))
+    assert first == second and len(first) == 3
+    await source.children("root")
+    assert calls == ["root"]
+
+    source.invalidate("root")
+    await source.children("root")
+    assert calls == ["root", "root"]
+
+
+class TreeApp(App):
+    def __init__(self, source):
+        super().__init__()
+        self.source = source
+
+    def compose(self):
+        yield LazyTree("Marketplace", self.source, "root")
+
+    def on_mount(self):
+        self.query_one(LazyTree).root.expand()
+
+
+@pytest.mark.asyncio
+async def test_tree_fetches_only_expanded_nodes():
+    fetched = []
+
+    def tracking_fetch(node_id):
+        fetched.append(node_id)
+        return fetch_children(node_id)
+
+    app = TreeApp(LazyTreeSource(tracking_fetch))
+    async with app.run_test() as pilot:
+        tree = app.query_one(LazyTree)
+        await pilot.pause()
+        await tree.workers.wait_for_complete()
+        assert [str(n.label) for n in tree.root.children] == ["Folder 0", "Folder 1", "Folder 2"]
+        assert fetched == ["root"]
+
+        folder = tree.root.children[1]
+        folder.expand()
+        await pilot.pause()
+        await tree.workers.wait_for_complete()
+        assert [n.data for n in folder.children] == ["product-folder-1-0", "product-folder-1-1"]
+        assert not folder.children[0].allow_expand
+        assert fetched == ["root", "folder-1"]
+
+
+class FakeMarketplaceService:
+    def get_collection_members(self, collection_guid):
+        return [{"GUID": f"{collection_guid}-p{i}", "display_name": f"Product {i}"} for i in range(2)]
+
+
+class MarketplaceApp(App):
+    async def on_mount(self):
+        from screens.GovernanceOfficer.marketplace_tree import MarketPlaceTree
+
+        await self.push_screen(MarketPlaceTree("mkt", service=FakeMarketplaceService()))
+
+
+@pytest.mark.asyncio
+async def test_select_opens_the_members_of_the_selected_node(monkeypatch):
+    from screens.a_collections.collection_members_screen import CollectionMemberScreen
+    from services.collection_service import CollectionService
+
+    requested = []
+    monkeypatch.setattr(CollectionService, "get_collection_members", lambda self, guid: requested.append(guid) or [])
+    app = MarketplaceApp()
+    async with app.run_test() as pilot:
+        screen = app.screen
+        await pilot.pause()
+        await screen.market_tree.workers.wait_for_complete()
+        node = screen.market_tree.root.children[1]
+        screen.market_tree.select_node(node)
+        await pilot.pause()
+        screen.query_one("#mt-select-button").press()
+        await pilot.pause()
+        assert isinstance(app.screen, CollectionMemberScreen)
+        assert app.screen.collection_guid == "mkt-p1"
+        assert requested == ["mkt-p1"]
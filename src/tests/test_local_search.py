@@ -0,0 +1,110 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import pytest
+from textual.app import App
+from textual.widgets import Input
+
+from screens.base_screen import BaseScreen
+from utils.local_search import LoadedRows, SubstringIndex
+from utils.swr import forget_rows, snapshot_key
+from widgets.virtual_table import VirtualTable
+
+ROWS = [
+    ("g1", "Customer Data", "Sales"),
+    ("g2", "Clinical Trials", "Research"),
+    ("g3", "customer-churn model", "Data Science"),
+]
+
+
+def test_substring_index_matches_like_the_server():
+    index = SubstringIndex(ROWS)
+    assert index.match("cust") == [0, 2]
+    assert index.match("CLIN") == [1]
+    assert index.match("data sc") == [2]
+    assert index.match("customer d") == [0]
+    assert index.match("customer-ch") == [2]
+    assert index.match("omer") == [0, 2]
+    assert index.match("") == [0, 1, 2]
+    # Inside a word too, as the server matches: "data" finds "Metadata Catalog"
+    assert SubstringIndex([("g9", "Metadata Catalog")]).match("data") == [0]
+
+
+def test_loaded_rows_covers_only_narrower_queries():
+    everything = LoadedRows("*", ROWS)
+    assert everything.covers("anything")
+    narrowed = LoadedRows("cust", ROWS[:1])
+    assert narrowed.covers("customer")
+    assert not narrowed.covers("cu")
+    assert not narrowed.covers("")
+    assert everything.filter("trial") == [ROWS[1]]
+
+
+class SearchScreen(BaseScreen):
+    SEARCH_DEBOUNCE_SECONDS = 0.05
+
+    def __init__(self):
+        super().__init__()
+        self.server_searches = []
+
+    def compose(self):
+        yield Input(id="search-input")
+        yield VirtualTable(id="t")
+
+    async def on_mount(self):
+        self.table = self.query_one(VirtualTable)
+        self.table.add_columns("GUID", "Name", "Area")
+
+    async def load(self, search=""):
+        async def fetch():
+            self.server_searches.append(search)
+            return [r for r in ROWS if search.lower() in r[1].lower()]
+
+        await self.run_load(
+            self.table.id, self.load_rows_swr(self.table, snapshot_key("search-test", search), fetch, search=search)
+        )
+
+    async def run_search(self, query):
+        if not self.filter_loaded_rows(self.table, query):
+            await self.load(query)
+
+
+class SearchApp(App):
+    async def on_mount(self):
+        await self.push_screen(SearchScreen())
+
+
+@pytest.mark.asyncio
+async def test_typing_is_debounced_and_filtered_locally():
+    forget_rows()
+    app = SearchApp()
+    async with app.run_test() as pilot:
+        screen = pilot.app.screen
+        await screen.load()
+        screen.set_focus(screen.query_one(Input))
+        await pilot.press("c", "u", "s")
+        await pilot.pause(0.2)
+        assert [k for k, _ in screen.table.keyed_rows()] == ["g1", "g3"]
+        # Only the initial load reached the server; the keystrokes were answered locally
+        assert screen.server_searches == [""]
+
+
+@pytest.mark.asyncio
+async def test_wider_search_than_loaded_goes_to_server():
+    forget_rows()
+    app = SearchApp()
+    async with app.run_test() as pilot:
+        screen = pilot.app.screen
+        await screen.load("customer")
+        await screen.run_search("customer d")
+        assert screen.server_searches == ["customer"]
+        await screen.run_search("clin")
+        assert screen.server_searches == ["customer", "clin"]
+        assert [k for k, _ in screen.table.keyed_rows()] == ["g2"]
@@ -0,0 +1,180 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for the streaming metadata import of my_egeria.
+
+
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tomllib
+from pathlib import Path
+
+import pytest
+
+from services.glossary_service import GlossaryService
+from services.metadata_import import import_metadata
+from utils.import_source import ImportCheckpoint, read_rows
+
+CSV = (
+    "display_name,summary,aliases,glossary_guid\n"
+    'Alpha,"first, with a comma",A1;A2,g1\n'
+    'Beta,"spans\ntwo lines",,g1\n'
+    ",no name,,g1\n"
+    "Gamma,third,,g2\n"
+)
+
+
+def test_read_rows_streams_csv_and_resumes_from_an_offset(tmp_path):
+    path = tmp_path / "terms.csv"
+    path.write_text(CSV, encoding="utf-8")
+
+    rows = list(read_rows(str(path)))
+    assert [r.number for r in rows] == [1, 2, 3, 4]
+    assert rows[0].data == {"display_name": "Alpha", "summary": "first, with a comma", "aliases": ["A1", "A2"], "glossary_guid": "g1"}
+    assert rows[1].data["summary"] == "spans\ntwo lines"
+    assert "display_name" not in rows[2].data
+
+    resumed = list(read_rows(str(path), offset=rows[1].offset, number=rows[1].number))
+    assert [(r.number, r.data.get("display_name")) for r in resumed] == [(3, None), (4, "Gamma")]
+
+
+def test_read_rows_reports_unparseable_jsonl_lines(tmp_path):
+    path = tmp_path / "glossaries.jsonl"
+    path.write_text('{"display_name": "G1"}\n\nnot json\n[1]\n', encoding="utf-8")
+    rows = list(read_rows(str(path)))
+    assert [r.error is None for r in rows] == [True, False, False]
+    assert rows[-1].offset == path.stat().st_size
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_bad_rows_checkpoints_and_resumes(tmp_path, monkeypatch):
+    path = tmp_path / "terms.csv"
+    path.write_text(CSV, encoding="utf-8")
+    sent, failing = [], {"Gamma"}
+
+    async def _ainvoke(self, method_name, args=(), kwargs=None, use_cache=True, timeout=None):
+        name = args[1]["elementProperties"]["displayName"]
+        sent.append((args[0], name))
+        if name in failing:
+            raise ConnectionError("view server unavailable")
+        return f"guid-{name}"
+
+    monkeypatch.setattr(GlossaryService, "_ainvoke", _ainvoke)
+
+    progress = await import_metadata(str(path), "terms", batch_size=2)
+    assert (progress.rows, progress.created, progress.invalid, progress.failed) == (4, 2, 1, 1)
+    assert sorted(sent) == [("g1", "Alpha"), ("g1", "Beta"), ("g2", "Gamma")]
+    rejected = [json.loads(line) for line in (tmp_path / "terms.csv.errors.jsonl").read_text().splitlines()]
+    assert [(r["import_row"], r["import_error"].split(":")[0]) for r in rejected] == [
+        (3, "display_name is required to create a term"),
+        (4, "ConnectionError"),
+    ]
+    checkpoint = ImportCheckpoint.load(str(tmp_path / "terms.csv.checkpoint.json"))
+    assert checkpoint.done and checkpoint.offset == path.stat().st_size
+
+    # Interrupted after the first batch: the rerun sends only what comes after it
+    sent.clear()
+    failing.clear()
+
+    def stop_after_first_batch(p):
+        if not p.done:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        await import_metadata(str(path), "terms", batch_size=2, restart=True, on_progress=stop_after_first_batch)
+    assert sorted(sent) == [("g1", "Alpha"), ("g1", "Beta")]
+    sent.clear()
+    progress = await import_metadata(str(path), "terms", batch_size=2)
+    assert sent == [("g2", "Gamma")]
+    assert (progress.rows, progress.created, progress.invalid, progress.failed) == (4, 3, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_resume_of_a_partly_written_batch_skips_records_already_created(tmp_path, monkeypatch):
+    path = tmp_path / "terms.csv"
+    path.write_text(CSV, encoding="utf-8")
+    rows = list(read_rows(str(path)))
+    stat = path.stat()
+    # Interrupted while writing the first two rows, after Alpha was created
+    ImportCheckpoint(
+        str(path), "terms", pending=rows[1].offset, size=stat.st_size, mtime=stat.st_mtime
+    ).save(str(tmp_path / "terms.csv.checkpoint.json"))
+    sent, looked_up = [], []
+
+    async def _ainvoke(self, method_name, args=(), kwargs=None, use_cache=True, timeout=None):
+        if method_name == "find_glossary_terms":
+            looked_up.append(args[0])
+            return [{"display_name": "Alpha"}] if args[0] == "Alpha" else []
+        sent.append(args[1]["elementProperties"]["displayName"])
+        return "guid"
+
+    monkeypatch.setattr(GlossaryService, "_ainvoke", _ainvoke)
+
+    progress = await import_metadata(str(path), "terms", batch_size=2)
+    assert sorted(looked_up) == ["Alpha", "Beta"]
+    assert sorted(sent) == ["Beta", "Gamma"]
+    assert (progress.created, progress.invalid, progress.failed) == (3, 1, 0)
+
+    # The file changed since: the checkpoint no longer applies and the import starts over
+    path.write_text(CSV + "Delta,fourth,,g2\n", encoding="utf-8")
+    sent.clear()
+    progress = await import_metadata(str(path), "terms", batch_size=2)
+    assert sorted(sent) == ["Alpha", "Beta", "Delta", "Gamma"]
+
+
+@pytest.mark.asyncio
+async def test_import_leaves_the_search_index_alone(tmp_path, monkeypatch):
+    path = tmp_path / "terms.csv"
+    path.write_text(CSV, encoding="utf-8")
+
+    async def _ainvoke(self, method_name, args=(), kwargs=None, use_cache=True, timeout=None):
+        return "guid-" + args[1]["elementProperties"]["displayName"]
+
+    monkeypatch.setattr(GlossaryService, "_ainvoke", _ainvoke)
+    index = GlossaryService()._search_index("terms")
+    index.load([{"GUID": "t1", "display_name": "Existing"}])
+
+    await import_metadata(str(path), "terms", batch_size=2)
+    # Not grown by the import, but no longer complete: it lacks the imported terms
+    assert len(index) == 1 and not index.complete
+
+
+@pytest.mark.asyncio
+async def test_unindexed_add_terms_sends_searches_back_to_the_server(monkeypatch):
+    async def _ainvoke(self, method_name, args=(), kwargs=None, use_cache=True, timeout=None):
+        return "guid-" + args[1]["elementProperties"]["displayName"]
+
+    monkeypatch.setattr(GlossaryService, "_ainvoke", _ainvoke)
+    service = GlossaryService()
+    service._search_index("terms").load([{"GUID": "t1", "display_name": "Customer"}])
+    assert service.search_indexed("terms", "cust") is not None
+
+    results = await service.add_terms("g1", [{"display_name": "Customer Churn"}], index=False)
+    assert results[0].ok
+    # The index would miss "Customer Churn"; None tells the caller to ask the server
+    assert service.search_indexed("terms", "cust") is None
+
+
+def test_console_script_entry_point_imports_as_installed(tmp_path):
+    # Run the entry point the way the generated console script does: `src` is a package
+    # on the path, but src/ itself is not
+    project = Path(__file__).resolve().parents[2]
+    with open(project / "pyproject.toml", "rb") as f:
+        target = tomllib.load(f)["tool"]["poetry"]["scripts"]["my_egeria_import"]
+    module, func = target.split(":")
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONPATH"}
+    done = subprocess.run(
+        [sys.executable, "-c", f"import sys; from {module} import {func}; sys.exit({func}(['terms', 'missing.csv']))"],
+        cwd=project,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert done.returncode == 2, done.stderr
+    assert "Import failed" in done.stderr
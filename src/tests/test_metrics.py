@@ -0,0 +1,88 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import json
+
+import pytest
+from textual.app import App
+
+from screens.diagnostics_screen import DiagnosticsScreen
+from services.base_service import clear_response_cache
+from services.collection_service import CollectionService
+from utils import metrics
+from utils.metrics import CALL_METRICS, Histogram, export_json, export_prometheus
+
+from tests.test_base_service import CFG, DirectManager, FakeClient
+
+
+def test_histogram_quantiles_are_within_their_bucket():
+    h = Histogram((0.01, 0.1, 1.0))
+    for _ in range(90):
+        h.observe(0.005)
+    for _ in range(10):
+        h.observe(0.5)
+    assert 0 < h.quantile(0.5) <= 0.01
+    assert 0.1 < h.quantile(0.99) <= 0.5
+    assert h.summary()["count"] == 100
+
+
+def test_service_calls_record_latency_payload_and_cache_use():
+    clear_response_cache()
+    CALL_METRICS.reset()
+    service = CollectionService(config=CFG, manager=DirectManager(FakeClient()))
+    service.list_collections("*")
+    service.list_collections("*")
+    m = CALL_METRICS.snapshot()["find_collections"]
+    assert (m["calls"], m["attempts"], m["errors"]) == (1, 1, 0)
+    assert (m["cache_hits"], m["cache_misses"]) == (1, 1)
+    assert m["latency"]["count"] == 1 and m["payload"]["max"] >= 1
+
+
+def test_exports_cover_methods_and_registered_stats():
+    clear_response_cache()
+    CALL_METRICS.reset()
+    CollectionService(config=CFG, manager=DirectManager(FakeClient())).list_collections("*")
+    data = json.loads(export_json())
+    assert "find_collections" in data["methods"] and "response_cache" in data
+    text = export_prometheus()
+    assert '# TYPE egeria_call_duration_seconds histogram' in text
+    assert 'egeria_call_duration_seconds_bucket{method="find_collections",le="+Inf"} 1' in text
+    assert 'egeria_cache_misses_total{method="find_collections"} 1' in text
+    assert "egeria_response_cache_hit_ratio" in text
+
+
+def test_prometheus_families_of_list_stats_are_contiguous(monkeypatch):
+    rows = [{"kind": "terms", "records": 3, "queries": 1}, {"kind": "glossaries", "records": 2, "queries": 5}]
+    monkeypatch.setitem(metrics._STATS_SOURCES, "test_indexes", lambda: rows)
+    lines = [line for line in export_prometheus().splitlines() if "egeria_test_indexes_" in line]
+    assert lines == [
+        "# TYPE egeria_test_indexes_queries untyped",
+        'egeria_test_indexes_queries{kind="terms"} 1',
+        'egeria_test_indexes_queries{kind="glossaries"} 5',
+        "# TYPE egeria_test_indexes_records untyped",
+        'egeria_test_indexes_records{kind="terms"} 3',
+        'egeria_test_indexes_records{kind="glossaries"} 2',
+    ]
+
+
+class DiagnosticsApp(App):
+    async def on_mount(self):
+        await self.push_screen(DiagnosticsScreen())
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_screen_lists_methods():
+    clear_response_cache()
+    CALL_METRICS.reset()
+    CollectionService(config=CFG, manager=DirectManager(FakeClient())).list_collections("*")
+    async with DiagnosticsApp().run_test() as pilot:
+        await pilot.pause()
+        table = pilot.app.screen.table
+        assert [key for key, _ in table.keyed_rows()] == ["find_collections"]
@@ -0,0 +1,71 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import pytest
+
+from services.base_service import clear_response_cache, invalidate_method_cache
+from services.collection_service import CollectionService
+from services.projections import COLLECTION_COLUMNS, Projection
+
+from tests.test_base_service import CFG, DirectManager, FakeClient
+
+WIDE = {
+    "GUID": "c1",
+    "display_name": "Sales",
+    "qualified_name": "Collection::Sales",
+    "description": "d",
+    "classifications": [{"name": "Anchors"}] * 20,
+    "members": [{"guid": f"m{i}"} for i in range(50)],
+}
+
+
+class ProjectingClient(FakeClient):
+    def __init__(self):
+        super().__init__()
+        self.format_sets = []
+
+    def find_collections(self, search, output_format="DICT", output_format_set=None):
+        self.format_sets.append(output_format_set)
+        keys = [c["key"] for c in output_format_set["formats"]["columns"]] if output_format_set else list(WIDE)
+        return [{k: v for k, v in WIDE.items() if k.lower() in keys or k in keys}]
+
+
+class LegacyClient(FakeClient):
+    def find_collections(self, search, output_format="DICT"):
+        self.calls.append(search)
+        return [dict(WIDE)]
+
+
+def test_projection_is_sent_as_an_output_format_set():
+    clear_response_cache()
+    client = ProjectingClient()
+    service = CollectionService(config=CFG, manager=DirectManager(client))
+    rows = service.list_collections("*", columns=COLLECTION_COLUMNS)
+    assert [c["key"] for c in client.format_sets[0]["formats"]["columns"]][:3] == ["guid", "display_name", "qualified_name"]
+    assert set(rows[0]) == {"GUID", "display_name", "qualified_name", "description"}
+    # Without a projection the full element comes back, as before
+    assert "members" in service.list_collections("*", columns=None)[0]
+
+
+def test_client_without_output_format_set_is_trimmed_locally_and_not_asked_again():
+    clear_response_cache()
+    invalidate_method_cache()
+    client = LegacyClient()
+    service = CollectionService(config=CFG, manager=DirectManager(client))
+    rows = service.list_collections("*", columns=COLLECTION_COLUMNS, use_cache=False)
+    assert "members" not in rows[0] and rows[0]["display_name"] == "Sales"
+    assert len(client.calls) == 1
+    service.list_collections("*", columns=COLLECTION_COLUMNS, use_cache=False)
+    assert len(client.calls) == 2
+
+
+def test_projection_rejects_unknown_fields():
+    with pytest.raises(ValueError):
+        Projection("Bad", ("guid", "members"))
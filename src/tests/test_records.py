@@ -0,0 +1,50 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+from dataclasses import dataclass
+
+import pytest
+
+from services.collection_service import CollectionService
+from services.records import CollectionRecord, GovernanceDefinitionRecord, TermRecord, _Record
+
+from tests.test_base_service import CFG, DirectManager, PagedClient
+
+
+def test_records_map_each_key_spelling_once():
+    snake = CollectionRecord.from_dict({"GUID": "c1", "display_name": "A", "qualified_name": "q", "summary": "s"})
+    camel = CollectionRecord.from_dict({"guid": "c1", "displayName": "A", "qualifiedName": "q", "summary": "s"})
+    assert snake == camel == CollectionRecord("c1", "A", "q", "s")
+    gov = GovernanceDefinitionRecord.from_dict({"GUID": "d1", "Display Name": "D", "Type Name": "Policy"})
+    assert (gov.display_name, gov.type_name) == ("D", "Policy")
+    term = TermRecord.from_dict({"guid": "t1", "displayName": "T", "description": "d", "aliases": "x"})
+    assert (term.summary_or_description, term.aliases) == ("d", ("x",))
+
+
+def test_records_are_slotted_and_share_common_strings():
+    a, b = CollectionRecord.from_list([{"GUID": "1", "category": "Data" + "Products"}, {"GUID": "2", "category": "DataProducts"}, "junk"])
+    assert not hasattr(a, "__dict__")
+    assert a.category is b.category
+
+
+def test_a_record_without_from_dict_cannot_be_created():
+    @dataclass(frozen=True, slots=True)
+    class Incomplete(_Record):
+        guid: str = ""
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+@pytest.mark.asyncio
+async def test_iter_collections_yields_records():
+    service = CollectionService(config=CFG, manager=DirectManager(PagedClient(total=3)))
+    pages = [page async for page in service.iter_collections("*", page_size=2, use_cache=False)]
+    assert [[c.guid for c in page] for page in pages] == [["c0", "c1"], ["c2"]]
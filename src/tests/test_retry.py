@@ -0,0 +1,116 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import pytest
+
+from utils.config import EgeriaConfig
+from utils.egeria_client import EgeriaTechClientManager
+from utils.retry import ErrorKind, RetryPolicy, classify_error, get_retry_metrics, RETRY_METRICS
+
+
+CFG = EgeriaConfig("https://localhost:9443", "qs-view-server", "erinoverview", "secret")
+
+
+class HTTPError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class ReadTimeout(Exception):
+    pass
+
+
+class PyegeriaUnauthorizedException(Exception):
+    pass
+
+
+@pytest.mark.parametrize(
+    "exc, kind",
+    [
+        (HTTPError(401), ErrorKind.AUTH),
+        (PyegeriaUnauthorizedException("no"), ErrorKind.AUTH),
+        (Exception("Token expired for user"), ErrorKind.AUTH),
+        (HTTPError(503), ErrorKind.TRANSIENT),
+        (ReadTimeout(), ErrorKind.TRANSIENT),
+        (ConnectionResetError(), ErrorKind.TRANSIENT),
+        (HTTPError(404), ErrorKind.FATAL),
+        (HTTPError(500), ErrorKind.FATAL),
+        (AttributeError("Client has no method 'x'"), ErrorKind.FATAL),
+        (RuntimeError("boom"), ErrorKind.FATAL),
+    ],
+)
+def test_classify_error(exc, kind):
+    assert classify_error(exc) is kind
+
+
+def test_classify_error_follows_cause_chain():
+    try:
+        try:
+            raise HTTPError(401)
+        except HTTPError as inner:
+            raise RuntimeError("wrapped") from inner
+    except RuntimeError as e:
+        assert classify_error(e) is ErrorKind.AUTH
+
+
+class FakeClient:
+    def create_egeria_bearer_token(self, user_id, user_pwd):
+        return "token"
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    m = EgeriaTechClientManager(CFG.with_overrides(token_renew_ahead_seconds=0))
+    m._client = FakeClient()
+    m._authenticate()
+    monkeypatch.setattr(m, "get_client", lambda: m._client)
+    m.retry_policy = RetryPolicy(max_attempts=3, base_delay=0, max_delay=0)
+    RETRY_METRICS.reset()
+    yield m
+    m.close()
+
+
+def _failing(errors):
+    calls = []
+
+    def fn(client):
+        calls.append(1)
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    return fn, calls
+
+
+def test_fatal_errors_fail_fast(manager):
+    fn, calls = _failing([HTTPError(404)])
+    with pytest.raises(HTTPError):
+        manager.invoke_with_auto_refresh(fn)
+    assert len(calls) == 1
+    assert manager._auth_generation == 1
+
+
+def test_auth_errors_refresh_once(manager):
+    fn, calls = _failing([HTTPError(401)])
+    assert manager.invoke_with_auto_refresh(fn) == "ok"
+    assert len(calls) == 2
+    assert manager._auth_generation == 2
+    assert get_retry_metrics()["auth_refreshes"] == 1
+
+
+def test_transient_errors_retry_up_to_policy(manager):
+    fn, calls = _failing([ReadTimeout(), ReadTimeout(), ReadTimeout()])
+    with pytest.raises(ReadTimeout):
+        manager.invoke_with_auto_refresh(fn)
+    assert len(calls) == 3
+    metrics = get_retry_metrics()
+    assert metrics["transient_retries"] == 2
+    assert metrics["failed_transient"] == 1
@@ -0,0 +1,124 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import pytest
+
+from services.base_service import clear_response_cache
+from services.collection_service import CollectionService
+from services.projections import Projection
+from utils.search_index import SearchIndex, indexable_query
+
+from tests.test_base_service import CFG, DirectManager, FakeClient
+
+RECORDS = [
+    {"GUID": "g1", "display_name": "Customer Data", "description": "Sales records"},
+    {"GUID": "g2", "display_name": "Clinical Trials", "qualified_name": "Research::Customer Feedback"},
+    {"GUID": "g3", "display_name": "Churn", "summary": "customer churn model", "aliases": ["Attrition"]},
+]
+
+
+def test_and_prefix_queries_ranked_by_field():
+    index = SearchIndex()
+    index.load(RECORDS)
+    # Display-name matches outrank qualified-name ones, which outrank summaries
+    assert [r["GUID"] for r in index.search("cust")] == ["g1", "g2", "g3"]
+    assert [r["GUID"] for r in index.search("customer ch")] == ["g3"]
+    assert [r["GUID"] for r in index.search("attr")] == ["g3"]
+    assert index.search("customer nothing") == []
+
+
+def test_incremental_add_and_remove():
+    index = SearchIndex()
+    index.load(RECORDS)
+    index.add({"GUID": "g4", "display_name": "Customer 360"})
+    index.remove("g1")
+    index.add({"GUID": "g3", "display_name": "Retention"})
+    assert [r["GUID"] for r in index.search("customer")] == ["g4", "g2"]
+    assert [r["GUID"] for r in index.search("ret")] == ["g3"]
+    assert index.search("churn") == []
+
+
+def test_paged_wildcard_listing_completes_only_in_order():
+    index = SearchIndex()
+    index.ingest(RECORDS[:2], "*", start_from=0, page_size=2)
+    assert not index.complete
+    index.ingest(RECORDS[2:], "*", start_from=2, page_size=2)
+    assert index.complete and len(index) == 3
+
+    gappy = SearchIndex()
+    gappy.ingest(RECORDS[:2], "*", start_from=0, page_size=2)
+    gappy.ingest(RECORDS[2:], "*", start_from=4, page_size=2)
+    assert not gappy.complete
+
+
+def test_indexable_query_rejects_wildcards_and_regex():
+    assert indexable_query("customer data")
+    assert not indexable_query("*")
+    assert not indexable_query("cust.*")
+    assert not indexable_query("")
+
+
+class ListingClient(FakeClient):
+    def find_collections(self, search, output_format="DICT"):
+        self.calls.append(("find_collections", search))
+        return [dict(r) for r in RECORDS]
+
+    def delete_collection(self, guid):
+        self.calls.append(("delete_collection", guid))
+
+
+@pytest.fixture
+def collections():
+    clear_response_cache()
+    return CollectionService(config=CFG, manager=DirectManager(ListingClient()))
+
+
+def test_indexed_search_answers_locally_after_full_listing(collections):
+    client = collections.manager.client
+    assert collections.search_indexed("collections", "clin") is None
+    collections.list_collections("*")
+    assert [r["GUID"] for r in collections.search_indexed("collections", "clin")] == ["g2"]
+    assert client.calls == [("find_collections", "*")]
+
+
+def test_list_searches_keep_server_substring_semantics(collections):
+    client = collections.manager.client
+    collections.list_collections("*")
+    # "ata" sits inside "Data": the index (word prefixes) can't find it, the server can
+    assert collections.search_indexed("collections", "ata") == []
+    assert "g1" in [r["GUID"] for r in collections.list_collections("ata")]
+    assert client.calls[-1] == ("find_collections", "ata")
+
+
+def test_deleted_collection_leaves_the_index(collections):
+    collections.list_collections("*")
+    collections.delete_collection({"guid": "g1", "display_name": "Customer Data", "description": "d"})
+    assert [r["GUID"] for r in collections.search_indexed("collections", "customer")] == ["g2", "g3"]
+
+
+def test_cached_listing_does_not_rebuild_the_index(collections, monkeypatch):
+    collections.list_collections("*")
+    index = collections._search_index("collections")
+    loads = []
+    monkeypatch.setattr(index, "_load_locked", lambda records: loads.append(records))
+    collections.list_collections("*")
+    assert loads == [] and index.complete
+    collections.list_collections("*", use_cache=False)
+    assert len(loads) == 1
+
+
+def test_projected_listing_does_not_answer_wider_searches(collections):
+    narrow = Projection("Names", ("guid", "display_name"))
+    collections.list_collections("*", columns=narrow)
+    assert collections.search_indexed("collections", "clin", columns=narrow) == [
+        {"GUID": "g2", "display_name": "Clinical Trials"}
+    ]
+    # Every property was asked for, but the index only holds names
+    assert collections.search_indexed("collections", "clin") is None
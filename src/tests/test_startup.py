@@ -0,0 +1,59 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[1]
+
+# Generous by default so slow CI machines pass; tighten locally with EGERIA_STARTUP_BUDGET_MS
+BUDGET_SECONDS = float(os.getenv("EGERIA_STARTUP_BUDGET_MS", "2000")) / 1000
+
+PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import my_egeria
+elapsed = time.perf_counter() - t0
+print(json.dumps({"seconds": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _cold_import():
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=SRC_DIR, capture_output=True, text=True, check=True, timeout=60
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_importing_the_app_defers_screens_and_pyegeria():
+    result = _cold_import()
+    modules = set(result["modules"])
+    assert not {m for m in modules if m == "pyegeria" or m.startswith("pyegeria.")}
+    assert "screens.glossary.glossary_browser" not in modules
+    assert "services.governance_officer_service" not in modules
+    print(f"cold import of my_egeria: {result['seconds'] * 1000:.0f} ms")
+    assert result["seconds"] < BUDGET_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_splash_is_shown_first():
+    import my_egeria
+
+    t0 = time.perf_counter()
+    async with my_egeria.MyEgeria().run_test() as pilot:
+        await pilot.pause()
+        assert type(pilot.app.screen).__name__ == "SplashScreen"
+        assert time.perf_counter() - t0 < BUDGET_SECONDS
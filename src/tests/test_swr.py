@@ -0,0 +1,131 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import asyncio
+
+import pytest
+from textual.app import App
+from textual.widgets import DataTable
+
+from screens.base_screen import BaseScreen
+from utils.swr import forget_rows, keyed_rows, last_rows, plan_row_patch, remember_rows, snapshot_key
+
+
+def test_keyed_rows_uses_guid_and_disambiguates():
+    rows = [("g1", "a"), ("g1", "b"), ("", "placeholder")]
+    assert [k for k, _ in keyed_rows(rows)] == ["g1", "g1#1", "__row2"]
+
+
+def test_plan_row_patch_minimal_edits():
+    current = keyed_rows([("g1", "a"), ("g2", "b"), ("g3", "c")])
+    new = keyed_rows([("g1", "a"), ("g3", "C"), ("g4", "d")])
+    patch = plan_row_patch(current, new)
+    assert not patch.rebuild
+    assert patch.removed == ["g2"]
+    assert patch.updated == [("g3", 1, "C")]
+    assert patch.added == [("g4", ("g4", "d"))]
+
+
+def test_plan_row_patch_rebuilds_on_reorder():
+    current = keyed_rows([("g1", "a"), ("g2", "b")])
+    new = keyed_rows([("g2", "b"), ("g1", "a")])
+    assert plan_row_patch(current, new).rebuild
+
+
+class TableScreen(BaseScreen):
+    def compose(self):
+        yield DataTable(id="t")
+
+    async def on_mount(self):
+        self.table = self.query_one(DataTable)
+        self.table.add_columns("GUID", "Name")
+
+
+class SWRApp(App):
+    async def on_mount(self):
+        await self.push_screen(TableScreen())
+
+
+@pytest.mark.asyncio
+async def test_load_rows_swr_paints_snapshot_then_applies_fresh_rows():
+    forget_rows()
+    key = snapshot_key("test", "*")
+    remember_rows(key, [("g1", "stale"), ("g2", "gone")])
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        return [("g1", "fresh"), ("g3", "new")]
+
+    app = SWRApp()
+    async with app.run_test() as pilot:
+        screen = pilot.app.screen
+        await screen.load_rows_swr(screen.table, key, fetch)
+        # Stale rows are visible before the fetch completes
+        assert screen.table.get_row("g2") == ["g2", "gone"]
+        release.set()
+        await pilot.pause()
+        await screen.workers.wait_for_complete()
+        rows = [tuple(screen.table.get_row(r.key)) for r in screen.table.ordered_rows]
+        assert rows == [("g1", "fresh"), ("g3", "new")]
+
+
+@pytest.mark.asyncio
+async def test_new_load_cancels_and_discards_the_superseded_one():
+    forget_rows()
+    slow_started, slow_cancelled = asyncio.Event(), asyncio.Event()
+
+    async def slow_pages():
+        try:
+            yield [("old1", "first page")]
+            slow_started.set()
+            await asyncio.sleep(10)
+            yield [("old2", "never shown")]
+        finally:
+            slow_cancelled.set()
+
+    async def fast():
+        return [("new", "latest")]
+
+    app = SWRApp()
+    async with app.run_test() as pilot:
+        screen = pilot.app.screen
+        table = screen.table
+        first = asyncio.ensure_future(
+            screen.run_load(table.id, screen.load_rows_swr(table, snapshot_key("t", "a"), slow_pages))
+        )
+        await slow_started.wait()
+        assert await screen.run_load(table.id, screen.load_rows_swr(table, snapshot_key("t", "b"), fast))
+        assert await first is False
+        assert slow_cancelled.is_set()
+        rows = [tuple(table.get_row(r.key)) for r in table.ordered_rows]
+        assert rows == [("new", "latest")]
+        # The superseded search never completed, so nothing was remembered for it
+        assert last_rows(snapshot_key("t", "a")) is None
+
+
+@pytest.mark.asyncio
+async def test_first_visit_appends_each_page_without_rediffing():
+    forget_rows()
+
+    async def pages():
+        yield [("g1", "one"), ("g2", "two")]
+        yield [("g3", "three"), ("g1", "duplicate")]
+
+    app = SWRApp()
+    async with app.run_test() as pilot:
+        screen = pilot.app.screen
+        synced = []
+        screen.sync_table_rows = lambda table, rows: synced.append(rows)
+        await screen.load_rows_swr(screen.table, snapshot_key("paged", "*"), pages)
+        assert synced == []
+        keys = [r.key.value for r in screen.table.ordered_rows]
+        assert keys == ["g1", "g2", "g3", "g1#1"]
+        assert last_rows(snapshot_key("paged", "*"))[-1] == ("g1", "duplicate")
@@ -0,0 +1,73 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file is a unit test for my_egeria.
+
+
+"""
+
+import pytest
+from textual.app import App
+
+from widgets.virtual_table import VirtualTable
+
+
+class TableApp(App):
+    def __init__(self):
+        super().__init__()
+        self.selected = []
+
+    def compose(self):
+        yield VirtualTable(id="t")
+
+    def on_mount(self):
+        table = self.query_one(VirtualTable)
+        table.add_columns("GUID", "Name")
+        table.focus()
+
+    def on_virtual_table_row_selected(self, event: VirtualTable.RowSelected):
+        self.selected.append(event.row_key)
+
+
+def test_rows_are_normalized_and_keyed():
+    table = VirtualTable()
+    table.add_columns("GUID", "Name", "Description")
+    table.add_row("g1", None, "two\nlines", key="g1")
+    assert table.get_row("g1") == ["g1", "", "two lines"]
+    table.update_cell("g1", "Name", "renamed")
+    assert table.get_row("g1")[1] == "renamed"
+    with pytest.raises(ValueError):
+        table.add_row("g1", key="g1")
+    table.remove_row("g1")
+    assert table.row_count == 0
+
+
+def test_remove_rows_in_one_pass():
+    table = VirtualTable()
+    table.add_columns("GUID", "Name")
+    table.add_rows([(f"g{i}", f"n{i}") for i in range(6)], keys=[f"g{i}" for i in range(6)])
+    table.remove_rows(["g1", "g4", "g5"])
+    assert [k for k, _ in table.keyed_rows()] == ["g0", "g2", "g3"]
+    assert table.get_row("g3") == ["g3", "n3"]
+    with pytest.raises(KeyError):
+        table.remove_rows(["g1"])
+
+
+@pytest.mark.asyncio
+async def test_stream_rows_and_cursor_selection():
+    async def pages():
+        for start in range(0, 10_000, 2_500):
+            yield [(f"g{i}", f"row {i}") for i in range(start, start + 2_500)]
+
+    app = TableApp()
+    async with app.run_test() as pilot:
+        table = app.query_one(VirtualTable)
+        added = await table.stream_rows(pages(), batch_size=1_000)
+        assert added == table.row_count == 10_000
+        await pilot.press("end", "enter")
+        await pilot.pause()
+        assert table.cursor_row == 9_999
+        assert table.get_row_at(9_999) == ["g9999", "row 9999"]
+        assert app.selected == [table.keyed_rows()[-1][0]]
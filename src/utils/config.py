@@ -22,6 +22,7 @@ class EgeriaConfig:
     user: str
     password: str
     token_ttl_seconds: int = 900  # refresh proactively every 15 minutes by default
+    token_renew_ahead_seconds: int = 60  # background renewal this long before the TTL runs out
 
     @staticmethod
     def from_env() -> "EgeriaConfig":
@@ -39,6 +40,7 @@ class EgeriaConfig:
             user=os.getenv("EGERIA_USER", "erinoverview"),
             password=os.getenv("EGERIA_USER_PASSWORD", "secret"),
             token_ttl_seconds=int(os.getenv("EGERIA_TOKEN_TTL_SECONDS", "900")),
+            token_renew_ahead_seconds=int(os.getenv("EGERIA_TOKEN_RENEW_AHEAD_SECONDS", "60")),
         )
 
     def with_overrides(
@@ -49,6 +51,7 @@ class EgeriaConfig:
         user: Optional[str] = None,
         password: Optional[str] = None,
         token_ttl_seconds: Optional[int] = None,
+        token_renew_ahead_seconds: Optional[int] = None,
     ) -> "EgeriaConfig":
         return EgeriaConfig(
             platform_url=platform_url or self.platform_url,
@@ -58,6 +61,11 @@ class EgeriaConfig:
             token_ttl_seconds=(
                 token_ttl_seconds if token_ttl_seconds is not None else self.token_ttl_seconds
             ),
+            token_renew_ahead_seconds=(
+                token_renew_ahead_seconds
+                if token_renew_ahead_seconds is not None
+                else self.token_renew_ahead_seconds
+            ),
         )
 
 
@@ -0,0 +1,218 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides an optional on-disk (SQLite) cache of browser rows for my_egeria.
+
+
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from importlib import metadata
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .executor import Priority, get_executor
+
+log = logging.getLogger(__name__)
+
+# Bump when the shape of stored rows changes so older files are ignored rather than misread
+SCHEMA_VERSION = 1
+
+Entry = Tuple[str, Tuple[Any, ...], List[Tuple[Any, ...]]]
+
+
+def _app_version() -> str:
+    try:
+        return metadata.version("myegeria")
+    except Exception:
+        return "dev"
+
+
+def disk_cache_path() -> Optional[str]:
+    """
+    Where the cache lives, from EGERIA_DISK_CACHE: unset/0 disables it, 1 uses
+    $XDG_CACHE_HOME/my_egeria/cache.sqlite3, anything else is taken as a file path.
+    """
+    value = os.getenv("EGERIA_DISK_CACHE", "").strip()
+    if value.lower() in ("", "0", "false", "no"):
+        return None
+    if value.lower() in ("1", "true", "yes"):
+        base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return os.path.join(base, "my_egeria", "cache.sqlite3")
+    return os.path.expanduser(value)
+
+
+def scope_of(config: Any) -> str:
+    """Cache scope for a config: platform URL, view server and user (never the password)."""
+    return "\x1f".join((config.platform_url, config.view_server, config.user))
+
+
+class DiskCache:
+    """
+    Rows last shown per (scope, view, search), stored in SQLite so the next launch can
+    paint them before the first server response. Writes are buffered and flushed on the
+    shared executor; entries older than `ttl` seconds or written under another version
+    stamp are ignored and pruned. Disk errors are logged, never raised to the UI.
+    """
+
+    def __init__(self, path: str, ttl: Optional[float] = None, stamp: Optional[str] = None):
+        self.path = path
+        self.ttl = ttl if ttl is not None else float(os.getenv("EGERIA_DISK_CACHE_TTL_SECONDS", "604800"))
+        self.stamp = stamp or f"{SCHEMA_VERSION}:{_app_version()}"
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending: Dict[Tuple[str, str, str], Tuple[str, float]] = {}
+        self._flush_scheduled = False
+
+    # ------------------ API ------------------
+
+    def put(self, scope: str, view: str, search: Sequence[Any], rows: Sequence[Sequence[Any]]) -> None:
+        """Buffer rows for writing; a background flush is scheduled if none is pending."""
+        try:
+            search_key = json.dumps(list(search))
+            payload = json.dumps([list(r) for r in rows], default=str)
+        except (TypeError, ValueError):
+            return
+        with self._lock:
+            self._pending[(scope, view, search_key)] = (payload, time.time())
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        try:
+            get_executor().submit(self.flush, priority=Priority.BACKGROUND)
+        except RuntimeError:
+            # Executor already shut down (app exiting): close() flushes what is left
+            with self._lock:
+                self._flush_scheduled = False
+
+    def load(self, scope: str) -> List[Entry]:
+        """Every live entry of `scope` as (view, search parts, rows)."""
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return []
+            try:
+                conn.execute("DELETE FROM snapshots WHERE saved_at < ? OR stamp != ?", (cutoff, self.stamp))
+                conn.commit()
+                found = conn.execute(
+                    "SELECT view, search, rows FROM snapshots WHERE scope = ?", (scope,)
+                ).fetchall()
+            except sqlite3.Error as e:
+                log.warning("Disk cache read failed: %s", e)
+                return []
+        out: List[Entry] = []
+        for view, search, rows in found:
+            try:
+                out.append((view, tuple(json.loads(search)), [tuple(r) for r in json.loads(rows)]))
+            except (TypeError, ValueError):
+                continue
+        return out
+
+    def flush(self) -> int:
+        with self._lock:
+            self._flush_scheduled = False
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+            conn = self._connection()
+            if conn is None:
+                return 0
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO snapshots (scope, view, search, stamp, saved_at, rows) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(s, v, q, self.stamp, at, payload) for (s, v, q), (payload, at) in pending.items()],
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                log.warning("Disk cache write failed: %s", e)
+                return 0
+        return len(pending)
+
+    def clear(self, scope: Optional[str] = None) -> None:
+        with self._lock:
+            self._pending.clear()
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                if scope is None:
+                    conn.execute("DELETE FROM snapshots")
+                else:
+                    conn.execute("DELETE FROM snapshots WHERE scope = ?", (scope,))
+                conn.commit()
+            except sqlite3.Error as e:
+                log.warning("Disk cache clear failed: %s", e)
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------ internals ------------------
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None:
+            return self._conn
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                " scope TEXT NOT NULL, view TEXT NOT NULL, search TEXT NOT NULL,"
+                " stamp TEXT NOT NULL, saved_at REAL NOT NULL, rows TEXT NOT NULL,"
+                " PRIMARY KEY (scope, view, search))"
+            )
+            conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            log.warning("Disk cache unavailable at %s: %s", self.path, e)
+            return None
+        self._conn = conn
+        return conn
+
+
+_DISK_CACHE: Optional[DiskCache] = None
+_DISK_CACHE_LOCK = threading.Lock()
+
+
+def get_disk_cache() -> Optional[DiskCache]:
+    """The process-wide disk cache, or None when EGERIA_DISK_CACHE doesn't enable one."""
+    global _DISK_CACHE
+    with _DISK_CACHE_LOCK:
+        if _DISK_CACHE is None:
+            path = disk_cache_path()
+            if path is None:
+                return None
+            _DISK_CACHE = DiskCache(path)
+        return _DISK_CACHE
+
+
+def close_disk_cache() -> None:
+    """Flush and close the disk cache; the next get_disk_cache() re-reads the environment."""
+    global _DISK_CACHE
+    with _DISK_CACHE_LOCK:
+        cache, _DISK_CACHE = _DISK_CACHE, None
+    if cache is not None:
+        cache.close()
+
+
+__all__ = [
+    "DiskCache",
+    "SCHEMA_VERSION",
+    "close_disk_cache",
+    "disk_cache_path",
+    "get_disk_cache",
+    "scope_of",
+]
@@ -10,8 +10,12 @@
 
 import asyncio
 import os
+import threading
 import time
-from typing import Any, Callable, Optional, Tuple
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import quote
 
 os.environ.setdefault("EGERIA_USER", "erinoverview")
@@ -39,6 +43,26 @@ else:
     _EgeriaTechType = _EgeriaTechProto  # type: ignore
 
 from .config import EgeriaConfig, get_global_config
+from .executor import run_blocking
+from .retry import RETRY_BUDGET, RETRY_METRICS, ErrorKind, RetryPolicy, classify_error
+
+
+@lru_cache(maxsize=1)
+def egeria_tech_class() -> Any:
+    """
+    pyegeria's EgeriaTech, imported when the first client is built rather than at
+    startup (pyegeria and its pydantic settings are slow to import). A failed import
+    isn't cached, so installing pyegeria later in the session works.
+    """
+    try:
+        from pyegeria.config import settings  # noqa: F401  (validates pyegeria's env settings)
+        from pyegeria import EgeriaTech
+    except Exception as e:
+        raise ImportError(
+            "pyegeria is required to build an Egeria client. "
+            "Install 'pyegeria' or set EGERIA_ALLOW_MISSING=true for tests/dev to use a stub client."
+        ) from e
+    return EgeriaTech
 
 
 # Registry to track all managers for clean shutdown
@@ -50,12 +74,23 @@ def _register_manager(manager: "EgeriaTechClientManager") -> None:
 
 
 def close_all_managers() -> None:
+    global _POOL
+    pool, _POOL = _POOL, None
+    if pool is not None:
+        try:
+            pool.close()
+        except Exception:
+            pass
     for m in list(_MANAGER_REGISTRY):
         try:
             m.close()
         except Exception:
             pass
     _MANAGER_REGISTRY.clear()
+    for per_loop in list(_ASYNC_MANAGERS.values()):
+        for m in list(per_loop.values()):
+            m.close()
+        per_loop.clear()
 
 
 def _bool_env(name: str, default: bool = True) -> bool:
@@ -65,6 +100,20 @@ def _bool_env(name: str, default: bool = True) -> bool:
     return val.strip().lower() in ("1", "true", "yes", "y", "on")
 
 
+def _int_env(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def _float_env(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
 def _build_origin_url(platform_url: str, user: str) -> str:
     base = platform_url.rstrip("/")
     user_q = quote(user or "", safe="")
@@ -102,12 +151,23 @@ class EgeriaTechClientManager:
     - builds client from config
     - authenticates and caches token
     - refreshes token proactively (TTL) and reactively (on failures)
+
+    Token refresh is single-flight: concurrent callers that see the same stale
+    token wait on one in-flight authentication instead of each issuing their own.
+    A background timer renews the token `token_renew_ahead_seconds` before the TTL runs out.
     """
 
     def __init__(self, config: Optional[EgeriaConfig] = None):
         self.config = config or get_global_config()
         self._client: Optional[_EgeriaTechType] = None
         self._last_auth_ts: float = 0.0
+        # Serializes client construction and authentication; the generation
+        # counter lets waiters detect that another thread already refreshed.
+        self._auth_lock = threading.RLock()
+        self._auth_generation: int = 0
+        self._renew_timer: Optional[threading.Timer] = None
+        self._closed = False
+        self.retry_policy = RetryPolicy.from_env()
         _register_manager(self)
 
     def get_client(self) -> Any:
@@ -123,44 +183,40 @@ class EgeriaTechClientManager:
         os.environ.setdefault("EGERIA_USER_PASSWORD", "secret")
         os.environ.setdefault("EGERIA_VIEW_SERVER", "qs-view-server")
         os.environ.setdefault("EGERIA_PLATFORM_URL", "https://localhost:9443")
-        try:
-            from pyegeria.config import settings
-            from pyegeria import EgeriaTech
-        except Exception as e:
-            # Allow running without pyegeria in test/dev if explicitly enabled
-            # if _bool_env("EGERIA_ALLOW_MISSING", True):
-            #     class _StubClient:
-            #         def __init__(self, *args, **kwargs):
-            #             pass
-            #         def create_egeria_bearer_token(self, user_id: str, user_pwd: str):
-            #             return {"token": "stub"}
-            #         def close_session(self) -> None:
-            #             pass
-            #     EgeriaTech = _StubClient  # type: ignore
-            # else:
-                raise ImportError(
-                    "pyegeria is required to build an Egeria client. "
-                    "Install 'pyegeria' or set EGERIA_ALLOW_MISSING=true for tests/dev to use a stub client."
-                ) from e
-
+        # Allow running without pyegeria in test/dev if explicitly enabled
+        # if _bool_env("EGERIA_ALLOW_MISSING", True):
+        #     class _StubClient:
+        #         def __init__(self, *args, **kwargs):
+        #             pass
+        #         def create_egeria_bearer_token(self, user_id: str, user_pwd: str):
+        #             return {"token": "stub"}
+        #         def close_session(self) -> None:
+        #             pass
+        #     EgeriaTech = _StubClient  # type: ignore
+
+        seen = self._auth_generation
         if self._client is None:
-            # Fast preflight to fail fast rather than hang
-            # preflight_origin(self.config.platform_url, self.config.user, timeout=3.0)
-
-            # Build with explicit keyword arguments to avoid positional-order bugs
-            self._client = EgeriaTech(
-                # view_server=self.config.view_server,
-                # platform_url=self.config.platform_url,
-                # user_id=self.config.user,
-                # user_pwd=self.config.password,
-                view_server="qs-view-server",
-                platform_url="https://localhost:9443",
-                user_id="erinoverview",
-                user_pwd="secret",
-            )
-            self._authenticate()
+            with self._auth_lock:
+                if self._client is None:
+                    EgeriaTech = egeria_tech_class()
+                    # Fast preflight to fail fast rather than hang
+                    # preflight_origin(self.config.platform_url, self.config.user, timeout=3.0)
+
+                    # Build with explicit keyword arguments to avoid positional-order bugs
+                    self._closed = False
+                    self._client = EgeriaTech(
+                        # view_server=self.config.view_server,
+                        # platform_url=self.config.platform_url,
+                        # user_id=self.config.user,
+                        # user_pwd=self.config.password,
+                        view_server="qs-view-server",
+                        platform_url="https://localhost:9443",
+                        user_id="erinoverview",
+                        user_pwd="secret",
+                    )
+                    self._authenticate()
         elif self._token_expired():
-            self._authenticate()
+            self.refresh_token(seen_generation=seen)
         return self._client
 
     def _token_expired(self) -> bool:
@@ -169,15 +225,55 @@ class EgeriaTechClientManager:
         return (time.time() - self._last_auth_ts) >= self.config.token_ttl_seconds
 
     def _authenticate(self) -> None:
+        # Callers hold _auth_lock
         # if self._client and hasattr(self._client, "create_egeria_bearer_token"):
         self._client.create_egeria_bearer_token(self.config.user, self.config.password)
         self._last_auth_ts = time.time()
+        self._auth_generation += 1
+        self._schedule_renewal()
 
-    def refresh_token(self) -> None:
-        self._authenticate()
+    def refresh_token(self, seen_generation: Optional[int] = None) -> None:
+        """
+        Re-authenticate, coalescing concurrent requests into one call.
+        Pass the generation observed before the failing call: if another thread
+        has refreshed since then, this returns without a second round trip.
+        """
+        with self._auth_lock:
+            if seen_generation is not None and self._auth_generation != seen_generation:
+                return
+            if self._client is None:
+                self.get_client()
+                return
+            self._authenticate()
+
+    def _schedule_renewal(self) -> None:
+        if self._renew_timer is not None:
+            self._renew_timer.cancel()
+            self._renew_timer = None
+        ttl = self.config.token_ttl_seconds
+        ahead = min(self.config.token_renew_ahead_seconds, ttl / 2)
+        if ttl <= 0 or ahead <= 0 or self._closed:
+            return
+        timer = threading.Timer(ttl - ahead, self._renew_in_background, args=(self._auth_generation,))
+        timer.daemon = True
+        self._renew_timer = timer
+        timer.start()
+
+    def _renew_in_background(self, seen_generation: int) -> None:
+        if self._closed or self._client is None:
+            return
+        try:
+            self.refresh_token(seen_generation=seen_generation)
+        except Exception:
+            # Leave it to the next get_client(), which re-authenticates once the TTL has passed
+            pass
 
     def close(self) -> None:
         # if self._client and hasattr(self._client, "close_session"):
+        self._closed = True
+        if self._renew_timer is not None:
+            self._renew_timer.cancel()
+            self._renew_timer = None
         try:
             if self._client and hasattr(self._client, "close_session"):
                 self._client.close_session()
@@ -194,13 +290,380 @@ class EgeriaTechClientManager:
         self, fn: Callable, args: Tuple = (), kwargs: Optional[dict] = None
     ):
         """
-        Call client function, retrying once on failure by refreshing the token.
+        Call client function, handling failures by error class (see utils.retry):
+        - auth/expiry errors refresh the token once and repeat the call
+        - transient network errors back off with jitter, bounded by the retry policy and budget
+        - anything else is raised immediately
         """
         kwargs = kwargs or {}
-        client = self.get_client()
+        RETRY_METRICS.incr("calls")
+        RETRY_BUDGET.deposit()
+        refreshed = False
+        attempt = 0
+        while True:
+            client = self.get_client()
+            seen = self._auth_generation
+            try:
+                return fn(client, *args, **kwargs)
+            except Exception as e:
+                kind = classify_error(e)
+                if kind is ErrorKind.AUTH and not refreshed:
+                    refreshed = True
+                    RETRY_METRICS.incr("auth_refreshes")
+                    self.refresh_token(seen_generation=seen)
+                    continue
+                if kind is ErrorKind.TRANSIENT and attempt + 1 < self.retry_policy.max_attempts:
+                    if RETRY_BUDGET.withdraw():
+                        RETRY_METRICS.incr("transient_retries")
+                        time.sleep(self.retry_policy.backoff_delay(attempt))
+                        attempt += 1
+                        continue
+                    RETRY_METRICS.incr("budget_exhausted")
+                RETRY_METRICS.incr(f"failed_{kind.value}")
+                raise
+
+
+class AsyncEgeriaTechClientManager:
+    """
+    Async counterpart of EgeriaTechClientManager for pyegeria's `_async_*` methods:
+    - one EgeriaTech client per (config, event loop), shared by every coroutine on that loop,
+      so concurrent requests multiplex over the client's async HTTP session instead of threads
+    - single-flight token refresh under an asyncio.Lock, with the same generation check
+    - every call is bounded by `call_timeout` seconds (EGERIA_CALL_TIMEOUT_SECONDS)
+    """
+
+    def __init__(self, config: Optional[EgeriaConfig] = None, call_timeout: Optional[float] = None):
+        self.config = config or get_global_config()
+        self.call_timeout = call_timeout if call_timeout is not None else _float_env("EGERIA_CALL_TIMEOUT_SECONDS", 30.0)
+        self._client: Optional[_EgeriaTechType] = None
+        self._last_auth_ts: float = 0.0
+        self._auth_lock: Optional[asyncio.Lock] = None
+        self._auth_generation: int = 0
+        self.retry_policy = RetryPolicy.from_env()
+
+    def _lock(self) -> asyncio.Lock:
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        return self._auth_lock
+
+    def _build_client(self) -> Any:
+        EgeriaTech = egeria_tech_class()
+        return EgeriaTech(
+            view_server=self.config.view_server,
+            platform_url=self.config.platform_url,
+            user_id=self.config.user,
+            user_pwd=self.config.password,
+        )
+
+    async def get_client(self) -> Any:
+        seen = self._auth_generation
+        if self._client is None:
+            async with self._lock():
+                if self._client is None:
+                    self._client = self._build_client()
+                    await self._authenticate()
+        elif self._token_expired():
+            await self.refresh_token(seen_generation=seen)
+        return self._client
+
+    def _token_expired(self) -> bool:
+        if self._last_auth_ts <= 0:
+            return True
+        return (time.time() - self._last_auth_ts) >= self.config.token_ttl_seconds
+
+    async def _authenticate(self) -> None:
+        # Callers hold the auth lock
+        create = getattr(self._client, "_async_create_egeria_bearer_token", None)
+        if create is not None:
+            await asyncio.wait_for(create(self.config.user, self.config.password), self.call_timeout)
+        else:
+            await run_blocking(
+                self._client.create_egeria_bearer_token,
+                self.config.user,
+                self.config.password,
+                platform=self.config.platform_url,
+            )
+        self._last_auth_ts = time.time()
+        self._auth_generation += 1
+
+    async def refresh_token(self, seen_generation: Optional[int] = None) -> None:
+        """Re-authenticate once for all coroutines that saw the same stale token."""
+        async with self._lock():
+            if seen_generation is not None and self._auth_generation != seen_generation:
+                return
+            if self._client is None:
+                self._client = self._build_client()
+            await self._authenticate()
+
+    async def invoke_with_auto_refresh(
+        self,
+        fn: Callable,
+        args: Tuple = (),
+        kwargs: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Await `fn(client, *args, **kwargs)` with the same error handling as the sync manager
+        (auth refresh once, transient retries with backoff and budget), each attempt
+        bounded by `timeout` (default call_timeout).
+        """
+        kwargs = kwargs or {}
+        timeout = self.call_timeout if timeout is None else timeout
+        RETRY_METRICS.incr("calls")
+        RETRY_BUDGET.deposit()
+        refreshed = False
+        attempt = 0
+        while True:
+            client = await self.get_client()
+            seen = self._auth_generation
+            try:
+                return await asyncio.wait_for(fn(client, *args, **kwargs), timeout if timeout > 0 else None)
+            except Exception as e:
+                kind = classify_error(e)
+                if kind is ErrorKind.AUTH and not refreshed:
+                    refreshed = True
+                    RETRY_METRICS.incr("auth_refreshes")
+                    await self.refresh_token(seen_generation=seen)
+                    continue
+                if kind is ErrorKind.TRANSIENT and attempt + 1 < self.retry_policy.max_attempts:
+                    if RETRY_BUDGET.withdraw():
+                        RETRY_METRICS.incr("transient_retries")
+                        await asyncio.sleep(self.retry_policy.backoff_delay(attempt))
+                        attempt += 1
+                        continue
+                    RETRY_METRICS.incr("budget_exhausted")
+                RETRY_METRICS.incr(f"failed_{kind.value}")
+                raise
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        self._last_auth_ts = 0.0
+        if client is None:
+            return
+        close = getattr(client, "_async_close_session", None)
+        if close is not None:
+            await close()
+        elif hasattr(client, "close_session"):
+            client.close_session()
+
+    def close(self) -> None:
+        client, self._client = self._client, None
+        self._last_auth_ts = 0.0
+        if client is not None and hasattr(client, "close_session"):
+            try:
+                client.close_session()
+            except Exception:
+                pass
+
+
+# Async managers per event loop, then per config; a loop that goes away takes its managers with it
+_ASYNC_MANAGERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[EgeriaConfig, AsyncEgeriaTechClientManager]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_manager(config: Optional[EgeriaConfig] = None) -> AsyncEgeriaTechClientManager:
+    """Return the shared async manager for `config` on the running event loop."""
+    cfg = config or get_global_config()
+    per_loop = _ASYNC_MANAGERS.setdefault(asyncio.get_running_loop(), {})
+    manager = per_loop.get(cfg)
+    if manager is None:
+        manager = per_loop[cfg] = AsyncEgeriaTechClientManager(cfg)
+    return manager
+
+
+class EgeriaClientPool:
+    """
+    Process-wide pool of EgeriaTechClientManager instances, keyed by EgeriaConfig:
+    - at most `max_size` managers (and therefore clients/tokens) per config
+    - checkout/checkin: a leased manager is used by one caller at a time
+    - managers left idle longer than `idle_timeout` seconds are closed and evicted
+    """
+
+    def __init__(self, max_size: Optional[int] = None, idle_timeout: Optional[float] = None):
+        self.max_size = max(1, max_size if max_size is not None else _int_env("EGERIA_POOL_SIZE", 4))
+        self.idle_timeout = (
+            idle_timeout if idle_timeout is not None else _float_env("EGERIA_POOL_IDLE_SECONDS", 300.0)
+        )
+        self._cond = threading.Condition()
+        # Idle managers per config as (last_used, manager); most recently used last
+        self._idle: Dict[EgeriaConfig, List[Tuple[float, EgeriaTechClientManager]]] = {}
+        # Total managers (idle + checked out) per config
+        self._size: Dict[EgeriaConfig, int] = {}
+        self._closed = False
+
+    def checkout(
+        self, config: Optional[EgeriaConfig] = None, timeout: Optional[float] = None
+    ) -> EgeriaTechClientManager:
+        """
+        Lease a manager for `config`, reusing an idle one (warm client and token) when possible.
+        Blocks while the pool for that config is full; raises TimeoutError after `timeout` seconds.
+        """
+        cfg = config or get_global_config()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Egeria client pool is closed")
+            evicted = self._collect_idle_locked()
+            while True:
+                idle = self._idle.get(cfg)
+                if idle:
+                    _, manager = idle.pop()
+                    self._close_managers(evicted)
+                    return manager
+                if self._size.get(cfg, 0) < self.max_size:
+                    self._size[cfg] = self._size.get(cfg, 0) + 1
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self._close_managers(evicted)
+                    raise TimeoutError(
+                        f"No Egeria client available for {cfg.view_server} within {timeout}s"
+                    )
+                self._cond.wait(remaining)
+        self._close_managers(evicted)
         try:
-            return fn(client, *args, **kwargs)
+            return EgeriaTechClientManager(cfg)
         except Exception:
-            self.refresh_token()
-            client = self.get_client()
-            return fn(client, *args, **kwargs)
+            self._release_slot(cfg)
+            raise
+
+    def checkin(self, manager: EgeriaTechClientManager) -> None:
+        """Return a leased manager so the next caller can reuse its client and token."""
+        with self._cond:
+            if not self._closed:
+                self._idle.setdefault(manager.config, []).append((time.monotonic(), manager))
+                self._cond.notify()
+                return
+        manager.close()
+
+    def discard(self, manager: EgeriaTechClientManager) -> None:
+        """Close a leased manager instead of returning it (e.g. after the client broke)."""
+        try:
+            manager.close()
+        finally:
+            self._release_slot(manager.config)
+
+    @contextmanager
+    def lease(
+        self, config: Optional[EgeriaConfig] = None, timeout: Optional[float] = None
+    ) -> Iterator[EgeriaTechClientManager]:
+        manager = self.checkout(config, timeout=timeout)
+        try:
+            yield manager
+        finally:
+            self.checkin(manager)
+
+    def evict_idle(self) -> int:
+        """Close managers idle for longer than idle_timeout; returns how many were evicted."""
+        with self._cond:
+            evicted = self._collect_idle_locked()
+        self._close_managers(evicted)
+        return len(evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "max_size": self.max_size,
+                "idle_timeout": self.idle_timeout,
+                "configs": len(self._size),
+                "managers": sum(self._size.values()),
+                "idle": sum(len(v) for v in self._idle.values()),
+            }
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            managers = [m for idle in self._idle.values() for _, m in idle]
+            self._idle.clear()
+            self._size.clear()
+            self._cond.notify_all()
+        self._close_managers(managers)
+
+    # ------------------ internals ------------------
+
+    def _collect_idle_locked(self) -> List[EgeriaTechClientManager]:
+        if self.idle_timeout <= 0:
+            return []
+        cutoff = time.monotonic() - self.idle_timeout
+        evicted: List[EgeriaTechClientManager] = []
+        for cfg, idle in list(self._idle.items()):
+            keep = [(ts, m) for ts, m in idle if ts >= cutoff]
+            expired = [m for ts, m in idle if ts < cutoff]
+            if expired:
+                evicted.extend(expired)
+                self._size[cfg] = max(0, self._size.get(cfg, 0) - len(expired))
+            if keep:
+                self._idle[cfg] = keep
+            else:
+                del self._idle[cfg]
+            if not self._size.get(cfg):
+                self._size.pop(cfg, None)
+        if evicted:
+            self._cond.notify_all()
+        return evicted
+
+    def _release_slot(self, cfg: EgeriaConfig) -> None:
+        with self._cond:
+            left = self._size.get(cfg, 0) - 1
+            if left > 0:
+                self._size[cfg] = left
+            else:
+                self._size.pop(cfg, None)
+            self._cond.notify()
+
+    @staticmethod
+    def _close_managers(managers: List[EgeriaTechClientManager]) -> None:
+        # Closing may hit the network (close_session); never do it while holding the pool lock
+        for m in managers:
+            try:
+                m.close()
+            except Exception:
+                pass
+
+
+_POOL: Optional[EgeriaClientPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_client_pool() -> EgeriaClientPool:
+    """Return the process-wide client pool, creating it on first use."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = EgeriaClientPool()
+        return _POOL
+
+
+class PooledClientManager:
+    """
+    Drop-in replacement for EgeriaTechClientManager used by screens and services.
+    It owns no client: every call leases a manager from the shared pool, so a screen
+    push reuses the existing EgeriaTech client and bearer token for the same config.
+    """
+
+    def __init__(self, config: Optional[EgeriaConfig] = None, pool: Optional[EgeriaClientPool] = None):
+        self.config = config or get_global_config()
+        self._pool = pool
+
+    @property
+    def pool(self) -> EgeriaClientPool:
+        return self._pool or get_client_pool()
+
+    def lease(self):
+        """Hold one pooled manager across several calls (e.g. a multi-step screen load)."""
+        return self.pool.lease(self.config)
+
+    def invoke_with_auto_refresh(
+        self, fn: Callable, args: Tuple = (), kwargs: Optional[dict] = None
+    ):
+        with self.pool.lease(self.config) as manager:
+            return manager.invoke_with_auto_refresh(fn, args=args, kwargs=kwargs)
+
+    def refresh_token(self) -> None:
+        with self.pool.lease(self.config) as manager:
+            manager.refresh_token()
+
+    def close(self) -> None:
+        # Shared clients outlive any one screen or service; close_all_managers() closes the pool
+        pass
@@ -0,0 +1,218 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides a bounded, prioritised executor for blocking Egeria calls in my_egeria.
+
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+
+class Priority(IntEnum):
+    """Lower runs first: what the user is waiting on beats prefetching."""
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+@dataclass
+class _Job:
+    fn: Callable[[], Any]
+    future: Future
+    platform: Optional[str]
+    priority: Priority
+    queued_at: float = field(default_factory=time.monotonic)
+
+
+class EgeriaExecutor:
+    """
+    Thread pool for blocking pyegeria calls with:
+    - `max_workers` threads, started on demand (EGERIA_EXECUTOR_WORKERS)
+    - at most `per_platform` calls running against any one platform URL (EGERIA_EXECUTOR_PER_PLATFORM)
+    - INTERACTIVE jobs dequeued before BACKGROUND ones; FIFO within a priority
+    - stats on queue depth, running calls and queue wait time
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, per_platform: Optional[int] = None):
+        self.max_workers = max(1, max_workers or int(os.getenv("EGERIA_EXECUTOR_WORKERS", "8")))
+        self.per_platform = max(1, per_platform or int(os.getenv("EGERIA_EXECUTOR_PER_PLATFORM", "4")))
+        self._cond = threading.Condition()
+        self._queues: Dict[Priority, Deque[_Job]] = {p: deque() for p in Priority}
+        self._running: Dict[Optional[str], int] = {}
+        self._threads: List[threading.Thread] = []
+        self._idle = 0
+        self._shutdown = False
+        self._submitted = 0
+        self._completed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        platform: Optional[str] = None,
+        priority: Priority = Priority.INTERACTIVE,
+        **kwargs: Any,
+    ) -> Future:
+        future: Future = Future()
+        job = _Job(functools.partial(fn, *args, **kwargs), future, platform, Priority(priority))
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("Egeria executor is shut down")
+            self._queues[job.priority].append(job)
+            self._submitted += 1
+            queued = sum(len(q) for q in self._queues.values())
+            if self._idle < queued and len(self._threads) < self.max_workers:
+                self._start_worker()
+            self._cond.notify_all()
+        return future
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        platform: Optional[str] = None,
+        priority: Priority = Priority.INTERACTIVE,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Await `fn(*args, **kwargs)` run on this executor (drop-in for asyncio.to_thread).
+        Like to_thread, the call sees a copy of the caller's context variables.
+        """
+        call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+        return await asyncio.wrap_future(self.submit(call, platform=platform, priority=priority))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            started = self._submitted - sum(len(q) for q in self._queues.values())
+            return {
+                "workers": len(self._threads),
+                "max_workers": self.max_workers,
+                "per_platform": self.per_platform,
+                "queued": {p.name.lower(): len(q) for p, q in self._queues.items()},
+                "running": {k or "default": v for k, v in self._running.items() if v},
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "avg_wait_seconds": (self._wait_total / started) if started else 0.0,
+                "max_wait_seconds": self._wait_max,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._cond:
+            self._shutdown = True
+            pending = [job for q in self._queues.values() for job in q]
+            for q in self._queues.values():
+                q.clear()
+            self._cond.notify_all()
+            threads = list(self._threads)
+        for job in pending:
+            job.future.cancel()
+        if wait:
+            for t in threads:
+                t.join()
+
+    # ------------------ internals ------------------
+
+    def _start_worker(self) -> None:
+        t = threading.Thread(target=self._work, name=f"egeria-executor-{len(self._threads)}", daemon=True)
+        self._threads.append(t)
+        t.start()
+
+    def _next_job_locked(self) -> Optional[_Job]:
+        # Highest priority first, skipping jobs whose platform is already at its cap
+        for priority in Priority:
+            queue = self._queues[priority]
+            for i, job in enumerate(queue):
+                if self._running.get(job.platform, 0) < self.per_platform:
+                    del queue[i]
+                    return job
+        return None
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                job = self._next_job_locked()
+                while job is None:
+                    if self._shutdown:
+                        return
+                    self._idle += 1
+                    self._cond.wait()
+                    self._idle -= 1
+                    job = self._next_job_locked()
+                self._running[job.platform] = self._running.get(job.platform, 0) + 1
+                waited = time.monotonic() - job.queued_at
+                self._wait_total += waited
+                self._wait_max = max(self._wait_max, waited)
+            try:
+                if job.future.set_running_or_notify_cancel():
+                    try:
+                        job.future.set_result(job.fn())
+                    except BaseException as e:
+                        job.future.set_exception(e)
+            finally:
+                with self._cond:
+                    self._running[job.platform] -= 1
+                    self._completed += 1
+                    # A platform slot freed up: a job skipped for its cap may now run
+                    self._cond.notify_all()
+
+
+_EXECUTOR: Optional[EgeriaExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_executor() -> EgeriaExecutor:
+    """Return the process-wide executor, creating it on first use."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = EgeriaExecutor()
+        return _EXECUTOR
+
+
+def shutdown_executor() -> None:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        executor, _EXECUTOR = _EXECUTOR, None
+    if executor is not None:
+        executor.shutdown()
+
+
+async def run_blocking(
+    fn: Callable[..., Any],
+    *args: Any,
+    platform: Optional[str] = None,
+    priority: Priority = Priority.INTERACTIVE,
+    **kwargs: Any,
+) -> Any:
+    """Run a blocking call on the shared executor; use instead of asyncio.to_thread."""
+    return await get_executor().run(fn, *args, platform=platform, priority=priority, **kwargs)
+
+
+def executor_stats() -> Dict[str, Any]:
+    return get_executor().stats()
+
+
+__all__ = [
+    "EgeriaExecutor",
+    "Priority",
+    "executor_stats",
+    "get_executor",
+    "run_blocking",
+    "shutdown_executor",
+]
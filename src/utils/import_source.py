@@ -0,0 +1,168 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides streaming CSV/JSONL readers and resumable import checkpoints for my_egeria.
+
+
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+from dataclasses import asdict, dataclass
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+# CSV cells of these fields hold lists, separated by LIST_SEPARATOR
+LIST_FIELDS = ("aliases", "initial_classifications")
+LIST_SEPARATOR = ";"
+
+
+def source_format(path: str, fmt: Optional[str] = None) -> str:
+    """'csv' or 'jsonl': `fmt` when given, otherwise from the file extension."""
+    if fmt:
+        if fmt not in FORMATS.values():
+            raise ValueError(f"Unknown import format {fmt!r}; expected csv or jsonl")
+        return fmt
+    found = FORMATS.get(os.path.splitext(path)[1].lower())
+    if found is None:
+        raise ValueError(f"Can't tell the format of {path}; name it .csv or .jsonl, or give the format")
+    return found
+
+
+@dataclass(frozen=True)
+class SourceRow:
+    """One record of an import file; `offset` is the byte position just past it, where a resumed read starts."""
+
+    number: int
+    offset: int
+    data: Dict[str, Any]
+    error: Optional[str] = None
+
+
+def read_rows(path: str, fmt: Optional[str] = None, offset: int = 0, number: int = 0) -> Iterator[SourceRow]:
+    """
+    Yield the records of a CSV (first line is the header) or JSONL file one at a time,
+    holding only the current record in memory. `offset`/`number` continue a read from a
+    SourceRow's offset and number. Records that can't be parsed are yielded with `error`.
+    """
+    reader = _csv_rows if source_format(path, fmt) == "csv" else _jsonl_rows
+    with open(path, "rb") as f:
+        yield from reader(f, offset, number)
+
+
+def _jsonl_rows(f: BinaryIO, offset: int, number: int) -> Iterator[SourceRow]:
+    f.seek(offset)
+    position = offset
+    for raw in iter(f.readline, b""):
+        position += len(raw)
+        line = raw.strip()
+        if not line:
+            continue
+        number += 1
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            yield SourceRow(number, position, {}, f"invalid JSON: {e}")
+            continue
+        if not isinstance(data, dict):
+            yield SourceRow(number, position, {}, "expected a JSON object")
+            continue
+        yield SourceRow(number, position, data)
+
+
+def _csv_rows(f: BinaryIO, offset: int, number: int) -> Iterator[SourceRow]:
+    # csv.reader pulls lines only as it needs them, so `position` is always the end of
+    # the record just parsed, even for quoted values spanning lines
+    position = 0
+
+    def lines() -> Iterator[str]:
+        nonlocal position
+        for raw in iter(f.readline, b""):
+            position += len(raw)
+            yield raw.decode("utf-8")
+
+    reader = csv.reader(lines())
+    header = next(reader, None)
+    if not header:
+        return
+    header = [h.lstrip("\ufeff").strip() for h in header]
+    if offset > position:
+        f.seek(offset)
+        position = offset
+    for cells in reader:
+        if not any(cells):
+            continue
+        number += 1
+        if len(cells) != len(header):
+            yield SourceRow(number, position, {}, f"expected {len(header)} fields, got {len(cells)}")
+            continue
+        yield SourceRow(number, position, _csv_record(header, cells))
+
+
+def _csv_record(header: List[str], cells: List[str]) -> Dict[str, Any]:
+    # Empty cells are absent fields, so the payload rules treat them as missing
+    record: Dict[str, Any] = {}
+    for name, value in zip(header, cells):
+        value = value.strip()
+        if not value:
+            continue
+        if name in LIST_FIELDS:
+            record[name] = [v.strip() for v in value.split(LIST_SEPARATOR) if v.strip()]
+        else:
+            record[name] = value
+    return record
+
+
+@dataclass
+class ImportCheckpoint:
+    """
+    How far an import of `source` got: every record before `offset` has been created or
+    recorded as invalid/failed. Saved after each batch so an interrupted import resumes.
+    Records between `offset` and `pending` were being written when it was last saved,
+    so some may exist already. `size` and `mtime` identify the file the offsets refer to.
+    """
+
+    source: str
+    kind: str
+    offset: int = 0
+    rows: int = 0
+    created: int = 0
+    invalid: int = 0
+    failed: int = 0
+    done: bool = False
+    pending: int = 0
+    size: int = 0
+    mtime: float = 0.0
+
+    def resumes(self, source: str, kind: str, stat: os.stat_result) -> bool:
+        """True if this checkpoint belongs to an import of `kind` from `source`, unchanged since (`stat`)."""
+        return (
+            self.source == source
+            and self.kind == kind
+            and self.size == stat.st_size
+            and self.mtime == stat.st_mtime
+        )
+
+    @classmethod
+    def load(cls, path: str) -> Optional["ImportCheckpoint"]:
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def save(self, path: str) -> None:
+        # Write-then-rename, so a crash mid-save leaves the previous checkpoint intact
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f)
+        os.replace(tmp, path)
+
+
+__all__ = ["FORMATS", "ImportCheckpoint", "LIST_FIELDS", "LIST_SEPARATOR", "SourceRow", "read_rows", "source_format"]
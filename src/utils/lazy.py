@@ -0,0 +1,39 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides deferred imports of screens and other heavy modules for my_egeria.
+
+
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, Callable
+
+
+def load_attr(path: str) -> Any:
+    """Import 'package.module:Name' and return Name; the module is imported on first use only."""
+    module, _, name = path.partition(":")
+    if not name:
+        raise ValueError(f"Expected 'module:attribute', got {path!r}")
+    return getattr(importlib.import_module(module), name)
+
+
+def lazy_screen(path: str, *args: Any, **kwargs: Any) -> Callable[[], Any]:
+    """
+    A factory for App.SCREENS that imports the screen class named by `path`
+    ('package.module:ScreenClass') when the screen is first pushed, and builds it
+    with `args`/`kwargs`. Textual keeps the instance once built.
+    """
+
+    def _factory() -> Any:
+        return load_attr(path)(*args, **kwargs)
+
+    _factory.__qualname__ = _factory.__name__ = f"lazy_screen[{path}]"
+    return _factory
+
+
+__all__ = ["lazy_screen", "load_attr"]
@@ -0,0 +1,80 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides local filtering of loaded result sets for search-as-you-type in my_egeria.
+
+
+"""
+
+from __future__ import annotations
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+Row = Tuple[Any, ...]
+
+
+def normalize_search(search: Optional[str]) -> str:
+    """The search as the server sees it: '' and '*' both mean everything."""
+    s = (search or "").strip().lower()
+    return "" if s == "*" else s
+
+
+class SubstringIndex:
+    """
+    Lowercase text of every row, matched the way the server matches a search: the
+    query as a substring of some cell. Search-as-you-type queries usually extend the
+    previous one, so those only rescan the previous hits.
+    """
+
+    def __init__(self, rows: Sequence[Row]):
+        # Cells joined by a newline, which a one-line query can't span
+        self._texts = ["\n".join("" if cell is None else str(cell).lower() for cell in row) for row in rows]
+        self._last: Optional[Tuple[str, List[int]]] = None
+
+    def match(self, query: str) -> List[int]:
+        """Positions of rows with a cell containing the query (case-insensitively); in row order."""
+        q = normalize_search(query)
+        if not q:
+            return list(range(len(self._texts)))
+        candidates: Sequence[int] = range(len(self._texts))
+        if self._last is not None and self._last[0] in q:
+            candidates = self._last[1]
+        hits = [i for i in candidates if q in self._texts[i]]
+        self._last = (q, hits)
+        return hits
+
+
+class LoadedRows:
+    """
+    A complete result set the server returned for `search`, kept so narrower
+    queries can be answered without another request.
+    """
+
+    def __init__(self, search: Optional[str], rows: Sequence[Row]):
+        self.search = normalize_search(search)
+        self.rows = [tuple(r) for r in rows]
+        self._index: Optional[SubstringIndex] = None
+
+    def covers(self, query: Optional[str]) -> bool:
+        """
+        True if every server match for `query` is in this set: the set holds
+        everything, or `query` contains this set's search text (server search is
+        a substring match, so a longer query can only match fewer elements).
+        """
+        return not self.search or self.search in normalize_search(query)
+
+    def filter(self, query: Optional[str]) -> List[Row]:
+        """The rows the server would return for `query`, which covers() must allow."""
+        if self._index is None:
+            # Built on the first keystroke, not on every load
+            self._index = SubstringIndex(self.rows)
+        return [self.rows[i] for i in self._index.match(query or "")]
+
+
+__all__ = [
+    "LoadedRows",
+    "SubstringIndex",
+    "normalize_search",
+]
@@ -0,0 +1,284 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides latency histograms and counters for Egeria calls made by my_egeria.
+
+
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Upper bounds (seconds) of the latency buckets: 1 ms .. 60 s, roughly 1-2-5 steps
+LATENCY_BUCKETS: Sequence[float] = (
+    0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0,
+)
+# Upper bounds of the payload buckets, in returned elements (rows)
+PAYLOAD_BUCKETS: Sequence[float] = (0, 1, 10, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+
+def metrics_enabled() -> bool:
+    """EGERIA_METRICS=0 turns call instrumentation off (it is on by default)."""
+    return os.getenv("EGERIA_METRICS", "1").lower() not in ("0", "false", "no")
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram (cumulative counts as Prometheus expects them on export).
+    Quantiles are estimated by linear interpolation within the bucket that holds them,
+    so they are exact to the bucket resolution, which is plenty to rank slow calls.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(sorted(buckets))
+        # One slot per bucket plus an overflow slot (+Inf)
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                return min(lower + (upper - lower) * (rank - seen) / n, self.max)
+            seen += n
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+
+
+class _MethodStats:
+    __slots__ = ("latency", "payload", "calls", "errors", "attempts", "cache_hits", "cache_misses")
+
+    def __init__(self):
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.payload = Histogram(PAYLOAD_BUCKETS)
+        self.calls = 0
+        self.errors = 0
+        self.attempts = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+
+class CallMetrics:
+    """
+    Per-method instrumentation of Egeria calls: latency and payload histograms, error
+    and attempt counts (attempts beyond one per call are retries or token refreshes)
+    and response-cache hits/misses. Thread-safe; every update is a few additions.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._methods: Dict[str, _MethodStats] = {}
+
+    def _stats(self, method: str) -> _MethodStats:
+        stats = self._methods.get(method)
+        if stats is None:
+            stats = self._methods[method] = _MethodStats()
+        return stats
+
+    def observe(self, method: str, seconds: float, payload: Optional[int] = None, ok: bool = True) -> None:
+        """Record one completed call (all of its attempts) to the server."""
+        with self._lock:
+            stats = self._stats(method)
+            stats.calls += 1
+            stats.latency.observe(seconds)
+            if payload is not None:
+                stats.payload.observe(payload)
+            if not ok:
+                stats.errors += 1
+
+    def attempt(self, method: str) -> None:
+        with self._lock:
+            self._stats(method).attempts += 1
+
+    def cache(self, method: str, hit: bool) -> None:
+        with self._lock:
+            stats = self._stats(method)
+            if hit:
+                stats.cache_hits += 1
+            else:
+                stats.cache_misses += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._methods.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-method summary; latencies in seconds, payloads in elements."""
+        with self._lock:
+            out: Dict[str, Dict[str, Any]] = {}
+            for method, s in self._methods.items():
+                lookups = s.cache_hits + s.cache_misses
+                out[method] = {
+                    "calls": s.calls,
+                    "errors": s.errors,
+                    "attempts": s.attempts,
+                    "retries": max(0, s.attempts - s.calls),
+                    "cache_hits": s.cache_hits,
+                    "cache_misses": s.cache_misses,
+                    "cache_hit_ratio": s.cache_hits / lookups if lookups else 0.0,
+                    "latency": s.latency.summary(),
+                    "payload": s.payload.summary(),
+                }
+            return out
+
+    def histograms(self) -> Dict[str, Dict[str, Any]]:
+        """Raw bucket counts per method, for the Prometheus exposition."""
+        with self._lock:
+            return {
+                method: {
+                    "latency": (LATENCY_BUCKETS, list(s.latency.counts), s.latency.sum, s.latency.count),
+                    "payload": (PAYLOAD_BUCKETS, list(s.payload.counts), s.payload.sum, s.payload.count),
+                    "calls": s.calls,
+                    "errors": s.errors,
+                    "attempts": s.attempts,
+                    "cache_hits": s.cache_hits,
+                    "cache_misses": s.cache_misses,
+                }
+                for method, s in self._methods.items()
+            }
+
+
+CALL_METRICS = CallMetrics()
+
+# Other subsystems' stats, added to every snapshot by name (see register_stats)
+_STATS_SOURCES: Dict[str, Callable[[], Any]] = {}
+
+
+def register_stats(name: str, source: Callable[[], Any]) -> None:
+    """Include `source()` (a dict of numbers, or a list of them) under `name` in snapshots."""
+    _STATS_SOURCES[name] = source
+
+
+def metrics_snapshot() -> Dict[str, Any]:
+    """Everything the diagnostics screen shows: per-method call metrics plus registered stats."""
+    snapshot: Dict[str, Any] = {"methods": CALL_METRICS.snapshot()}
+    for name, source in list(_STATS_SOURCES.items()):
+        try:
+            snapshot[name] = source()
+        except Exception as e:
+            snapshot[name] = {"error": str(e)}
+    return snapshot
+
+
+def export_json(indent: Optional[int] = 2) -> str:
+    return json.dumps(metrics_snapshot(), indent=indent, sort_keys=True, default=str)
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _metric_name(value: str) -> str:
+    return "".join(c if c.isalnum() or c == "_" else "_" for c in value)
+
+
+def export_prometheus() -> str:
+    """The metrics in the Prometheus text exposition format (version 0.0.4)."""
+    lines: List[str] = []
+    histograms = CALL_METRICS.histograms()
+
+    def _histogram(name: str, help_text: str, part: str, scale: Callable[[float], str]) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for method, h in sorted(histograms.items()):
+            buckets, counts, total, count = h[part]
+            m = _label(method)
+            cumulative = 0
+            for bound, n in zip(buckets, counts):
+                cumulative += n
+                lines.append(f'{name}_bucket{{method="{m}",le="{scale(bound)}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{method="{m}",le="+Inf"}} {count}')
+            lines.append(f'{name}_sum{{method="{m}"}} {total}')
+            lines.append(f'{name}_count{{method="{m}"}} {count}')
+
+    _histogram("egeria_call_duration_seconds", "Latency of Egeria calls, including retries.", "latency", repr)
+    _histogram("egeria_call_payload_elements", "Elements returned by Egeria calls.", "payload", lambda b: str(int(b)))
+
+    for counter, help_text in (
+        ("calls", "Egeria calls that reached the client."),
+        ("errors", "Egeria calls that raised."),
+        ("attempts", "Client invocations, counting retries and token refreshes."),
+        ("cache_hits", "Reads answered from the response cache."),
+        ("cache_misses", "Cacheable reads that went to the server."),
+    ):
+        name = f"egeria_{counter}_total"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        for method, h in sorted(histograms.items()):
+            lines.append(f'{name}{{method="{_label(method)}"}} {h[counter]}')
+
+    # Registered stats: numeric values become untyped gauges named after their source.
+    # A list-valued stat has one sample per row; each family's samples must be contiguous.
+    families: Dict[str, List[str]] = {}
+    for source, values in sorted((k, v) for k, v in metrics_snapshot().items() if k != "methods"):
+        rows = values if isinstance(values, list) else [values]
+        for row in rows:
+            if not isinstance(row, dict):
+                continue
+            labels = ",".join(
+                f'{_metric_name(k)}="{_label(str(v))}"' for k, v in sorted(row.items()) if isinstance(v, str)
+            )
+            for key, value in sorted(row.items()):
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                name = f"egeria_{_metric_name(source)}_{_metric_name(key)}"
+                families.setdefault(name, []).append(f"{name}{{{labels}}} {value}" if labels else f"{name} {value}")
+    for name, samples in families.items():
+        lines.append(f"# TYPE {name} untyped")
+        lines.extend(samples)
+    return "\n".join(lines) + "\n"
+
+
+def write_export(path: str) -> None:
+    """Write the metrics to `path`: Prometheus text for *.prom / *.txt, JSON otherwise."""
+    text = export_prometheus() if path.endswith((".prom", ".txt")) else export_json()
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+__all__ = [
+    "CALL_METRICS",
+    "CallMetrics",
+    "Histogram",
+    "LATENCY_BUCKETS",
+    "PAYLOAD_BUCKETS",
+    "export_json",
+    "export_prometheus",
+    "metrics_enabled",
+    "metrics_snapshot",
+    "register_stats",
+    "write_export",
+]
@@ -0,0 +1,185 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides error classification and retry helpers for my_egeria.
+
+
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Optional
+
+
+class ErrorKind(str, Enum):
+    AUTH = "auth"  # expired/invalid token: refresh once and repeat
+    TRANSIENT = "transient"  # network hiccup or overloaded server: back off and retry
+    FATAL = "fatal"  # everything else: fail fast
+
+
+_AUTH_STATUS = {401, 419, 440}
+_TRANSIENT_STATUS = {408, 425, 429, 502, 503, 504}
+
+# Matched against exception class names so neither httpx nor pyegeria has to be imported here
+_AUTH_NAME_HINTS = ("unauthorized", "notauthorized", "authentication", "tokenexpired", "expiredtoken")
+_TRANSIENT_NAME_HINTS = (
+    "timeout",
+    "connecterror",
+    "connectionerror",
+    "connectionexception",
+    "networkerror",
+    "transporterror",
+    "remoteprotocolerror",
+    "readerror",
+    "writeerror",
+)
+_AUTH_MESSAGE_HINTS = ("token expired", "expired token", "invalid token", "not authorized", "unauthorized")
+
+
+def _status_of(exc: BaseException) -> Optional[int]:
+    for attr in ("status_code", "http_status", "related_http_code", "http_error_code"):
+        val = getattr(exc, attr, None)
+        if val is not None:
+            try:
+                return int(val)
+            except (TypeError, ValueError):
+                continue
+    response = getattr(exc, "response", None)
+    val = getattr(response, "status_code", None)
+    if val is not None:
+        try:
+            return int(val)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def _classify_one(exc: BaseException) -> Optional[ErrorKind]:
+    status = _status_of(exc)
+    if status in _AUTH_STATUS:
+        return ErrorKind.AUTH
+    if status in _TRANSIENT_STATUS:
+        return ErrorKind.TRANSIENT
+    if status is not None:
+        return ErrorKind.FATAL
+
+    name = type(exc).__name__.lower()
+    if any(h in name for h in _AUTH_NAME_HINTS):
+        return ErrorKind.AUTH
+    if isinstance(exc, (ConnectionError, TimeoutError)) or any(h in name for h in _TRANSIENT_NAME_HINTS):
+        return ErrorKind.TRANSIENT
+
+    message = str(exc).lower()
+    if any(h in message for h in _AUTH_MESSAGE_HINTS):
+        return ErrorKind.AUTH
+    return None
+
+
+def classify_error(exc: BaseException) -> ErrorKind:
+    """
+    Decide how a failed Egeria call should be handled. The exception and its
+    cause/context chain are inspected for an HTTP status, then class names, then
+    well-known token messages. Programming errors (AttributeError, TypeError, ...) are FATAL.
+    """
+    seen = set()
+    current: Optional[BaseException] = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, (AttributeError, TypeError, ValueError, KeyError, NotImplementedError)):
+            return ErrorKind.FATAL
+        kind = _classify_one(current)
+        if kind is not None:
+            return kind
+        current = current.__cause__ or current.__context__
+    return ErrorKind.FATAL
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 3  # total attempts for transient errors, including the first
+    base_delay: float = 0.2
+    max_delay: float = 5.0
+
+    @staticmethod
+    def from_env() -> "RetryPolicy":
+        return RetryPolicy(
+            max_attempts=int(os.getenv("EGERIA_RETRY_MAX_ATTEMPTS", "3")),
+            base_delay=float(os.getenv("EGERIA_RETRY_BASE_DELAY", "0.2")),
+            max_delay=float(os.getenv("EGERIA_RETRY_MAX_DELAY", "5.0")),
+        )
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for the given 0-based retry attempt."""
+        cap = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(0, cap)
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of recent traffic so an outage does not turn
+    every call into max_attempts calls. Each call deposits `ratio` tokens,
+    each retry withdraws one; the balance is capped at `max_tokens`.
+    """
+
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 10.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
+
+
+class RetryMetrics:
+    """Thread-safe counters describing how calls were retried."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {}
+
+    def incr(self, name: str, by: int = 1) -> None:
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + by
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+RETRY_BUDGET = RetryBudget(ratio=float(os.getenv("EGERIA_RETRY_BUDGET_RATIO", "0.2")))
+RETRY_METRICS = RetryMetrics()
+
+
+def get_retry_metrics() -> Dict[str, int]:
+    """Counters: calls, auth_refreshes, transient_retries, budget_exhausted, failed_<kind>."""
+    return RETRY_METRICS.snapshot()
+
+
+__all__ = [
+    "ErrorKind",
+    "RetryBudget",
+    "RetryMetrics",
+    "RetryPolicy",
+    "classify_error",
+    "get_retry_metrics",
+]
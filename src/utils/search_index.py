@@ -0,0 +1,320 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides an in-memory inverted index over fetched Egeria records for my_egeria.
+
+
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Set, Tuple
+
+_TOKENS = re.compile(r"\w+")
+# Search strings with these are regular expressions for the server; the index can't answer them
+_REGEX_CHARS = set(".^$*+?{}[]\\|()")
+
+# Indexed record fields and how much a match in each counts when ranking
+FIELD_WEIGHTS: Dict[str, float] = {
+    "display_name": 4.0, "displayName": 4.0, "Display Name": 4.0, "name": 4.0,
+    "aliases": 3.0, "Aliases": 3.0,
+    "qualified_name": 2.0, "qualifiedName": 2.0, "Qualified Name": 2.0,
+    "summary": 1.0, "Summary": 1.0,
+    "description": 1.0, "Description": 1.0,
+}
+
+
+def tokenize(text: Any) -> List[str]:
+    if text is None:
+        return []
+    if isinstance(text, (list, tuple, set)):
+        return [t for item in text for t in tokenize(item)]
+    return _TOKENS.findall(str(text).lower())
+
+
+def is_wildcard(search: Optional[str]) -> bool:
+    return (search or "").strip() in ("", "*")
+
+
+def indexable_query(search: Optional[str]) -> bool:
+    """True for plain-text searches the index can answer (not wildcards or regular expressions)."""
+    s = (search or "").strip()
+    return bool(s) and not is_wildcard(s) and not (_REGEX_CHARS & set(s)) and bool(tokenize(s))
+
+
+def record_id(record: Dict[str, Any]) -> str:
+    return record.get("GUID", "") or record.get("guid", "") or ""
+
+
+class SearchIndex:
+    """
+    Inverted index from lowercase tokens of a record's names, aliases, summary and
+    description to the records holding them. Queries are tokenized and ANDed, each
+    token matching as a prefix; results are ranked by field weight (exact tokens
+    score double). Records can be added and removed one at a time.
+
+    The index only answers searches once it is `complete`: it has seen a full,
+    in-order wildcard listing within the last `ttl` seconds. Until then callers go
+    to the server and feed what they fetch back in with ingest(). `fields` are the
+    projected fields that listing was fetched with (None: whole records); a caller
+    needing fields the index doesn't hold goes to the server too.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        # Expires with the response cache by default, so the index is never staler than a cached listing
+        if ttl is None:
+            ttl = float(os.getenv("EGERIA_INDEX_TTL_SECONDS", os.getenv("EGERIA_CACHE_TTL_SECONDS", "60")))
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        self._doc_terms: Dict[str, Set[str]] = {}
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._vocab: List[str] = []
+        self._vocab_dirty = False
+        self._completed_at: Optional[float] = None
+        self.fields: Optional[FrozenSet[str]] = None
+        # Pages of a wildcard listing being collected; swapped in once the last page arrives
+        self._staged: Optional[List[Dict[str, Any]]] = None
+        self._staged_fields: Optional[FrozenSet[str]] = None
+        self.queries = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    @property
+    def complete(self) -> bool:
+        at = self._completed_at
+        return at is not None and time.monotonic() - at < self.ttl
+
+    def covers(self, fields: Optional[FrozenSet[str]]) -> bool:
+        """True when the indexed records hold every one of `fields` (None: every property)."""
+        if self.fields is None:
+            return True
+        return fields is not None and fields <= self.fields
+
+    # ------------------ updates ------------------
+
+    def add(self, record: Dict[str, Any]) -> bool:
+        with self._lock:
+            return self._add_locked(record)
+
+    def add_many(self, records: Iterable[Dict[str, Any]]) -> int:
+        with self._lock:
+            return sum(self._add_locked(r) for r in records)
+
+    def remove(self, doc_id: str) -> bool:
+        with self._lock:
+            return self._remove_locked(doc_id)
+
+    def load(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Replace the whole index with `records`, a complete listing."""
+        with self._lock:
+            self._load_locked(records)
+
+    def mark_stale(self) -> None:
+        """Records were created without being added: keep the entries, but stop answering until the next full listing."""
+        with self._lock:
+            self._completed_at = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._docs.clear()
+            self._doc_terms.clear()
+            self._postings.clear()
+            self._vocab = []
+            self._vocab_dirty = False
+            self._completed_at = None
+            self.fields = None
+            self._staged = None
+
+    def ingest(
+        self,
+        records: List[Dict[str, Any]],
+        search: Optional[str],
+        start_from: int = 0,
+        page_size: Optional[int] = None,
+        fresh: bool = True,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> None:
+        """
+        Feed in records fetched from the server for `search`. Results of a narrower
+        search update matching entries; a wildcard listing, all at once or page by page
+        from start_from=0, replaces the index and makes it complete when the last
+        (short) page arrives. Out-of-order pages abandon the listing. fresh=False marks
+        a response replayed from the response cache: a complete index already holds it,
+        so it is only ingested while the index is incomplete. `fields` are the projected
+        fields the records were fetched with (None: whole records).
+        """
+        if not fresh and self.complete and self._staged is None and self.covers(fields):
+            return
+        if not is_wildcard(search):
+            with self._lock:
+                narrower = not self.covers(fields)
+                for r in records:
+                    if not narrower:
+                        self._add_locked(r)
+                        continue
+                    # Trimmed records only refresh the fields they carry; they never replace wider ones
+                    held = self._docs.get(record_id(r) if isinstance(r, dict) else "")
+                    if held is not None:
+                        self._add_locked(dict(held, **r))
+            return
+        with self._lock:
+            if page_size is None:
+                self._load_locked(records)
+                self.fields = fields
+                return
+            if start_from == 0:
+                self._staged = list(records)
+                self._staged_fields = fields
+            elif self._staged is not None and start_from == len(self._staged) and fields == self._staged_fields:
+                self._staged.extend(records)
+            else:
+                self._staged = None
+                return
+            if len(records) != page_size:
+                staged, self._staged = self._staged, None
+                self._load_locked(staged)
+                self.fields = fields
+
+    # ------------------ queries ------------------
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Records matching every token of `query` as a prefix, best first."""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+        with self._lock:
+            self.queries += 1
+            if self._vocab_dirty:
+                self._vocab = sorted(self._postings)
+                self._vocab_dirty = False
+            scores: Optional[Dict[str, float]] = None
+            for token in tokens:
+                token_scores = self._match_token(token)
+                if scores is None:
+                    scores = token_scores
+                else:
+                    scores = {d: s + token_scores[d] for d, s in scores.items() if d in token_scores}
+                if not scores:
+                    return []
+            ranked = sorted(scores, key=lambda d: (-scores[d], self._sort_name(d)))
+            if limit is not None:
+                ranked = ranked[:limit]
+            return [dict(self._docs[d]) for d in ranked]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "records": len(self._docs),
+                "terms": len(self._postings),
+                "complete": self.complete,
+                "queries": self.queries,
+            }
+
+    # ------------------ internals ------------------
+
+    def _match_token(self, token: str) -> Dict[str, float]:
+        out: Dict[str, float] = {}
+        lo = bisect_left(self._vocab, token)
+        hi = bisect_left(self._vocab, token + "\uffff", lo)
+        for term in self._vocab[lo:hi]:
+            boost = 2.0 if term == token else 1.0
+            for doc_id, weight in self._postings[term].items():
+                score = weight * boost
+                if score > out.get(doc_id, 0.0):
+                    out[doc_id] = score
+        return out
+
+    def _sort_name(self, doc_id: str) -> str:
+        doc = self._docs[doc_id]
+        return str(doc.get("display_name") or doc.get("displayName") or doc.get("Display Name") or doc_id).lower()
+
+    def _add_locked(self, record: Dict[str, Any]) -> bool:
+        doc_id = record_id(record) if isinstance(record, dict) else ""
+        if not doc_id:
+            return False
+        self._remove_locked(doc_id)
+        weights: Dict[str, float] = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(record.get(field)):
+                if weight > weights.get(term, 0.0):
+                    weights[term] = weight
+        for term, weight in weights.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._vocab_dirty = True
+            postings[doc_id] = weight
+        self._docs[doc_id] = dict(record)
+        self._doc_terms[doc_id] = set(weights)
+        return True
+
+    def _remove_locked(self, doc_id: str) -> bool:
+        terms = self._doc_terms.pop(doc_id, None)
+        if terms is None:
+            return False
+        del self._docs[doc_id]
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+                self._vocab_dirty = True
+        return True
+
+    def _load_locked(self, records: Iterable[Dict[str, Any]]) -> None:
+        self._docs.clear()
+        self._doc_terms.clear()
+        self._postings.clear()
+        for r in records:
+            self._add_locked(r)
+        self._vocab = sorted(self._postings)
+        self._vocab_dirty = False
+        self._completed_at = time.monotonic()
+
+
+_INDEXES: Dict[Tuple[Hashable, str], SearchIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_search_index(kind: str, namespace: Hashable = None) -> SearchIndex:
+    """The shared index for one kind of record ('collections', 'glossaries', ...) per namespace (config)."""
+    with _INDEXES_LOCK:
+        index = _INDEXES.get((namespace, kind))
+        if index is None:
+            index = _INDEXES[(namespace, kind)] = SearchIndex()
+        return index
+
+
+def clear_search_indexes() -> None:
+    with _INDEXES_LOCK:
+        _INDEXES.clear()
+
+
+def search_index_stats() -> List[Dict[str, Any]]:
+    with _INDEXES_LOCK:
+        indexes = dict(_INDEXES)
+    return [dict(index.stats(), kind=kind) for (_, kind), index in indexes.items()]
+
+
+__all__ = [
+    "FIELD_WEIGHTS",
+    "SearchIndex",
+    "clear_search_indexes",
+    "get_search_index",
+    "indexable_query",
+    "is_wildcard",
+    "record_id",
+    "search_index_stats",
+    "tokenize",
+]
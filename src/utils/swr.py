@@ -0,0 +1,178 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides stale-while-revalidate helpers for the my_egeria browser screens.
+
+
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+from .cache import TTLCache
+from .disk_cache import disk_cache_path, get_disk_cache, scope_of
+from .executor import run_blocking
+
+
+# Last rows rendered per (screen, config, query); painted immediately on the next visit
+_SNAPSHOTS = TTLCache(
+    maxsize=int(os.getenv("EGERIA_SNAPSHOT_MAX_ENTRIES", "64")),
+    ttl=float(os.getenv("EGERIA_SNAPSHOT_TTL_SECONDS", "86400")),
+)
+
+Row = Tuple[Any, ...]
+KeyedRow = Tuple[str, Row]
+
+# Disk cache scopes already loaded into _SNAPSHOTS this process
+_WARMED: Set[str] = set()
+_WARM_LOCK = threading.Lock()
+
+
+def snapshot_key(view: str, *parts: Hashable) -> Tuple[Hashable, ...]:
+    return (view,) + tuple(parts)
+
+
+def _split_key(key: Hashable) -> Optional[Tuple[str, Any, Tuple[Any, ...]]]:
+    # Snapshot keys are (view, config, *search parts); only those can go to disk
+    if isinstance(key, tuple) and len(key) >= 2 and isinstance(key[0], str) and hasattr(key[1], "view_server"):
+        return key[0], key[1], key[2:]
+    return None
+
+
+def last_rows(key: Hashable) -> Optional[List[Row]]:
+    """The rows in memory for `key`; never reads the disk cache, so it is safe on the event loop."""
+    return _SNAPSHOTS.get(key)
+
+
+async def load_snapshot(key: Hashable) -> Optional[List[Row]]:
+    """
+    last_rows(), falling back to the disk cache when this process hasn't loaded the
+    key's scope yet. The SQLite read runs on the shared executor, off the event loop.
+    """
+    rows = _SNAPSHOTS.get(key)
+    if rows is None:
+        parts = _split_key(key)
+        if parts is not None and disk_cache_path() is not None:
+            with _WARM_LOCK:
+                warmed = scope_of(parts[1]) in _WARMED
+            if not warmed and await run_blocking(warm_snapshots, parts[1]):
+                rows = _SNAPSHOTS.get(key)
+    return rows
+
+
+def remember_rows(key: Hashable, rows: Sequence[Row]) -> None:
+    rows = [tuple(r) for r in rows]
+    _SNAPSHOTS.set(key, rows)
+    parts = _split_key(key)
+    disk = get_disk_cache() if parts is not None else None
+    if disk is not None:
+        view, config, search = parts
+        disk.put(scope_of(config), view, search, rows)
+
+
+def warm_snapshots(config: Any) -> int:
+    """
+    Load the on-disk rows saved for `config` (platform, view server, user) into memory,
+    once per process, so the first browser screen paints before its fetch returns.
+    Rows already in memory are newer and kept. Returns how many snapshots were loaded.
+    """
+    disk = get_disk_cache()
+    if disk is None:
+        return 0
+    scope = scope_of(config)
+    with _WARM_LOCK:
+        if scope in _WARMED:
+            return 0
+        _WARMED.add(scope)
+    loaded = 0
+    for view, search, rows in disk.load(scope):
+        key = snapshot_key(view, config, *search)
+        if _SNAPSHOTS.get(key) is None:
+            _SNAPSHOTS.set(key, rows)
+            loaded += 1
+    return loaded
+
+
+def forget_rows(view: Optional[str] = None) -> None:
+    """Drop snapshots for one view (first key element), or all of them (which also allows re-warming from disk)."""
+    if view is None:
+        _SNAPSHOTS.clear()
+        with _WARM_LOCK:
+            _WARMED.clear()
+    else:
+        _SNAPSHOTS.invalidate(lambda k: k[0] == view)
+
+
+def keyed_rows(
+    rows: Sequence[Row], key_index: int = 0, start: int = 0, seen: Optional[Dict[str, int]] = None
+) -> List[KeyedRow]:
+    """
+    Give each row a stable, unique key: its GUID column when present, with a
+    suffix for duplicates, or its position for placeholder rows without a GUID.
+    Pages of one listing are keyed as a whole by passing each page's `start`
+    position and the same `seen` dict.
+    """
+    seen = {} if seen is None else seen
+    out: List[KeyedRow] = []
+    for i, row in enumerate(rows, start):
+        base = str(row[key_index]) if len(row) > key_index and row[key_index] else f"__row{i}"
+        n = seen.get(base, 0)
+        seen[base] = n + 1
+        out.append((base if n == 0 else f"{base}#{n}", tuple(row)))
+    return out
+
+
+@dataclass
+class RowPatch:
+    rebuild: bool = False
+    removed: List[str] = field(default_factory=list)
+    updated: List[Tuple[str, int, Any]] = field(default_factory=list)  # (row key, column index, value)
+    added: List[KeyedRow] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.rebuild or self.removed or self.updated or self.added)
+
+
+def plan_row_patch(current: Sequence[KeyedRow], new: Sequence[KeyedRow]) -> RowPatch:
+    """
+    Work out the smallest set of table edits turning `current` into `new`.
+    Rows can be removed, updated in place or appended; if the surviving rows
+    changed order (which a table cannot express cheaply) a full rebuild is requested.
+    """
+    cur = dict(current)
+    new_map = dict(new)
+    kept = [k for k, _ in current if k in new_map]
+    if [k for k, _ in new][: len(kept)] != kept:
+        return RowPatch(rebuild=True)
+
+    patch = RowPatch()
+    patch.removed = [k for k, _ in current if k not in new_map]
+    for key, row in new:
+        old = cur.get(key)
+        if old is None:
+            patch.added.append((key, row))
+        elif len(old) != len(row):
+            return RowPatch(rebuild=True)
+        else:
+            patch.updated.extend((key, i, v) for i, (a, v) in enumerate(zip(old, row)) if a != v)
+    return patch
+
+
+__all__ = [
+    "RowPatch",
+    "forget_rows",
+    "keyed_rows",
+    "last_rows",
+    "load_snapshot",
+    "plan_row_patch",
+    "remember_rows",
+    "snapshot_key",
+    "warm_snapshots",
+]
@@ -0,0 +1,168 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides a common widget for my_egeria.
+
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+from textual.widgets import Tree
+from textual.widgets.tree import TreeNode
+
+from utils.cache import MISSING, TTLCache
+from utils.executor import run_blocking
+
+
+@dataclass(frozen=True)
+class LazyNode:
+    """One child as returned by a LazyTreeSource fetch."""
+    node_id: str
+    label: str
+    expandable: bool = True
+
+
+FetchChildren = Callable[[str], Union[Sequence[LazyNode], Awaitable[Sequence[LazyNode]]]]
+
+
+def subtree_cache() -> TTLCache:
+    """A cache for loaded subtrees, sized and aged by EGERIA_TREE_MAX_NODES / EGERIA_TREE_TTL_SECONDS."""
+    return TTLCache(
+        maxsize=int(os.getenv("EGERIA_TREE_MAX_NODES", "512")),
+        ttl=float(os.getenv("EGERIA_TREE_TTL_SECONDS", "300")),
+    )
+
+
+class LazyTreeSource:
+    """
+    Loads the children of a node only when asked. Concurrent requests for the same
+    node share one fetch, and loaded child lists are kept in a TTL cache. A sync
+    `fetch_children` runs on the shared executor (capped per `platform`); a
+    coroutine function is awaited.
+    Pass a shared `cache` (plus a `namespace`) to keep subtrees across screens.
+    """
+
+    def __init__(
+        self,
+        fetch_children: FetchChildren,
+        cache: Optional[TTLCache] = None,
+        namespace: Hashable = None,
+        platform: Optional[str] = None,
+    ):
+        self._fetch = fetch_children
+        self._platform = platform
+        self._cache = cache if cache is not None else subtree_cache()
+        self._namespace = namespace
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.fetches = 0
+
+    def _key(self, node_id: str) -> Tuple[Hashable, str]:
+        return (self._namespace, node_id)
+
+    async def children(self, node_id: str, refresh: bool = False) -> List[LazyNode]:
+        if not refresh:
+            cached = self._cache.lookup(self._key(node_id))
+            if cached is not MISSING:
+                return list(cached)
+        fut = self._inflight.get(node_id)
+        if fut is None:
+            fut = asyncio.ensure_future(self._load(node_id))
+            self._inflight[node_id] = fut
+            fut.add_done_callback(lambda f, k=node_id: self._inflight.pop(k, None) if self._inflight.get(k) is f else None)
+        # Shielded: one caller giving up must not cancel the fetch others are waiting on
+        return list(await asyncio.shield(fut))
+
+    async def _load(self, node_id: str) -> Tuple[LazyNode, ...]:
+        self.fetches += 1
+        if asyncio.iscoroutinefunction(self._fetch):
+            res = await self._fetch(node_id)
+        else:
+            res = await run_blocking(self._fetch, node_id, platform=self._platform)
+        nodes = tuple(res or ())
+        self._cache.set(self._key(node_id), nodes)
+        return nodes
+
+    def invalidate(self, node_id: Optional[str] = None) -> None:
+        """Forget one node's children, or every node of this source."""
+        if node_id is None:
+            self._cache.invalidate(lambda k: k[0] == self._namespace)
+        else:
+            self._cache.invalidate(lambda k: k == self._key(node_id))
+
+
+class LazyTree(Tree):
+    """
+    Tree whose nodes are filled from a LazyTreeSource the first time they are
+    expanded. Node data is the node id handed to the source.
+    """
+
+    LOADING_LABEL = "Loading…"
+
+    def __init__(
+        self,
+        label: str,
+        source: LazyTreeSource,
+        root_id: str,
+        *,
+        name: Optional[str] = None,
+        id: Optional[str] = None,
+        classes: Optional[str] = None,
+    ):
+        super().__init__(label, data=root_id, name=name, id=id, classes=classes)
+        self.source = source
+        # Children currently shown per tree node, to skip rebuilding unchanged subtrees
+        self._shown: Dict[int, Tuple[LazyNode, ...]] = {}
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        node = event.node
+        if not node.data:
+            return
+        if node.id not in self._shown and not node.children:
+            node.add_leaf(self.LOADING_LABEL)
+        self.run_worker(self.load_children(node), group="lazy-tree")
+
+    async def load_children(self, node: TreeNode, refresh: bool = False) -> None:
+        try:
+            children = tuple(await self.source.children(str(node.data), refresh=refresh))
+        except Exception as e:
+            node.remove_children()
+            node.add_leaf(f"Error: {e}")
+            self._shown.pop(node.id, None)
+            return
+        if self._shown.get(node.id) == children:
+            return
+        for old in node.children:
+            self._shown.pop(old.id, None)
+        node.remove_children()
+        for child in children:
+            if child.expandable:
+                node.add(child.label, data=child.node_id)
+            else:
+                node.add_leaf(child.label, data=child.node_id)
+        if not children:
+            node.add_leaf("(empty)")
+        self._shown[node.id] = children
+
+    async def reload(self) -> None:
+        """Drop cached subtrees and reload the root."""
+        self.source.invalidate()
+        self._shown.clear()
+        self.root.remove_children()
+        await self.load_children(self.root, refresh=True)
+        self.root.expand()
+
+
+__all__ = [
+    "LazyNode",
+    "LazyTree",
+    "LazyTreeSource",
+    "subtree_cache",
+]
@@ -0,0 +1,339 @@
+""" python
+
+   PDX-License-Identifier: Apache-2.0
+   Copyright Contributors to the ODPi Egeria project.
+
+   This file provides a common widget for my_egeria.
+
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+from itertools import count, islice
+from typing import Any, AsyncIterable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from rich.cells import cell_len, set_cell_size
+from rich.segment import Segment
+from rich.style import Style
+from textual import events
+from textual.binding import Binding
+from textual.geometry import Size
+from textual.message import Message
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+
+Cells = Tuple[str, ...]
+
+
+class VirtualTable(ScrollView, can_focus=True):
+    """
+    Read-only table with a row cursor, built for large result sets.
+
+    Rows live in a compact backing store (one tuple of strings per row) and only
+    the lines inside the viewport are rendered. Rows can be appended in batches
+    from a paged or streaming source without blocking the event loop. The API
+    mirrors the subset of DataTable the browser screens use (add_columns,
+    add_row, get_row, move_cursor, clear, RowHighlighted/RowSelected ...).
+    """
+
+    DEFAULT_CSS = """
+    VirtualTable {
+        background: $surface;
+        color: $text;
+        height: auto;
+        max-height: 100%;
+    }
+    VirtualTable > .virtual-table--header {
+        background: $panel;
+        color: $text;
+        text-style: bold;
+    }
+    VirtualTable > .virtual-table--cursor {
+        background: $accent;
+        color: $text;
+    }
+    """
+
+    COMPONENT_CLASSES = {"virtual-table--header", "virtual-table--cursor"}
+
+    BINDINGS = [
+        Binding("up", "cursor_up", "Up", show=False),
+        Binding("down", "cursor_down", "Down", show=False),
+        Binding("pageup", "cursor_page_up", "Page Up", show=False),
+        Binding("pagedown", "cursor_page_down", "Page Down", show=False),
+        Binding("home", "cursor_first", "First", show=False),
+        Binding("end", "cursor_last", "Last", show=False),
+        Binding("enter", "select_cursor", "Select", show=False),
+    ]
+
+    MAX_COLUMN_WIDTH = 48
+    BATCH_SIZE = 500
+
+    class RowHighlighted(Message):
+        def __init__(self, table: "VirtualTable", cursor_row: int, row_key: str) -> None:
+            super().__init__()
+            self.table = table
+            self.cursor_row = cursor_row
+            self.row_key = row_key
+
+        @property
+        def control(self) -> "VirtualTable":
+            return self.table
+
+    class RowSelected(Message):
+        def __init__(self, table: "VirtualTable", cursor_row: int, row_key: str) -> None:
+            super().__init__()
+            self.table = table
+            self.cursor_row = cursor_row
+            self.row_key = row_key
+
+        @property
+        def control(self) -> "VirtualTable":
+            return self.table
+
+    def __init__(self, *, name: Optional[str] = None, id: Optional[str] = None, classes: Optional[str] = None):
+        super().__init__(name=name, id=id, classes=classes)
+        self._columns: List[str] = []
+        self._widths: List[int] = []
+        self._rows: List[Cells] = []
+        self._keys: List[str] = []
+        self._index: Optional[Dict[str, int]] = {}
+        self._auto_key = count()
+        self.cursor_row = 0
+        self.cursor_type = "row"  # accepted for DataTable compatibility; only row cursors exist
+
+    # ------------------ columns ------------------
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def add_column(self, label: str) -> str:
+        self._columns.append(str(label))
+        self._widths.append(min(cell_len(str(label)), self.MAX_COLUMN_WIDTH))
+        self._rows = [row + ("",) for row in self._rows]
+        self._refresh_size()
+        return str(label)
+
+    def add_columns(self, *labels: str) -> List[str]:
+        return [self.add_column(label) for label in labels]
+
+    # ------------------ rows ------------------
+
+    @property
+    def row_count(self) -> int:
+        return len(self._rows)
+
+    def add_row(self, *cells: Any, key: Optional[str] = None) -> str:
+        keys = self.add_rows([cells], keys=None if key is None else [key])
+        return keys[0]
+
+    def add_rows(self, rows: Iterable[Sequence[Any]], keys: Optional[Sequence[str]] = None) -> List[str]:
+        """Append many rows with a single size recalculation and repaint."""
+        index = self._row_index()
+        added: List[str] = []
+        for i, cells in enumerate(rows):
+            key = str(keys[i]) if keys is not None else f"__vt{next(self._auto_key)}"
+            if key in index:
+                raise ValueError(f"Duplicate row key {key!r}")
+            row = self.normalize_row(cells)
+            index[key] = len(self._rows)
+            self._rows.append(row)
+            self._keys.append(key)
+            self._grow_widths(row)
+            added.append(key)
+        if added:
+            self._refresh_size()
+        return added
+
+    async def stream_rows(
+        self,
+        source: Union[Iterable[Sequence[Any]], AsyncIterable[Sequence[Sequence[Any]]]],
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """
+        Append rows from `source` in batches, yielding to the event loop between
+        batches so input stays responsive. `source` is either an iterable of rows
+        or an async iterable of pages (lists of rows). Returns the number of rows added.
+        """
+        batch_size = batch_size or self.BATCH_SIZE
+        added = 0
+        if hasattr(source, "__aiter__"):
+            async for page in source:  # type: ignore[union-attr]
+                added += await self._append_in_batches(page, batch_size)
+            return added
+        return await self._append_in_batches(source, batch_size)
+
+    async def _append_in_batches(self, rows: Iterable[Sequence[Any]], batch_size: int) -> int:
+        added = 0
+        it = iter(rows)
+        while True:
+            batch = list(islice(it, batch_size))
+            if not batch:
+                return added
+            self.add_rows(batch)
+            added += len(batch)
+            await asyncio.sleep(0)
+
+    def remove_row(self, row_key: str) -> None:
+        self.remove_rows([row_key])
+
+    def remove_rows(self, row_keys: Iterable[str]) -> None:
+        """Remove many rows in one pass, with a single index rebuild and repaint."""
+        doomed = {str(k) for k in row_keys}
+        missing = doomed.difference(self._row_index())
+        if missing:
+            raise KeyError(next(iter(missing)))
+        if not doomed:
+            return
+        kept = [(k, row) for k, row in zip(self._keys, self._rows) if k not in doomed]
+        self._keys = [k for k, _ in kept]
+        self._rows = [row for _, row in kept]
+        self._index = {k: i for i, k in enumerate(self._keys)}
+        if self.cursor_row >= len(self._rows):
+            self.cursor_row = max(0, len(self._rows) - 1)
+        self._refresh_size()
+
+    def update_cell(self, row_key: str, column: Union[int, str], value: Any) -> None:
+        idx = self._row_index()[row_key]
+        col = column if isinstance(column, int) else self._columns.index(str(column))
+        row = list(self._rows[idx])
+        row[col] = self.normalize_row((value,))[0]
+        self._rows[idx] = tuple(row)
+        self._grow_widths(self._rows[idx])
+        self.refresh()
+
+    def get_row(self, row_key: str) -> List[str]:
+        return list(self._rows[self._row_index()[row_key]])
+
+    def get_row_at(self, row_index: int) -> List[str]:
+        return list(self._rows[row_index])
+
+    def keyed_rows(self) -> List[Tuple[str, Cells]]:
+        return list(zip(self._keys, self._rows))
+
+    def clear(self, columns: bool = False) -> "VirtualTable":
+        self._rows = []
+        self._keys = []
+        self._index = {}
+        self.cursor_row = 0
+        if columns:
+            self._columns = []
+            self._widths = []
+        else:
+            self._widths = [min(cell_len(c), self.MAX_COLUMN_WIDTH) for c in self._columns]
+        if self.is_mounted:
+            self.scroll_to(0, 0, animate=False)
+        self._refresh_size()
+        return self
+
+    # ------------------ cursor ------------------
+
+    def move_cursor(self, *, row: Optional[int] = None, column: Optional[int] = None, animate: bool = False) -> None:
+        if row is None or not self._rows:
+            return
+        row = max(0, min(row, len(self._rows) - 1))
+        changed = row != self.cursor_row
+        self.cursor_row = row
+        self._scroll_to_cursor()
+        self.refresh()
+        if changed:
+            self.post_message(self.RowHighlighted(self, row, self._keys[row]))
+
+    def action_cursor_up(self) -> None:
+        self.move_cursor(row=self.cursor_row - 1)
+
+    def action_cursor_down(self) -> None:
+        self.move_cursor(row=self.cursor_row + 1)
+
+    def action_cursor_page_up(self) -> None:
+        self.move_cursor(row=self.cursor_row - self._page_height())
+
+    def action_cursor_page_down(self) -> None:
+        self.move_cursor(row=self.cursor_row + self._page_height())
+
+    def action_cursor_first(self) -> None:
+        self.move_cursor(row=0)
+
+    def action_cursor_last(self) -> None:
+        self.move_cursor(row=len(self._rows) - 1)
+
+    def action_select_cursor(self) -> None:
+        if self._rows:
+            self.post_message(self.RowSelected(self, self.cursor_row, self._keys[self.cursor_row]))
+
+    def on_click(self, event: events.Click) -> None:
+        row = self.scroll_offset.y + event.y - 1  # line 0 is the header
+        if 0 <= row < len(self._rows):
+            self.move_cursor(row=row)
+            self.action_select_cursor()
+
+    # ------------------ rendering ------------------
+
+    def render_line(self, y: int) -> Strip:
+        width = self.size.width
+        scroll_x, scroll_y = self.scroll_offset
+        base = self.rich_style
+        if y == 0:
+            cells: Sequence[str] = self._columns
+            style = base + self.get_component_rich_style("virtual-table--header")
+        else:
+            idx = scroll_y + y - 1
+            if idx >= len(self._rows):
+                return Strip.blank(width, base)
+            cells = self._rows[idx]
+            style = base + self.get_component_rich_style("virtual-table--cursor") if idx == self.cursor_row else base
+        return self._render_cells(cells, style, scroll_x, width)
+
+    def _render_cells(self, cells: Sequence[str], style: Style, scroll_x: int, width: int) -> Strip:
+        segments = []
+        for value, w in zip(cells, self._widths):
+            text = value if cell_len(value) <= w else set_cell_size(value, w - 1) + "…"
+            segments.append(Segment(" " + set_cell_size(text, w) + " ", style))
+        line_width = max(self._total_width(), scroll_x + width)
+        pad = line_width - self._total_width()
+        if pad > 0:
+            segments.append(Segment(" " * pad, style))
+        return Strip(segments, line_width).crop(scroll_x, scroll_x + width)
+
+    # ------------------ internals ------------------
+
+    def normalize_row(self, cells: Sequence[Any]) -> Cells:
+        """Cells as stored: strings, newlines flattened, padded to the column count."""
+        values = ["" if v is None else str(v).replace("\n", " ") for v in cells]
+        missing = len(self._columns) - len(values)
+        if missing > 0:
+            values.extend([""] * missing)
+        return tuple(values)
+
+    def _grow_widths(self, row: Cells) -> None:
+        for i, value in enumerate(row[: len(self._widths)]):
+            w = cell_len(value)
+            if w > self._widths[i]:
+                self._widths[i] = min(w, self.MAX_COLUMN_WIDTH)
+
+    def _total_width(self) -> int:
+        return sum(w + 2 for w in self._widths)
+
+    def _row_index(self) -> Dict[str, int]:
+        if self._index is None:
+            self._index = {k: i for i, k in enumerate(self._keys)}
+        return self._index
+
+    def _page_height(self) -> int:
+        return max(1, self.size.height - 1)
+
+    def _scroll_to_cursor(self) -> None:
+        top = self.scroll_offset.y
+        visible = self._page_height()
+        if self.cursor_row < top:
+            self.scroll_to(y=self.cursor_row, animate=False)
+        elif self.cursor_row >= top + visible:
+            self.scroll_to(y=self.cursor_row - visible + 1, animate=False)
+
+    def _refresh_size(self) -> None:
+        self.virtual_size = Size(self._total_width(), len(self._rows) + 1)
+        self.refresh()